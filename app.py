@@ -3,7 +3,8 @@ import pandas as pd
 from datetime import datetime, timezone, timedelta
 import io
 import base64
-from news_collector import NewsCollector
+from news_collector import NewsCollector, unit_status, unit_status_label
+import news_parser
 from naver_search import NaverNewsSearcher
 import google.generativeai as genai
 from typing import List, Dict
@@ -23,11 +24,56 @@ from stock_news import display_stock_news_results
 from download_utils import DownloadManager
 from util.ai.ai_utils import AIManager
 from util.data_collector import DataCollector
+from util.article_store import ArticleStore
+from util.paper_health import CLOSED, HALF_OPEN, OPEN, PaperHealth
+from util.metrics import start_metrics_server
+from scheduler import PaperScheduler, load_schedule_settings
 
 # 매니저 인스턴스 생성
 ai_manager = AIManager()
 download_manager = DownloadManager()
 
+# 수집 기사 저장소
+try:
+    article_store = ArticleStore(st.secrets["app_settings"].get("article_db_path", ".cache/articles.db"))
+except:
+    article_store = ArticleStore()
+
+# 신문사별 수집 상태 (사이드바 표시용 - 기록은 NewsCollector가 수집하면서 남김)
+try:
+    paper_health_settings = (
+        st.secrets["app_settings"].get("paper_health_path", ".cache/paper_health.db"),
+        st.secrets["app_settings"].get("breaker_failure_threshold", 3),
+        st.secrets["app_settings"].get("breaker_cooldown", 1800)
+    )
+except:
+    paper_health_settings = (".cache/paper_health.db", 3, 1800)
+
+# 수집/검색 지표 Prometheus 엔드포인트 (metrics_port가 0이면 끔)
+try:
+    metrics_port = st.secrets["app_settings"].get("metrics_port", 0)
+except:
+    metrics_port = 0
+
+@st.cache_resource
+def start_metrics_endpoint(port):
+    return start_metrics_server(port)
+
+if metrics_port:
+    start_metrics_endpoint(metrics_port)
+
+# 예약 수집 (scheduler_enabled가 true면 앱 프로세스에서 백그라운드로 오늘자 신문을 미리 수집)
+try:
+    scheduler_enabled = st.secrets["app_settings"].get("scheduler_enabled", False)
+except:
+    scheduler_enabled = False
+
+@st.cache_resource
+def start_paper_scheduler():
+    return PaperScheduler(**load_schedule_settings()).start()
+
+paper_scheduler = start_paper_scheduler() if scheduler_enabled else None
+
 # 페이지 설정
 st.set_page_config(
     page_title="경제적 자유 프로젝트",
@@ -37,8 +83,8 @@ st.set_page_config(
 )
 
 # 세션 상태 초기화
-if 'newspaper_articles' not in st.session_state:
-    st.session_state['newspaper_articles'] = None
+if 'newspaper_papers' not in st.session_state:
+    st.session_state['newspaper_papers'] = None
 if 'paper_date' not in st.session_state:
     st.session_state['paper_date'] = None
 if 'search_articles' not in st.session_state:
@@ -184,17 +230,21 @@ def check_secrets():
     return api_available, missing_secrets
 
 def remove_duplicates(articles):
-    """중복 기사 제거"""
-    seen_urls = set()
+    """중복 기사 제거 - (oid, aid)가 같으면 같은 기사"""
+    seen_keys = set()
     unique_articles = []
     
     for article in articles:
-        if article['url'] not in seen_urls:
-            seen_urls.add(article['url'])
+        if article.key not in seen_keys:
+            seen_keys.add(article.key)
             unique_articles.append(article)
     
     return unique_articles
 
+def load_stored_articles(date_str, papers):
+    """저장소의 신문 게재 기사를 Article로 조회"""
+    return [news_parser.Article.from_dict(row) for row in article_store.load_newspaper_articles(date_str, papers)]
+
 def newspaper_collection_tab():
     st.markdown("### 신문 게재 기사 수집")
     st.markdown("종이 신문에 실제로 실린 기사만 수집하여 제공합니다.")
@@ -210,6 +260,8 @@ def newspaper_collection_tab():
         help="수집하고 싶은 신문 발행일을 선택하세요",
         key="date_picker"
     )
+    if paper_scheduler is not None:
+        st.caption(paper_scheduler.describe())
     
     st.markdown("---")
     
@@ -278,6 +330,12 @@ def newspaper_collection_tab():
                 if checked:
                     evening_selected.append((paper, oid))
     
+    fetch_bodies = st.checkbox(
+        "📄 기사 본문도 수집",
+        key="chk_fetch_bodies",
+        help="AI 보고서와 기사 검색에 본문을 사용합니다. 한 번 받은 본문은 저장해 두고 다시 받지 않습니다."
+    )
+    
     st.markdown("---")
     
     # 크롤링 시작 버튼
@@ -295,22 +353,74 @@ def newspaper_collection_tab():
             status_text = st.empty()
             
             collector = NewsCollector()
+            date_str = selected_date.strftime("%Y%m%d")
             
             try:
-                status_text.text(f"🚀 {len(all_selected)}개 신문사 병렬 수집 시작...")
-                progress_bar.progress(20)
+                # 이미 저장된 (신문사, 날짜)는 건너뛰고 나머지만 수집
+                collected_oids = article_store.collected_oids(date_str)
+                missing_papers = [(paper, oid) for paper, oid in all_selected if oid not in collected_oids]
                 
-                # 병렬 처리로 빠르게 수집 (테이블 형태로 상태 표시)
-                all_articles = collector.crawl_multiple_papers(all_selected, selected_date.strftime("%Y%m%d"))
-                
-                progress_bar.progress(80)
-                
-                # 중복 제거
-                unique_articles = remove_duplicates(all_articles)
+                if missing_papers:
+                    status_text.text(f"🚀 {len(missing_papers)}개 신문사 병렬 수집 시작... (저장된 신문사 {len(all_selected) - len(missing_papers)}개)")
+                    progress_bar.progress(5)
+                    
+                    st.markdown("**📊 수집 현황**")
+                    # 신문사가 끝날 때마다 행 목록으로 표만 다시 그림
+                    status_rows = []
+                    status_placeholder = st.empty()
+                    status_placeholder.dataframe(
+                        pd.DataFrame(columns=["신문사", "상태", "수집 기사"]),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                    # 수집 중 미리보기 - 끝나면 지우고 저장소 기준 결과로 대체
+                    live_placeholder = st.empty()
+                    live_results = live_placeholder.container()
+                    
+                    # 신문사가 끝나는 대로 저장하고 화면에 덧붙임
+                    papers_done = 0
+                    for event in collector.iter_papers(missing_papers, date_str):
+                        if event.kind == 'page':
+                            status_text.text(f"📥 {event.paper_name} {event.page}페이지: {len(event.articles)}개 기사")
+                            continue
+                        
+                        papers_done += 1
+                        progress_bar.progress(5 + int(90 * papers_done / len(missing_papers)))
+                        
+                        # 기사가 수집된 신문사만 저장 - 실패했거나 아직 발행 전인 신문사는 다음에 다시 수집
+                        # 중간에 끊긴 신문사는 받은 기사만 저장하고 다음에 나머지를 다시 수집
+                        paper_articles = remove_duplicates(event.articles)
+                        if paper_articles:
+                            article_store.save_newspaper_articles(
+                                date_str, event.paper_name, event.oid, paper_articles,
+                                complete=unit_status(event.error) == 'complete'
+                            )
+                        
+                        status_rows.append({
+                            "신문사": event.paper_name,
+                            "상태": unit_status_label(event.error),
+                            "수집 기사": f"{len(paper_articles)}개"
+                        })
+                        status_placeholder.dataframe(pd.DataFrame(status_rows), use_container_width=True, hide_index=True)
+                        if paper_articles:
+                            with live_results.expander(f"📌 [{event.paper_name}] ({len(paper_articles)}개)"):
+                                for article in paper_articles:
+                                    page_info = f"[{article['page']}] " if article['page'] else ""
+                                    st.markdown(f"🔹 {page_info}[{article['title']}]({article['url']})")
+                    
+                    live_placeholder.empty()
+                    if collector.metrics is not None:
+                        display_crawl_metrics(collector.metrics.summary())
                 
-                # 세션 상태에 저장
-                st.session_state['newspaper_articles'] = unique_articles
+                # 저장소 기준으로 결과 표시
+                st.session_state['newspaper_papers'] = [paper for paper, _ in all_selected]
                 st.session_state['paper_date'] = selected_date
+                st.session_state['filtered_articles'] = None
+                unique_articles = load_stored_articles(date_str, st.session_state['newspaper_papers'])
+                
+                if fetch_bodies and unique_articles:
+                    status_text.text(f"📄 기사 본문 수집 중... ({len(unique_articles)}개)")
+                    collector.fetch_article_bodies(unique_articles, article_store)
                 
                 status_text.text(f"✅ 수집 완료! 총 {len(unique_articles)}개 기사")
                 progress_bar.progress(100)
@@ -324,22 +434,148 @@ def newspaper_collection_tab():
                 st.error(f"❌ 크롤링 중 오류: {str(e)}")
             finally:
                 collector.close()
+        
+        # 오늘자는 지난 수집 이후 새로 생긴 기사만 확인 (바뀐 페이지까지만 다시 받음)
+        if selected_date == current_date and st.button(
+            "🔄 새 기사 확인", use_container_width=True, key="btn_refresh_today",
+            help="수집해 둔 오늘자 신문의 첫 페이지부터 바뀐 곳까지만 다시 확인합니다."
+        ):
+            all_selected = economic_selected + general_selected + evening_selected
+            
+            if not all_selected:
+                st.error("❌ 최소 하나의 신문사를 선택해주세요.")
+                return
+            
+            refresh_newspaper_articles(all_selected, selected_date)
     
     # 결과 표시
-    if 'newspaper_articles' in st.session_state:
+    if 'newspaper_papers' in st.session_state:
         display_newspaper_results()
 
+def refresh_newspaper_articles(paper_list, selected_date):
+    """오늘자 신문 새로 고침 - 지난 수집 이후 새로 생기거나 바뀐 기사만 저장하고 표시"""
+    date_str = selected_date.strftime("%Y%m%d")
+    paper_names = [paper for paper, _ in paper_list]
+    stored_articles = {article.key: article for article in load_stored_articles(date_str, paper_names)}
+    
+    collector = NewsCollector()
+    new_articles = []
+    changed_articles = []
+    try:
+        with st.spinner("🔄 새 기사 확인 중..."):
+            for event in collector.iter_papers(paper_list, date_str, refresh=True):
+                if event.kind != 'paper':
+                    continue
+                paper_new = []
+                paper_changed = []
+                for article in remove_duplicates(event.articles):
+                    stored = stored_articles.get(article.key)
+                    if stored is None:
+                        paper_new.append(article)
+                    elif (stored['title'], stored['page'] or '') != (article['title'], article['page'] or ''):
+                        paper_changed.append(article)
+                if paper_new or paper_changed:
+                    # 새 기사는 덧붙이고 바뀐 기사는 제목/면 갱신 - 수집 완료 기록(기사 수)은 전체 수집 때의 것을 유지
+                    article_store.save_newspaper_articles(
+                        date_str, event.paper_name, event.oid, paper_new + paper_changed, complete=False
+                    )
+                    new_articles.extend(paper_new)
+                    changed_articles.extend(paper_changed)
+    except Exception as e:
+        st.error(f"❌ 새 기사 확인 중 오류: {str(e)}")
+        return
+    finally:
+        collector.close()
+    
+    st.session_state['newspaper_papers'] = paper_names
+    st.session_state['paper_date'] = selected_date
+    st.session_state['filtered_articles'] = None
+    
+    if not new_articles and not changed_articles:
+        st.info("새 기사나 바뀐 기사가 없습니다.")
+        return
+    
+    for label, articles in (("🆕 새 기사", new_articles), ("✏️ 바뀐 기사", changed_articles)):
+        if not articles:
+            continue
+        st.success(f"{label} {len(articles)}개를 찾았습니다.")
+        for article in articles:
+            page_info = f"[{article['page']}] " if article['page'] else ""
+            st.markdown(f"🔹 [{article['newspaper']}] {page_info}[{article['title']}]({article['url']})")
+
+def display_crawl_metrics(summary):
+    """수집 지표 요약 - 시간이 네트워크, 파싱, 대기 중 어디에 쓰였는지 표시"""
+    requests_count = max(summary['requests'], 1)
+    pages_parsed = max(summary['pages_parsed'], 1)
+    
+    st.markdown("**📈 수집 지표**")
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("소요 시간", f"{summary['elapsed_seconds']:.1f}초")
+    col2.metric("요청", f"{summary['requests']}회", f"{summary['bytes'] / 1024 / 1024:.1f}MB", delta_color="off")
+    col3.metric("네트워크", f"{summary['total_seconds']:.1f}초",
+                f"TTFB 평균 {summary['ttfb_seconds'] / requests_count * 1000:.0f}ms", delta_color="off")
+    col4.metric("파싱", f"{summary['parse_seconds']:.1f}초",
+                f"페이지당 {summary['parse_seconds'] / pages_parsed * 1000:.0f}ms", delta_color="off")
+    col5.metric("대기", f"{summary['sleep_seconds']:.1f}초", "속도 제한·재시도", delta_color="off")
+    st.caption(
+        f"기사 {summary['articles']}개 / 페이지 {summary['pages_parsed']}개 "
+        f"(페이지당 {summary['articles'] / pages_parsed:.0f}개), 요청 실패 {summary['errors']}회. "
+        "네트워크·파싱·대기 시간은 동시에 진행된 작업들의 합계입니다."
+    )
+
+def display_paper_health():
+    """사이드바 - 신문사별 수집 상태와 차단기"""
+    if not paper_health_settings[0]:
+        return
+    rows = PaperHealth(*paper_health_settings).summaries()
+    if not rows:
+        return
+    
+    st.markdown("### 📡 신문사 수집 상태")
+    blocked = [row['name'] or row['oid'] for row in rows if row['state'] != CLOSED]
+    if blocked:
+        st.warning(f"⛔ 수집 차단 중: {', '.join(blocked)}")
+    low_yield = [row['name'] or row['oid'] for row in rows if row['low_yield']]
+    if low_yield:
+        st.info(f"⚠️ 평소보다 기사가 적음: {', '.join(low_yield)}")
+    
+    state_labels = {CLOSED: "🟢 정상", HALF_OPEN: "🟡 재시험 대기", OPEN: "🔴 차단"}
+    with st.expander("상세 보기"):
+        st.dataframe(pd.DataFrame([{
+            "신문사": row['name'] or row['oid'],
+            "상태": state_labels[row['state']],
+            "성공률": f"{row['success_rate']:.0%}",
+            "응답 시간": f"{row['median_latency']:.2f}초" if row['median_latency'] is not None else "-",
+            "최근 기사 수": "-" if row['last_count'] is None else (
+                f"{row['last_count']}개" if row['norm_count'] is None
+                else f"{row['last_count']}개 (평소 {row['norm_count']:.0f}개)"
+            )
+        } for row in rows]), use_container_width=True, hide_index=True)
+
+def attach_article_bodies(articles):
+    """저장소에 본문이 있는 기사에 'body'를 붙임"""
+    keys = {news_parser.key_of(article) for article in articles} - {None}
+    bodies = article_store.load_article_bodies(keys)
+    for article in articles:
+        body = bodies.get(news_parser.key_of(article))
+        if body:
+            article['body'] = body
+
 def display_newspaper_results():
-    articles = st.session_state['newspaper_articles']
+    papers = st.session_state['newspaper_papers']
     paper_date = st.session_state['paper_date']
     
     st.markdown("---")
     
-    # articles가 None이면 함수 종료
-    if articles is None:
+    # 수집한 적이 없으면 함수 종료
+    if papers is None or paper_date is None:
         st.info("수집된 기사가 없습니다. 신문사를 선택하고 크롤링을 시작해주세요.")
         return
     
+    # 저장소에서 기사 조회 (받아 둔 본문이 있으면 함께)
+    articles = load_stored_articles(paper_date.strftime("%Y%m%d"), papers)
+    attach_article_bodies(articles)
+    
     # 결과 표시 (검색 기능을 아래로 이동)
     if paper_date is not None:
         st.markdown(f"### 📰 {paper_date.strftime('%Y년 %m월 %d일')}의 신문 게재 기사 모음")
@@ -356,7 +592,7 @@ def display_newspaper_results():
     col1, col2, col3 = st.columns([3, 1, 1])
 
     with col1:
-        search_term = st.text_input("🔍 기사 검색", placeholder="제목으로 검색...", key="input_search_articles_newspaper")
+        search_term = st.text_input("🔍 기사 검색", placeholder="제목·본문으로 검색...", key="input_search_articles_newspaper")
 
     with col2:
         # 라벨을 추가하여 높이 맞춤
@@ -366,6 +602,7 @@ def display_newspaper_results():
                 filtered_articles = [
                     article for article in articles 
                     if search_term.lower() in article['title'].lower()
+                    or search_term.lower() in article.get('body', '').lower()
                 ]
                 st.session_state['filtered_articles'] = filtered_articles
             else:
@@ -500,10 +737,13 @@ def naver_search_tab():
                 
                 progress_bar.progress(100)
                 status_text.text(f"✅ 검색 완료! 총 {len(articles)}개 기사")
+                display_search_cache_stats(searcher)
+                display_api_quota(searcher)
                 
-                # 세션 상태에 저장
+                # 세션 상태 및 저장소에 저장
                 st.session_state['search_articles'] = articles
                 st.session_state['current_search_keyword'] = keyword
+                article_store.save_search_articles(keyword, articles.to_dict('records'))
                 
                 if len(articles) == 0:
                     st.warning("⚠️ 검색 결과가 없습니다. 다른 키워드로 시도해보세요.")
@@ -519,6 +759,26 @@ def naver_search_tab():
     if 'search_articles' in st.session_state:
         display_search_results()
 
+def display_search_cache_stats(searcher):
+    """검색 캐시 적중 현황 - 캐시에서 가져온 페이지는 API 호출(할당량)을 쓰지 않음"""
+    summary = searcher.cache_summary()
+    pages = summary['search_hits'] + summary['search_misses']
+    if not pages:
+        return
+    st.caption(
+        f"💾 검색 캐시: 이번 검색 {pages}페이지 중 {summary['search_hits']}페이지 적중 (요청 {summary['search_misses']}회) · "
+        f"누적 적중 메모리 {summary['memory_hits']}회, 디스크 {summary['disk_hits']}회, 실패 {summary['misses']}회"
+    )
+
+def display_api_quota(searcher):
+    """오늘 검색 API 할당량 사용 현황 (모든 세션 합계)"""
+    if not searcher.api_available:
+        return
+    quota = searcher.quota_summary()
+    st.caption(
+        f"📊 API 할당량: 오늘 {quota['calls']:,}회 사용 · 남은 호출 {quota['remaining']:,}회 (키 {quota['credentials']}개)"
+    )
+
 def display_search_results():
     articles = st.session_state['search_articles']
     keyword = st.session_state['current_search_keyword']
@@ -575,22 +835,28 @@ def display_search_results():
     # 결과 표시 옵션
     display_mode = st.radio("표시 방식", ["요약 보기", "전체 보기"], horizontal=True, key="radio_display_mode")
     
+    # 표시용 열 - 발행일은 정리할 때 만든 표시용 문자열(pubDateText) 사용
+    rows = articles.assign(
+        pubDate=articles['pubDateText'],
+        summary=articles['description'].str.slice(0, 100)
+    ).itertuples(index=False)
+    
     if display_mode == "요약 보기":
         # 간단한 리스트 형태로 표시
-        for i, article in enumerate(articles, 1):
-            st.markdown(f"**{i}.** [{article['title']}]({article['link']})")
-            st.caption(f"📅 {article['pubDate']} | 📰 {article.get('source', '알 수 없음')}")
-            if article.get('description'):
-                st.write(f"💬 {article['description'][:100]}...")
+        for i, article in enumerate(rows, 1):
+            st.markdown(f"**{i}.** [{article.title}]({article.link})")
+            st.caption(f"📅 {article.pubDate} | 📰 {article.source}")
+            if article.description:
+                st.write(f"💬 {article.summary}...")
             st.markdown("---")
     else:
         # 상세한 expander 형태로 표시
-        for i, article in enumerate(articles, 1):
-            with st.expander(f"{i}. {article['title']}", expanded=False):
-                st.markdown(f"**요약:** {article['description']}")
-                st.markdown(f"**발행일:** {article['pubDate']}")
-                st.markdown(f"**출처:** {article.get('source', '알 수 없음')}")
-                st.markdown(f"**링크:** [기사 보기]({article['link']})")
+        for i, article in enumerate(rows, 1):
+            with st.expander(f"{i}. {article.title}", expanded=False):
+                st.markdown(f"**요약:** {article.description}")
+                st.markdown(f"**발행일:** {article.pubDate}")
+                st.markdown(f"**출처:** {article.source}")
+                st.markdown(f"**링크:** [기사 보기]({article.link})")
 
 def display_market_analysis(df: pd.DataFrame, date: datetime):
     """시장 데이터 분석 결과 표시"""
@@ -811,7 +1077,10 @@ def extract_stock_names(text):
 def search_stock_news(keywords, start_date, end_date, max_articles):
     """특징주 관련 뉴스 검색"""
     searcher = NaverNewsSearcher()
-    return searcher.search_stock_news(keywords, start_date, max_articles)
+    articles = searcher.search_stock_news(keywords, start_date, max_articles)
+    display_search_cache_stats(searcher)
+    display_api_quota(searcher)
+    return articles
 
 def display_stock_news_tab():
     """특징주 포착 탭 표시"""
@@ -865,6 +1134,8 @@ def display_stock_news_tab():
         with st.spinner("뉴스 검색 및 분석 중..."):
             # 1. 뉴스 검색
             articles = search_stock_news(selected_keywords, selected_date, None, max_articles)
+            for keyword in selected_keywords:
+                article_store.save_search_articles(keyword, [article for article in articles if article['keyword'] == keyword])
             
             # 키워드별 기사 수 계산
             keyword_article_counts = {}
@@ -1012,6 +1283,9 @@ with st.sidebar:
     )
     
     st.markdown("---")
+    if selected == "신문 게재 기사 수집":
+        display_paper_health()
+        st.markdown("---")
     st.markdown("### 📖 사용법")
     st.markdown("""
     **신문 게재 기사 수집:**
@@ -0,0 +1,162 @@
+"""신문 게재 기사 일괄 수집 (명령줄)
+
+기간 × 신문사 목록을 NewsCollector 비동기 엔진으로 한꺼번에 수집해 기사 저장소에 넣는다.
+끝난 (oid, 날짜) 단위는 체크포인트 파일에 기록하므로 중단된 실행을 그대로 다시 시작하면 이어서 수집한다.
+오늘(KST) 이후 날짜는 아직 발행 중일 수 있으므로 기록하지 않고 다시 실행할 때마다 새로 수집한다.
+
+사용 예:
+    python backfill.py --start 2025-10-01 --end 2026-09-30
+    python backfill.py --start 2026-10-01 --end 2026-10-16 --papers 매일경제 한국경제
+    python backfill.py --start 2026-10-01 --end 2026-10-16 --category 경제신문 --concurrency 32
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from news_collector import NewsCollector, unit_status
+from util.article_store import ArticleStore
+
+KST = timezone(timedelta(hours=9))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="신문 게재 기사 기간 일괄 수집")
+    parser.add_argument("--start", required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="종료일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--papers", nargs="+", help="수집할 신문사명 또는 oid (기본: 전체)")
+    parser.add_argument("--category", help="수집할 카테고리 (경제신문/종합일간지/석간신문)")
+    parser.add_argument("--checkpoint", default=".cache/backfill_checkpoint.jsonl", help="체크포인트 파일 경로")
+    parser.add_argument("--db", default=".cache/articles.db", help="기사 저장소(SQLite) 경로")
+    parser.add_argument("--concurrency", type=int, help="전역 동시 요청 수 (기본: 설정값)")
+    return parser.parse_args(argv)
+
+
+def select_papers(collector, names=None, category=None):
+    """[(신문사명, oid)] 목록 - 이름/oid/카테고리로 선택"""
+    categories = collector.get_newspaper_categories()
+    papers = []
+    for category_name, category_papers in categories.items():
+        if category and category_name != category:
+            continue
+        for paper_name, oid in category_papers.items():
+            if not names or paper_name in names or oid in names:
+                papers.append((paper_name, oid))
+    return papers
+
+
+def date_range(start, end):
+    """시작일부터 종료일까지의 YYYYMMDD 목록"""
+    start_date = datetime.strptime(start, "%Y-%m-%d").date()
+    end_date = datetime.strptime(end, "%Y-%m-%d").date()
+    dates = []
+    current = start_date
+    while current <= end_date:
+        dates.append(current.strftime("%Y%m%d"))
+        current += timedelta(days=1)
+    return dates
+
+
+def load_checkpoint(path):
+    """체크포인트에 기록된 완료 단위 {(oid, date)}"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                done.add((record["oid"], record["date"]))
+            except (ValueError, KeyError):
+                # 중단 시점에 반쯤 쓰인 줄은 무시
+                continue
+    return done
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    collector = NewsCollector()
+    if args.concurrency:
+        collector.max_concurrency = args.concurrency
+        collector.max_connections_per_host = args.concurrency
+
+    papers = select_papers(collector, args.papers, args.category)
+    if not papers:
+        print("선택된 신문사가 없습니다.", file=sys.stderr)
+        return 1
+
+    done = load_checkpoint(args.checkpoint)
+    units = [
+        (paper_name, oid, date)
+        for date in date_range(args.start, args.end)
+        for paper_name, oid in papers
+        if (oid, date) not in done
+    ]
+    print(f"수집 대상 {len(units)}개 단위 (체크포인트로 건너뜀 {len(done)}개)")
+
+    store = ArticleStore(args.db)
+    checkpoint_dir = os.path.dirname(args.checkpoint)
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    counts = {"done": 0, "empty": 0, "truncated": 0, "skipped": 0, "failed": 0, "articles": 0}
+    started = time.monotonic()
+
+    with open(args.checkpoint, "a", encoding="utf-8") as checkpoint:
+
+        def on_unit_done(paper_name, oid, date, articles, error):
+            unique_articles = list({article.key: article for article in articles}.values())
+            status = unit_status(error)
+            if status != "complete":
+                # 실패하거나 중간에 끊긴 단위는 체크포인트에 기록하지 않아 다음 실행에서 다시 수집
+                counts[status] += 1
+                if unique_articles:
+                    store.save_newspaper_articles(date, paper_name, oid, unique_articles, complete=False)
+                    counts["articles"] += len(unique_articles)
+                print(f"❌ {date} {paper_name}: {error}", file=sys.stderr)
+            else:
+                if unique_articles:
+                    store.save_newspaper_articles(date, paper_name, oid, unique_articles)
+                    counts["done"] += 1
+                else:
+                    counts["empty"] += 1
+                counts["articles"] += len(unique_articles)
+
+                # 오늘(KST) 이후 날짜는 아직 발행 중일 수 있어 다음 실행에서 다시 수집하도록 기록하지 않음
+                if date < datetime.now(KST).strftime("%Y%m%d"):
+                    checkpoint.write(json.dumps({"oid": oid, "date": date, "articles": len(unique_articles)}) + "\n")
+                    checkpoint.flush()
+
+            finished = sum(counts[key] for key in ("done", "empty", "truncated", "skipped", "failed"))
+            if finished % 50 == 0:
+                print(f"  {finished}/{len(units)} 단위 완료, 기사 {counts['articles']}개")
+
+        try:
+            collector._run_sync(collector.crawl_units_async(units, on_unit_done))
+        except KeyboardInterrupt:
+            print("중단됨 - 같은 명령으로 다시 실행하면 이어서 수집합니다.", file=sys.stderr)
+        finally:
+            collector.close()
+
+    elapsed = max(time.monotonic() - started, 1e-9)
+    stats = collector.crawl_stats
+    pages = stats.get("pages_fetched", 0) + stats.get("pages_cached", 0)
+    print("📊 수집 결과")
+    print(f"  단위: 완료 {counts['done']} / 기사 없음 {counts['empty']} / 중단 {counts['truncated']} / 차단 {counts['skipped']} / 실패 {counts['failed']}")
+    print(f"  기사: {counts['articles']}개")
+    print(f"  페이지: {pages}개 (요청 {stats.get('pages_fetched', 0)}, 캐시 {stats.get('pages_cached', 0)}), "
+          f"{stats.get('bytes', 0) / 1024 / 1024:.1f}MB, 재시도 {stats.get('retries', 0)}회, 중복 요청 {stats.get('hedged', 0)}회")
+    print(f"  소요 시간: {elapsed:.1f}초")
+    if collector.metrics is not None:
+        summary = collector.metrics.summary()
+        print(f"  작업 시간 합계: 네트워크 {summary['total_seconds']:.1f}초, 파싱 {summary['parse_seconds']:.1f}초, "
+              f"대기 {summary['sleep_seconds']:.1f}초")
+    print(f"  처리량: {pages / elapsed:.1f} 페이지/초, {counts['articles'] / elapsed:.1f} 기사/초")
+    return 0 if counts["failed"] + counts["truncated"] + counts["skipped"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
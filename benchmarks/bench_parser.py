@@ -0,0 +1,168 @@
+"""신문 게재 기사 목록 파서 벤치마크
+
+benchmarks/fixtures의 목록 페이지로 파서 처리량(페이지/초, 기사/초)을 재고,
+golden 결과와 비교해 파서 회귀를 잡아낸다.
+
+픽스처는 네이버 목록 페이지 구조(톱기사 dl > dt + dd, A/B 섹션, 석간, 빈 페이지)를 본떠 직접 만든 HTML이고
+(제목과 요약은 임의로 채움) golden은 기존 BeautifulSoup 파서 결과다. 따라서 이 비교는 빠른 파서가
+기존 파서와 같은 결과를 내는지만 확인하며, 실제 네이버 마크업이 바뀐 것은 잡지 못한다.
+실제 페이지를 저장해 fixtures에 넣고 --update-golden으로 기준을 만들면 마크업 변화도 확인할 수 있다.
+
+사용 예:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --min-time 2
+    python benchmarks/bench_parser.py --update-golden   # 기준 파서 결과로 golden 갱신
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import news_parser  # noqa: E402
+from news_collector import NewsCollector  # noqa: E402
+
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+GOLDEN_DIR = os.path.join(BENCH_DIR, "golden")
+
+
+def load_fixtures():
+    """{이름: HTML bytes}"""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, "rb") as f:
+            fixtures[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return fixtures
+
+
+def comparable(articles):
+    """수집 시각을 뺀 비교용 결과"""
+    return [{key: value for key, value in article.items() if key != "collected_at"} for article in articles]
+
+
+def measure(func, inputs, min_time):
+    """
+    inputs 전체를 min_time초 이상 반복 처리하며 처리량 측정
+
+    Returns:
+        tuple: (초당 입력 수, 초당 결과 수)
+    """
+    if not inputs:
+        return 0.0, 0.0
+
+    rounds = 0
+    results = 0
+    started = time.perf_counter()
+    while True:
+        for item in inputs:
+            results += func(item)
+        rounds += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+    return rounds * len(inputs) / elapsed, results / elapsed
+
+
+def bs_links(fixtures):
+    """기준 파서 기준 각 페이지의 기사 링크 요소 목록"""
+    links = []
+    for content in fixtures.values():
+        soup = BeautifulSoup(content, 'lxml')
+        main_content = soup.find('div', class_='list_body newsflash_body')
+        if main_content:
+            links.extend(main_content.find_all('a', href=lambda x: x and 'mnews/article' in x))
+    return links
+
+
+def lxml_links(fixtures):
+    """빠른 파서 기준 각 페이지의 기사 링크 요소 목록"""
+    links = []
+    for content in fixtures.values():
+        main_content = news_parser.MAIN_CONTENT_XPATH(news_parser.to_document(content))
+        if main_content:
+            links.extend(news_parser.ARTICLE_LINK_XPATH(main_content[0]))
+    return links
+
+
+def check_golden(collector, fixtures, update):
+    """두 파서 결과를 golden과 비교 - 실패한 항목 목록 반환"""
+    failures = []
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+
+    for name, content in fixtures.items():
+        golden_path = os.path.join(GOLDEN_DIR, f"{name}.json")
+        reference = comparable(collector.parse_list_page_bs(content))
+        fast = comparable(news_parser.parse_list_page(content))
+
+        if update:
+            with open(golden_path, "w", encoding="utf-8") as f:
+                json.dump(reference, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+
+        try:
+            with open(golden_path, "r", encoding="utf-8") as f:
+                golden = json.load(f)
+        except OSError:
+            failures.append(f"{name}: golden 파일 없음 (--update-golden으로 생성)")
+            continue
+
+        if reference != golden:
+            failures.append(f"{name}: 기준 파서(BeautifulSoup) 결과가 golden과 다름")
+        if fast != golden:
+            failures.append(f"{name}: 빠른 파서(lxml) 결과가 golden과 다름")
+
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="신문 게재 기사 목록 파서 벤치마크")
+    parser.add_argument("--min-time", type=float, default=1.0, help="항목별 최소 측정 시간(초)")
+    parser.add_argument("--update-golden", action="store_true", help="기준 파서 결과로 golden 파일 갱신")
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixtures()
+    collector = NewsCollector()
+    pages = list(fixtures.values())
+
+    failures = check_golden(collector, fixtures, args.update_golden)
+
+    bs_link_elements = bs_links(fixtures)
+    lxml_link_elements = lxml_links(fixtures)
+
+    rows = [
+        ("extract_articles_fast (BeautifulSoup)",
+         measure(lambda content: len(collector.parse_list_page_bs(content)), pages, args.min_time)),
+        ("news_parser.parse_list_page (lxml)",
+         measure(lambda content: len(news_parser.parse_list_page(content)), pages, args.min_time)),
+        # 면 정보 추출은 링크 하나가 입력이자 기사 하나
+        ("extract_page_info_comprehensive (BeautifulSoup)",
+         measure(lambda link: collector.extract_page_info_comprehensive(link) is not None,
+                 bs_link_elements, args.min_time)),
+        ("news_parser.extract_page_info (lxml, 컨테이너 캐시 없음)",
+         measure(lambda link: news_parser.extract_page_info(link, {}) is not None,
+                 lxml_link_elements, args.min_time)),
+    ]
+
+    print(f"픽스처 {len(fixtures)}개: {', '.join(fixtures)}")
+    print(f"{'파서':<56}{'페이지(링크)/초':>16}{'기사/초':>12}")
+    for name, (inputs_per_sec, articles_per_sec) in rows:
+        print(f"{name:<56}{inputs_per_sec:>16.0f}{articles_per_sec:>12.0f}")
+
+    if failures:
+        print("\n❌ golden 비교 실패")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("\n✅ golden 결과 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
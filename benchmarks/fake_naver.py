@@ -0,0 +1,273 @@
+"""네이버 대역 서버 (부하 테스트용)
+
+benchmarks/fixtures의 직접 만든 목록 페이지 픽스처로 다음 주소를 흉내 낸다.
+    /main/list.naver           신문 게재 기사 목록 (news.naver.com)
+    /mnews/article/{oid}/{aid} 기사 본문 페이지 (n.news.naver.com)
+    /v1/search/news.json       뉴스 검색 API (openapi.naver.com)
+    /search.naver              뉴스 검색 결과 페이지 (search.naver.com)
+
+지연 시간, 오류(5xx) 비율, 429 비율을 설정할 수 있다.
+NewsCollector(base_url=...)와 NaverNewsSearcher(api_base_url=..., search_base_url=...)에
+서버 주소를 넘기면 네트워크 없이 수집/검색 경로 전체를 돌려볼 수 있다.
+
+사용 예:
+    python benchmarks/fake_naver.py --port 8800 --latency 0.05 --error-rate 0.01 --rate-429 0.02
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+KST = timezone(timedelta(hours=9))
+
+ARTICLE_ID_PATTERN = re.compile(rb"mnews/article/\d+/(\d+)")
+ARTICLE_PATH_PATTERN = re.compile(r"^/mnews/article/(\d+)/(\d+)$")
+
+
+def load_list_fixtures():
+    """(기사가 있는 목록 페이지들, 빈 목록 페이지)"""
+    pages = []
+    empty_page = b"<html><body></body></html>"
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, "rb") as f:
+            content = f.read()
+        name = os.path.basename(path)
+        if name.startswith("empty_list"):
+            empty_page = content
+        elif b"mnews/article" in content and not name.startswith("no_container"):
+            pages.append(content)
+    return pages, empty_page
+
+
+class FakeNaverConfig:
+    """대역 서버 동작 설정"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_429=0.0,
+                 retry_after=1, pages_per_paper=4, search_total=1000, api_daily_limit=0, seed=None):
+        """
+        Args:
+            latency: 응답 지연(초)
+            jitter: 지연에 더할 무작위 시간의 최댓값(초)
+            error_rate: 500 응답 비율 (0~1)
+            rate_429: 429 응답 비율 (0~1)
+            retry_after: 429 응답의 Retry-After(초)
+            pages_per_paper: 신문사별 기사가 있는 페이지 수
+            search_total: 검색 API의 전체 결과 수
+            api_daily_limit: 검색 API 키(client_id)별 호출 한도 - 넘으면 429(errorCode 010), 0이면 제한 없음
+            seed: 무작위 오류 재현용 시드
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.pages_per_paper = pages_per_paper
+        self.search_total = search_total
+        self.api_daily_limit = api_daily_limit
+        self.random = random.Random(seed)
+        self.list_pages, self.empty_page = load_list_fixtures()
+
+        # 요청 통계
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "errors": 0, "throttled": 0, "quota_exceeded": 0}
+        self.api_calls = {}
+
+
+class FakeNaverHandler(BaseHTTPRequestHandler):
+    config = None
+
+    def do_GET(self):
+        config = self.config
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        with config.lock:
+            config.counts["requests"] += 1
+            roll = config.random.random()
+            delay = config.latency + config.random.random() * config.jitter
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if roll < config.rate_429:
+            with config.lock:
+                config.counts["throttled"] += 1
+            return self._send(429, b'{"errorCode":"012","errorMessage":"Rate limit exceeded."}',
+                              "application/json", {"Retry-After": str(config.retry_after)})
+        if roll < config.rate_429 + config.error_rate:
+            with config.lock:
+                config.counts["errors"] += 1
+            return self._send(500, b"Internal Server Error", "text/plain")
+
+        if url.path == "/main/list.naver":
+            return self._send(200, self._list_page(params), "text/html; charset=utf-8")
+        article_match = ARTICLE_PATH_PATTERN.match(url.path)
+        if article_match:
+            return self._send(200, self._article_page(*article_match.groups()), "text/html; charset=utf-8")
+        if url.path == "/v1/search/news.json":
+            if self._over_quota():
+                return self._send(429, b'{"errorCode":"010","errorMessage":"Request limit exceeded."}',
+                                  "application/json")
+            return self._send(200, self._search_api(params), "application/json; charset=utf-8")
+        if url.path == "/search.naver":
+            return self._send(200, self._search_page(params), "text/html; charset=utf-8")
+        return self._send(404, b"Not Found", "text/plain")
+
+    def _list_page(self, params):
+        config = self.config
+        oid = params.get("oid", "000")
+        page = int(params.get("page", 1))
+        if page > config.pages_per_paper or not config.list_pages:
+            return config.empty_page
+
+        content = config.list_pages[(page - 1) % len(config.list_pages)]
+        # 신문사/페이지마다 기사 ID가 겹치지 않도록 치환
+        return ARTICLE_ID_PATTERN.sub(
+            lambda match: b"mnews/article/%s/%03d%s" % (oid.encode(), page, match.group(1)[3:]),
+            content
+        )
+
+    def _article_page(self, oid, aid):
+        """기사 본문 페이지 - 실제 페이지처럼 본문 앞뒤로 메뉴/스크립트가 붙은 HTML"""
+        paragraphs = "<br><br>".join(
+            f"{oid}-{aid} 기사의 {index}번째 문단입니다. 경제 지표와 시장 동향에 대한 설명이 이어집니다."
+            for index in range(1, 13)
+        )
+        return (
+            '<html><head><meta charset="utf-8"><script>var page = {};</script></head><body>'
+            '<div class="media_end_head">헤더 메뉴</div>'
+            f'<div id="newsct_article"><article id="dic_area" class="go_trans _article_content">{paragraphs}'
+            '<span class="end_photo_org"><img src="/photo.jpg"><em class="img_desc">사진 설명</em></span>'
+            '</article></div><div class="media_end_linked">관련 기사</div></body></html>'
+        ).encode("utf-8")
+
+    def _over_quota(self):
+        """요청한 API 키가 하루 호출 한도를 넘었는지 (호출 수를 하나 늘림)"""
+        config = self.config
+        client_id = self.headers.get("X-Naver-Client-Id", "")
+        with config.lock:
+            config.api_calls[client_id] = config.api_calls.get(client_id, 0) + 1
+            if config.api_daily_limit and config.api_calls[client_id] > config.api_daily_limit:
+                config.counts["quota_exceeded"] += 1
+                return True
+        return False
+
+    def _search_items(self, query, start, count):
+        """검색 결과 - 최신순, 결과마다 10분 간격"""
+        config = self.config
+        now = datetime.now(KST).replace(second=0, microsecond=0)
+        items = []
+        for index in range(start, min(start + count, config.search_total + 1)):
+            published = now - timedelta(minutes=10 * (index - 1))
+            items.append({
+                "title": f"<b>{query}</b> 관련 기사 {index}",
+                "originallink": f"https://www.hankyung.com/article/2026{index:08d}",
+                "link": f"https://n.news.naver.com/mnews/article/015/{index:010d}?sid=101",
+                "description": f"{query} 관련 기사 {index}번의 요약입니다. &quot;인용&quot; 포함",
+                "pubDate": format_datetime(published)
+            })
+        return items
+
+    def _search_api(self, params):
+        query = params.get("query", "")
+        start = int(params.get("start", 1))
+        display = int(params.get("display", 10))
+        items = self._search_items(query, start, display)
+        return json.dumps({
+            "lastBuildDate": format_datetime(datetime.now(KST)),
+            "total": self.config.search_total,
+            "start": start,
+            "display": len(items),
+            "items": items
+        }, ensure_ascii=False).encode("utf-8")
+
+    def _search_page(self, params):
+        query = params.get("query", "")
+        start = int(params.get("start", 1))
+        rows = []
+        for item in self._search_items(query, start, 10):
+            title = re.sub(r"<[^>]+>", "", item["title"])
+            rows.append(
+                f'<li class="bx"><div class="news_wrap api_ani_send"><div class="news_area">'
+                f'<div class="news_info"><div class="info_group">'
+                f'<span class="info">한국경제 · {item["pubDate"]}</span></div></div>'
+                f'<a href="{item["link"]}" class="news_tit" title="{title}">{title}</a>'
+                f'<div class="news_dsc"><div class="dsc_wrap">{item["description"]}</div></div>'
+                f'</div></div></li>'
+            )
+        return (
+            '<html><head><meta charset="utf-8"></head><body><div class="group_news">'
+            f'<ul class="list_news">{"".join(rows)}</ul></div></body></html>'
+        ).encode("utf-8")
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(config=None, host="127.0.0.1", port=0):
+    """
+    대역 서버를 백그라운드 스레드에서 시작
+
+    Returns:
+        tuple: (서버 객체, 기본 주소 예: http://127.0.0.1:8800)
+    """
+    config = config or FakeNaverConfig()
+    handler = type("ConfiguredFakeNaverHandler", (FakeNaverHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="무작위 추가 지연 최댓값(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--pages-per-paper", type=int, default=4, help="신문사별 기사 페이지 수")
+    parser.add_argument("--search-total", type=int, default=1000, help="검색 API 전체 결과 수")
+    parser.add_argument("--api-daily-limit", type=int, default=0, help="검색 API 키별 호출 한도 (0이면 제한 없음)")
+    args = parser.parse_args(argv)
+
+    config = FakeNaverConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        rate_429=args.rate_429, retry_after=args.retry_after,
+        pages_per_paper=args.pages_per_paper, search_total=args.search_total,
+        api_daily_limit=args.api_daily_limit
+    )
+    handler = type("ConfiguredFakeNaverHandler", (FakeNaverHandler,), {"config": config})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"네이버 대역 서버: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
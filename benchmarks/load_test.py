@@ -0,0 +1,150 @@
+"""네이버 대역 서버를 이용한 수집/검색 부하 테스트
+
+대역 서버를 띄운 뒤 NewsCollector와 NaverNewsSearcher를 그 주소로 돌려
+처리량, 오류/재시도 동작, 속도 제한기 상태를 네트워크 없이 측정한다.
+
+사용 예:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --papers 20 --days 3 --latency 0.05 --rate-429 0.05
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fake_naver import FakeNaverConfig, start_server  # noqa: E402
+from naver_search import NaverNewsSearcher  # noqa: E402
+from news_collector import NewsCollector  # noqa: E402
+from util.rate_limiter import get_host_limiter  # noqa: E402
+
+
+def run_crawl(base_url, papers, days):
+    """신문 게재 기사 수집 부하 테스트"""
+    collector = NewsCollector(base_url=base_url)
+    # 매 실행이 네트워크 경로를 타도록 디스크 캐시는 끔
+    collector.page_cache = None
+
+    paper_list = [(f"신문{index:02d}", f"{index + 100:03d}") for index in range(papers)]
+    start_date = date(2026, 10, 1)
+    units = [
+        (paper_name, oid, (start_date + timedelta(days=offset)).strftime("%Y%m%d"))
+        for offset in range(days)
+        for paper_name, oid in paper_list
+    ]
+
+    outcome = {"done": 0, "failed": 0, "articles": 0}
+
+    def on_unit_done(paper_name, oid, unit_date, articles, error):
+        if error is None:
+            outcome["done"] += 1
+            outcome["articles"] += len(articles)
+        else:
+            outcome["failed"] += 1
+
+    started = time.monotonic()
+    try:
+        collector._run_sync(collector.crawl_units_async(units, on_unit_done))
+    finally:
+        collector.close()
+    elapsed = time.monotonic() - started
+
+    stats = collector.crawl_stats
+    pages = stats.get("pages_fetched", 0)
+    print("📰 crawl_units_async")
+    print(f"  단위 {len(units)}개: 성공 {outcome['done']}, 실패 {outcome['failed']}, 기사 {outcome['articles']}개")
+    print(f"  {elapsed:.2f}초, {pages / elapsed:.1f} 페이지/초")
+    print(f"  재시도 {stats.get('retries', 0)}회, 중복 요청 {stats.get('hedged', 0)}회")
+    return outcome["failed"]
+
+
+def run_bodies(base_url, count):
+    """기사 본문 수집 부하 테스트"""
+    collector = NewsCollector(base_url=base_url)
+    articles = [
+        {"url": f"https://n.news.naver.com/mnews/article/{index % 20 + 100:03d}/{index:010d}"}
+        for index in range(count)
+    ]
+
+    started = time.monotonic()
+    try:
+        collector.fetch_article_bodies(articles)
+    finally:
+        collector.close()
+    elapsed = time.monotonic() - started
+
+    failed = sum(1 for article in articles if not article["body"])
+    summary = collector.metrics.summary()
+    print("📄 fetch_article_bodies")
+    print(f"  기사 {count}개: 본문 {count - failed}개, 실패 {failed}개")
+    print(f"  {elapsed:.2f}초, {count / elapsed:.1f} 기사/초 (파싱 {summary['parse_seconds']:.2f}초)")
+    return failed
+
+
+def run_search(base_url, queries, max_results):
+    """검색 API 부하 테스트"""
+    # 화면 검색이 아닌 일괄 작업이므로 화면 검색용으로 남겨 둔 할당량은 쓰지 않음
+    searcher = NaverNewsSearcher(api_base_url=base_url, search_base_url=base_url, interactive=False)
+    searcher.client_id = searcher.client_id or "load-test"
+    searcher.client_secret = searcher.client_secret or "load-test"
+    searcher.api_available = True
+
+    failures = 0
+    total = 0
+    started = time.monotonic()
+    for index in range(queries):
+        try:
+            total += len(searcher.search_news_api(f"부하테스트{index}", max_results))
+        except Exception as e:
+            failures += 1
+            print(f"  ❌ 검색 {index}: {e}")
+    elapsed = time.monotonic() - started
+
+    print("🔍 search_news_api")
+    print(f"  검색 {queries}회 × 최대 {max_results}개: 결과 {total}개, 실패 {failures}회")
+    print(f"  {elapsed:.2f}초, 검색당 {elapsed / max(queries, 1):.2f}초")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 대역 서버 부하 테스트")
+    parser.add_argument("--papers", type=int, default=20, help="신문사 수")
+    parser.add_argument("--days", type=int, default=1, help="수집 일수")
+    parser.add_argument("--pages-per-paper", type=int, default=4, help="신문사별 기사 페이지 수")
+    parser.add_argument("--bodies", type=int, default=0, help="본문을 받을 기사 수 (0이면 건너뜀)")
+    parser.add_argument("--queries", type=int, default=3, help="검색 횟수")
+    parser.add_argument("--max-results", type=int, default=1000, help="검색당 최대 결과 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="무작위 추가 지연 최댓값(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--seed", type=int, default=1, help="무작위 오류 시드")
+    args = parser.parse_args(argv)
+
+    config = FakeNaverConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, rate_429=args.rate_429,
+        pages_per_paper=args.pages_per_paper, search_total=args.max_results, seed=args.seed
+    )
+    server, base_url = start_server(config)
+    print(f"대역 서버: {base_url}")
+
+    try:
+        failures = run_crawl(base_url, args.papers, args.days)
+        if args.bodies:
+            failures += run_bodies(base_url, args.bodies)
+        failures += run_search(base_url, args.queries, args.max_results)
+    finally:
+        server.shutdown()
+
+    limiter = get_host_limiter(base_url.split("//", 1)[1])
+    print(f"서버 요청 {config.counts['requests']}회 (500: {config.counts['errors']}, 429: {config.counts['throttled']})")
+    print(f"속도 제한기 최종 속도: {limiter.rate:.1f}건/초")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -66,12 +66,12 @@ class DownloadManager:
         return text_content
 
     @staticmethod
-    def create_search_excel_download(articles: List[Dict]) -> bytes:
+    def create_search_excel_download(articles: Union[pd.DataFrame, List[Dict]]) -> bytes:
         """
         검색 결과 엑셀 파일 생성
         
         Args:
-            articles: 검색 결과 기사 데이터 리스트
+            articles: 검색 결과 DataFrame (또는 기사 데이터 리스트)
             
         Returns:
             bytes: 엑셀 파일 데이터
@@ -83,12 +83,12 @@ class DownloadManager:
         return output.getvalue()
 
     @staticmethod
-    def create_search_csv_download(articles: List[Dict]) -> bytes:
+    def create_search_csv_download(articles: Union[pd.DataFrame, List[Dict]]) -> bytes:
         """
         검색 결과 CSV 파일 생성
         
         Args:
-            articles: 검색 결과 기사 데이터 리스트
+            articles: 검색 결과 DataFrame (또는 기사 데이터 리스트)
             
         Returns:
             bytes: CSV 파일 데이터
@@ -97,29 +97,40 @@ class DownloadManager:
         return df.to_csv(index=False).encode('utf-8-sig')
 
     @staticmethod
-    def create_search_text_download(articles: List[Dict], keyword: str) -> str:
+    def create_search_text_download(articles: Union[pd.DataFrame, List[Dict]], keyword: str) -> str:
         """
         검색 결과 텍스트 파일 생성
         
         Args:
-            articles: 검색 결과 기사 데이터 리스트
+            articles: 검색 결과 DataFrame (또는 기사 데이터 리스트)
             keyword: 검색 키워드
             
         Returns:
             str: 텍스트 파일 내용
         """
+        df = pd.DataFrame(articles)
+        df = df.reindex(columns=['title', 'description', 'pubDate', 'source', 'link']).assign(
+            pubDate=df['pubDateText'] if 'pubDateText' in df else df.get('pubDate')
+        )
         text_content = f"🔍 '{keyword}' 검색 결과\n"
         text_content += f"검색일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}\n"
-        text_content += f"총 {len(articles)}개 기사\n\n"
+        text_content += f"총 {len(df)}개 기사\n\n"
         
-        for i, article in enumerate(articles, 1):
-            text_content += f"{i}. {article['title']}\n"
-            text_content += f"   요약: {article['description']}\n"
-            text_content += f"   발행일: {article['pubDate']}\n"
-            text_content += f"   출처: {article.get('source', '알 수 없음')}\n"
-            text_content += f"   링크: {article['link']}\n\n"
+        # 기사마다 문자열을 이어 붙이지 않고 열 단위로 한 번에 만듦
+        if pd.api.types.is_datetime64_any_dtype(df['pubDate']):
+            pub_dates = df['pubDate'].dt.strftime('%Y.%m.%d %H:%M').fillna('')
+        else:
+            pub_dates = df['pubDate'].fillna('').astype(str)
+        numbers = pd.Series(range(1, len(df) + 1), index=df.index).astype(str)
+        entries = (
+            numbers + ". " + df['title'].fillna('').astype(str) + "\n"
+            + "   요약: " + df['description'].fillna('').astype(str) + "\n"
+            + "   발행일: " + pub_dates + "\n"
+            + "   출처: " + df['source'].fillna('알 수 없음').astype(str) + "\n"
+            + "   링크: " + df['link'].fillna('').astype(str) + "\n\n"
+        )
         
-        return text_content
+        return text_content + "".join(entries)
 
     @staticmethod
     def create_stock_data_download(df: pd.DataFrame, date: datetime) -> bytes:
@@ -1,310 +1,805 @@
-import requests
+import html
 import json
-from datetime import datetime, timedelta
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+import random
 import time
+import httpx
 import streamlit as st
 import re
-from urllib.parse import quote
-from bs4 import BeautifulSoup
+from urllib.parse import quote, urlparse
+import numpy as np
 import pandas as pd
+from news_collector import RETRYABLE_STATUS_CODES
+from news_parser import parse_search_page
+from util.http_pool import get_http_client
+from util.metrics import CrawlMetrics, RequestTimer
+from util.quota_ledger import QuotaExhaustedError, QuotaLedger
+from util.rate_limiter import get_host_limiter
+from util.search_cache import SearchCache, get_search_cache
+
+DEFAULT_API_BASE_URL = "https://openapi.naver.com"
+DEFAULT_SEARCH_BASE_URL = "https://search.naver.com"
+# 검색 API의 start 최댓값
+API_MAX_START = 1000
+# 하루 호출 한도를 넘긴 키에 검색 API가 돌려주는 errorCode (초당 한도 초과는 012)
+API_QUOTA_ERROR_CODE = "010"
+# API pubDate 형식
+API_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S +0900"
+KST = timezone(timedelta(hours=9))
+
+# (검색어, 날짜)별로 지난번에 찾은 날짜 구간 경계 {(query, YYYYMMDD): (시작 오프셋, 끝 오프셋)}
+# 새 기사가 올라오면 경계가 뒤로 밀리므로 정답이 아니라 다음 탐색의 출발점으로만 사용
+_date_window_cache = {}
+_date_window_lock = threading.Lock()
+
+# 검색 결과 DataFrame 열 - pubDate는 KST 기준 datetime64 (시간대 없이), 나머지는 문자열
+# pubDateText는 표시/내보내기용 발행일 (날짜만 있으면 날짜만, 읽지 못한 형식은 원래 문자열)
+SEARCH_COLUMNS = ['title', 'link', 'description', 'pubDate', 'pubDateText', 'source']
+# HTML 태그 - 여러 값을 구분자(\x00)로 이어 붙여 한 번에 처리하므로 구분자를 넘지 않음
+TAG_PATTERN = re.compile(r'<[^>\x00]*>')
+FIELD_SEPARATOR = '\x00'
+URL_HOST_PATTERN = r'^[a-zA-Z][a-zA-Z0-9+.-]*://([^/:?#]+)'
+# 기사 링크 도메인 → 출처 (하위 도메인은 상위 도메인으로 찾음)
+PUBLISHERS = {
+    'news.naver.com': '네이버뉴스',
+    'chosun.com': '조선일보',
+    'joongang.co.kr': '중앙일보',
+    'donga.com': '동아일보',
+    'hankyung.com': '한국경제',
+    'mk.co.kr': '매일경제',
+    'hani.co.kr': '한겨레',
+    'khan.co.kr': '경향신문',
+}
+# 웹 검색 결과의 날짜만 있는 발행일 ("2025.10.13.")
+DATE_ONLY_PATTERN = r'\d{4}\.\d{1,2}\.\d{1,2}\.'
+# 웹 검색 결과의 상대 시간 ("5분 전", "3시간 전", "2일 전")
+RELATIVE_TIME_PATTERN = r'^(\d+)\s*(분|시간|일)\s*전$'
+RELATIVE_TIME_UNITS = {'분': 'min', '시간': 'h', '일': 'D'}
+
+
+def clean_text(values):
+    """
+    문자열 Series의 HTML 태그를 지우고 엔티티(&quot; 등)를 풀어 씀
+
+    값마다 정규식과 unescape를 따로 부르지 않고 열 전체를 이어 붙여 한 번씩만 처리한다.
+    """
+    if values.empty:
+        return values.astype('string')
+    joined = FIELD_SEPARATOR.join(values.fillna('').astype(str).str.replace(FIELD_SEPARATOR, ' ', regex=False))
+    cleaned = html.unescape(TAG_PATTERN.sub('', joined)).split(FIELD_SEPARATOR)
+    return pd.Series(cleaned, index=values.index, dtype='string')
+
+
+def publisher_of(host):
+    """도메인의 출처 - 등록된 도메인이나 그 하위 도메인이 아니면 '기타'"""
+    labels = host.lower().split('.')
+    for index in range(len(labels) - 1):
+        publisher = PUBLISHERS.get('.'.join(labels[index:]))
+        if publisher:
+            return publisher
+    return '기타'
+
+
+def publishers(links):
+    """링크 Series의 출처 - 도메인별로 한 번만 찾아 열 전체에 대응"""
+    hosts = links.astype('string').str.extract(URL_HOST_PATTERN, expand=False)
+    table = {host: publisher_of(host) for host in hosts.dropna().unique()}
+    return hosts.map(table).fillna('기타').astype('string')
+
+
+def parse_pub_dates(values):
+    """
+    발행일 문자열 Series를 KST datetime64로 변환 (알 수 없는 형식은 NaT)
+
+    API 형식("Mon, 13 Oct 2025 09:30:00 +0900"), 웹 검색의 "2025.10.13." 형식과 "3시간 전" 같은 상대 시간을 읽는다.
+    """
+    values = values.fillna('').astype(str).str.strip()
+    parsed = pd.to_datetime(values, format='%a, %d %b %Y %H:%M:%S %z', errors='coerce', utc=True)
+    dates = parsed.dt.tz_convert(KST).dt.tz_localize(None)
+
+    missing = dates.isna()
+    if missing.any():
+        dates = dates.fillna(pd.to_datetime(values[missing], format='%Y.%m.%d.', errors='coerce'))
+    missing = dates.isna()
+    if missing.any():
+        relative = values[missing].str.extract(RELATIVE_TIME_PATTERN)
+        relative = relative.dropna()
+        if not relative.empty:
+            now = pd.Timestamp(datetime.now(KST).replace(tzinfo=None, second=0, microsecond=0))
+            offsets = pd.to_timedelta(relative[0].astype(int).astype(str) + relative[1].map(RELATIVE_TIME_UNITS))
+            dates = dates.fillna(now - offsets)
+    return dates.astype('datetime64[ns]')
+
+
+def pub_date_texts(values, dates):
+    """
+    표시용 발행일 - 시각이 있으면 "YYYY.MM.DD HH:MM", 날짜만 있으면 "YYYY.MM.DD", 읽지 못했으면 원래 문자열
+
+    Args:
+        values: 원래 발행일 문자열 Series
+        dates: parse_pub_dates(values)
+    """
+    values = values.fillna('').astype(str).str.strip()
+    # dt.strftime은 값마다 포맷하므로 numpy로 분 단위 ISO 문자열("2025-10-13T09:30")을 만든 뒤 구분자만 바꿈
+    minutes = np.datetime_as_string(dates.to_numpy().astype('datetime64[m]'), unit='m')
+    texts = pd.Series(minutes, index=dates.index, dtype=object).str.replace('-', '.', regex=False).str.replace('T', ' ', regex=False)
+    date_only = values.str.fullmatch(DATE_ONLY_PATTERN)
+    texts[date_only] = texts[date_only].str.slice(0, 10)
+    return texts.where(dates.notna(), values).astype('string')
+
+
+def normalize_search_items(items):
+    """
+    검색 API items를 검색 결과 DataFrame으로 한 번에 변환
+
+    Returns:
+        pd.DataFrame: SEARCH_COLUMNS 열 (title, description은 태그/엔티티 정리, source는 링크 도메인의 출처)
+    """
+    raw = pd.DataFrame(list(items), columns=['title', 'link', 'description', 'pubDate'])
+    links = raw['link'].fillna('').astype('string')
+    pub_dates = parse_pub_dates(raw['pubDate'])
+    return pd.DataFrame({
+        'title': clean_text(raw['title']),
+        'link': links,
+        'description': clean_text(raw['description']),
+        'pubDate': pub_dates,
+        'pubDateText': pub_date_texts(raw['pubDate'], pub_dates),
+        'source': publishers(links)
+    }, columns=SEARCH_COLUMNS)
+
+
+def empty_search_results():
+    """결과가 없을 때의 검색 결과 DataFrame"""
+    return normalize_search_items([])
 
 class NaverNewsSearcher:
-    def __init__(self):
+    def __init__(self, api_base_url=None, search_base_url=None, interactive=True):
         # Streamlit secrets에서 API 키 로드
         try:
             self.client_id = st.secrets["naver_api"]["client_id"]
             self.client_secret = st.secrets["naver_api"]["client_secret"]
             self.api_available = True
-        except KeyError:
+        except (KeyError, FileNotFoundError):
             st.warning("⚠️ 네이버 API 키가 설정되지 않았습니다. 웹 크롤링 방식으로 동작합니다.")
             self.client_id = None
             self.client_secret = None
             self.api_available = False
         
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
+        # 추가 API 키 - 호출마다 오늘 가장 적게 쓴 키를 골라 할당량을 나눠 씀 {client_id: client_secret}
+        self.credentials = {self.client_id: self.client_secret} if self.client_id else {}
+        try:
+            for credential in st.secrets["naver_api"].get("credentials", []):
+                self.credentials[credential["client_id"]] = credential["client_secret"]
+        except (KeyError, FileNotFoundError):
+            pass
+        
+        # API 일일 할당량 - 모든 세션/프로세스가 api_quota_db_path의 호출 기록을 함께 사용
+        # 화면 검색(interactive)이 아닌 작업은 키마다 api_interactive_reserve 비율을 남겨 둠
+        self.interactive = interactive
+        try:
+            settings = st.secrets["app_settings"]
+            quota_db_path = settings.get("api_quota_db_path", ".cache/api_quota.db")
+            daily_limit = settings.get("api_daily_limit", 25000)
+            interactive_reserve = settings.get("api_interactive_reserve", 0.2)
+        except (KeyError, FileNotFoundError):
+            quota_db_path = ".cache/api_quota.db"
+            daily_limit = 25000
+            interactive_reserve = 0.2
+        self.quota = QuotaLedger(quota_db_path, daily_limit, interactive_reserve)
         
         # 설정값 로드
         try:
             self.max_articles_per_request = st.secrets["app_settings"]["max_articles_per_request"]
             self.request_delay = st.secrets["app_settings"]["request_delay"]
-        except KeyError:
+        except (KeyError, FileNotFoundError):
             self.max_articles_per_request = 100
             self.request_delay = 0.1
 
-        # 세션 설정
-        self.session = requests.Session()
-        self.session.headers.update({
+        try:
+            self.rate_limit_max = st.secrets["app_settings"]["rate_limit_max"]
+        except (KeyError, FileNotFoundError):
+            self.rate_limit_max = 20
+
+        # 실패한 요청 재시도 - 목록 페이지 수집과 같은 설정
+        try:
+            settings = st.secrets["app_settings"]
+            self.max_retries = settings.get("max_retries", 2)
+            self.retry_backoff = settings.get("retry_backoff", 0.5)
+        except (KeyError, FileNotFoundError):
+            self.max_retries = 2
+            self.retry_backoff = 0.5
+
+        # 검색 결과 페이지를 동시에 요청할 수 (속도는 호스트별 속도 제한기가 따로 조절)
+        try:
+            self.search_concurrency = st.secrets["app_settings"]["search_concurrency"]
+        except (KeyError, FileNotFoundError):
+            self.search_concurrency = 10
+
+        # 웹 검색 페이지(API 키가 없을 때) 시작 요청 간격 - 이후는 적응형 속도 제한기가 조절
+        try:
+            self.search_page_delay = st.secrets["app_settings"]["search_page_delay"]
+        except (KeyError, FileNotFoundError):
+            self.search_page_delay = 0.5
+
+        try:
+            self.metrics_dir = st.secrets["app_settings"]["metrics_dir"]
+        except (KeyError, FileNotFoundError):
+            self.metrics_dir = ".cache/metrics"
+        # 이 검색기로 한 검색들의 요청/파싱/대기 시간 지표
+        self.metrics = CrawlMetrics("search", self.metrics_dir)
+
+        # 검색 응답 캐시 - 최신순 결과의 start 오프셋 페이지는 새 기사가 올라올 때마다 밀리므로
+        # 지난 날짜 기사만 있는 페이지도 search_cache_ttl초만 보관하고,
+        # 다 받은 지난 날짜의 특징주 검색 결과는 바뀌지 않으므로 search_cache_history_ttl초 보관
+        try:
+            settings = st.secrets["app_settings"]
+            search_cache_dir = settings.get("search_cache_dir", ".cache/search")
+            search_cache_size = settings.get("search_cache_size", 512)
+            search_cache_disk_size = settings.get("search_cache_disk_size", 5000)
+            self.search_cache_ttl = settings.get("search_cache_ttl", 300)
+            self.search_cache_history_ttl = settings.get("search_cache_history_ttl", 7 * 24 * 3600)
+        except (KeyError, FileNotFoundError):
+            search_cache_dir = ".cache/search"
+            search_cache_size = 512
+            search_cache_disk_size = 5000
+            self.search_cache_ttl = 300
+            self.search_cache_history_ttl = 7 * 24 * 3600
+        self.search_cache = get_search_cache(search_cache_dir or None, search_cache_size, search_cache_disk_size)
+        # 이 검색기로 한 요청의 캐시 적중/실패 수
+        self.cache_counts = {"hits": 0, "misses": 0}
+
+        # 요청 주소 - 테스트용 서버 등으로 바꿀 수 있음
+        try:
+            settings = st.secrets["app_settings"]
+            api_base_url = api_base_url or settings.get("naver_api_base_url")
+            search_base_url = search_base_url or settings.get("naver_search_base_url")
+        except (KeyError, FileNotFoundError):
+            pass
+        self.api_base_url = (api_base_url or DEFAULT_API_BASE_URL).rstrip('/')
+        self.search_base_url = (search_base_url or DEFAULT_SEARCH_BASE_URL).rstrip('/')
+        self.base_url = f"{self.api_base_url}/v1/search/news.json"
+
+        # 웹 검색 페이지 요청 헤더 - 연결은 프로세스 공유 연결 풀(get_http_client)을 사용
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-        })
+        }
+
+    def _get(self, url, initial_delay, **kwargs):
+        """호스트별 적응형 속도 제한을 거친 GET 요청 - initial_delay는 처음 만들 때의 요청 간격"""
+        host = urlparse(url).netloc
+        limiter = get_host_limiter(
+            host,
+            initial_rate=1 / max(initial_delay, 0.01),
+            max_rate=self.rate_limit_max
+        )
+        self.metrics.sleep(limiter.acquire(), "rate_limit")
+        
+        timer = RequestTimer()
+        try:
+            response = get_http_client().get(url, extensions={"trace": timer.trace_sync}, **kwargs)
+        except httpx.HTTPError:
+            limiter.record_error()
+            self.metrics.request(host, 0, 0, timer.timings())
+            raise
+        timings = timer.timings()
+        limiter.record(response.status_code, timings["total"], response.headers.get('Retry-After'))
+        self.metrics.request(host, response.status_code, len(response.content), timings)
+        return response
+
+    def retry_delay(self, attempt):
+        """attempt번째 재시도 전 대기 시간 - 지수 백오프 상한 안에서 무작위 (동시에 실패한 요청들이 흩어지도록)"""
+        return random.uniform(0, self.retry_backoff * (2 ** (attempt - 1)))
+
+    def _get_retried(self, send):
+        """
+        send()로 요청을 보내고, 연결 오류나 잠시 뒤 성공할 수 있는 응답(429/5xx)이면 max_retries번까지 다시 보냄
+        
+        재시도 전에는 목록 페이지 수집처럼 지터를 섞은 지수 백오프로 기다리고, Retry-After는 호스트 속도 제한기가
+        다음 요청을 그 시각까지 미뤄 지킨다. 할당량 초과(errorCode 010) 응답은 다시 보내지 않고 그대로 반환하며,
+        send()가 올린 QuotaExhaustedError도 그대로 올린다. 마지막 시도의 응답을 반환한다.
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                backoff = self.retry_delay(attempt)
+                self.metrics.sleep(backoff, "backoff")
+                time.sleep(backoff)
+            try:
+                response = send()
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+                continue
+            if response.status_code not in RETRYABLE_STATUS_CODES or self._is_quota_error(response):
+                break
+        return response
+
+    def _credential_pool(self):
+        """사용할 API 키 {client_id: client_secret} - 키를 직접 지정한 경우(부하 테스트 등)도 포함"""
+        if self.client_id and self.client_id not in self.credentials:
+            return dict(self.credentials, **{self.client_id: self.client_secret})
+        return self.credentials
+
+    def _api_headers(self, client_id, client_secret):
+        return {
+            'X-Naver-Client-Id': client_id,
+            'X-Naver-Client-Secret': client_secret,
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+    def _api_pages(self, max_results, display):
+        """max_results개를 받기 위한 API 요청 목록 [(start, display)]"""
+        pages = []
+        for offset in range(0, max_results, display):
+            if offset + 1 > API_MAX_START:
+                break
+            pages.append((offset + 1, min(display, max_results - offset)))
+        return pages
+
+    def _cached(self, source, *parts):
+        """검색 캐시 조회 - (키, 값) 반환 (없으면 값은 None)
+        
+        parts는 source별 요청 구분값 - 'api'/'web'은 (검색어, start, display, sort),
+        'stock'은 (키워드 목록, 날짜, 최대 개수)
+        """
+        key = SearchCache.make_key(source, self.search_base_url if source == 'web' else self.api_base_url, *parts)
+        value = self.search_cache.get(key)
+        self.cache_counts["hits" if value is not None else "misses"] += 1
+        return key, value
+
+    def _fetch_api_items(self, query, start, display):
+        """검색 API 한 페이지의 items (캐시 우선) - 실패하면 예외"""
+        return self._fetch_api_page(query, start, display)['items']
+
+    def _fetch_api_page(self, query, start, display):
+        """
+        검색 API 한 페이지 {"total": 전체 결과 수, "items": items} (캐시 우선) - 실패하면 예외
+        
+        할당량 기록에서 오늘 가장 적게 쓴 키를 골라 요청하고, 그 키가 하루 한도 초과로 거절되면
+        기록에 남기고 다음 키로 다시 요청한다. 남은 키가 없으면 QuotaExhaustedError.
+        """
+        key, page = self._cached('api', query, start, display, 'date')
+        # items만 저장하던 이전 형식의 캐시 항목은 다시 요청
+        if isinstance(page, dict):
+            return page
+        
+        params = {
+            'query': query,
+            'display': display,
+            'start': start,
+            'sort': 'date'
+        }
+        credentials = self._credential_pool()
+        rejected = set()
+        
+        def send():
+            # 재시도도 호출 한 건이므로 시도마다 키를 골라 차감
+            client_id = self.quota.acquire([cid for cid in credentials if cid not in rejected], self.interactive)
+            if client_id is None:
+                raise QuotaExhaustedError("오늘 검색 API 호출 한도를 모두 사용했습니다")
+            return self._get(self.base_url, self.request_delay, params=params,
+                             headers=self._api_headers(client_id, credentials[client_id]))
+        
+        while True:
+            response = self._get_retried(send)
+            if self._is_quota_error(response):
+                client_id = response.request.headers['X-Naver-Client-Id']
+                self.quota.mark_exhausted(client_id)
+                rejected.add(client_id)
+                continue
+            break
+        if response.status_code != 200:
+            raise Exception(f"API 요청 실패: {response.status_code}")
+        data = response.json()
+        items = data.get('items', [])
+        page = {'total': data.get('total', start + len(items) - 1), 'items': items}
+        self.search_cache.put(key, page, self.search_cache_ttl)
+        return page
+
+    @staticmethod
+    def _is_quota_error(response):
+        """키의 하루 호출 한도를 넘겨 거절된 응답인지 (초당 한도 초과 012 등은 재시도 대상)"""
+        if response.status_code != 429:
+            return False
+        try:
+            return response.json().get('errorCode') == API_QUOTA_ERROR_CODE
+        except ValueError:
+            return False
+
+    def _fetch_search_page(self, query, start):
+        """웹 검색 결과 페이지 HTML (캐시 우선) - 실패하면 예외"""
+        key, content = self._cached('web', query, start, 10, '')
+        if content is not None:
+            return content
+        
+        search_url = f"{self.search_base_url}/search.naver?where=news&query={quote(query)}&start={start}"
+        response = self._get_retried(
+            lambda: self._get(search_url, self.search_page_delay, headers=self.headers, timeout=30)
+        )
+        response.raise_for_status()
+        content = response.text
+        self.search_cache.put(key, content, self.search_cache_ttl)
+        return content
+
+    def cache_summary(self):
+        """검색 캐시 적중 현황 (이 검색기 / 프로세스 전체)"""
+        return dict(self.search_cache.stats(), **{f"search_{name}": count for name, count in self.cache_counts.items()})
+
+    def quota_summary(self):
+        """오늘 API 할당량 사용 현황 - 키 수, 사용한 호출 수, 남은 호출 수"""
+        credentials = self._credential_pool()
+        usage = self.quota.usage()
+        return {
+            "credentials": len(credentials),
+            "calls": sum(usage.get(client_id, {}).get("calls", 0) for client_id in credentials),
+            "remaining": self.quota.remaining(credentials, self.interactive)
+        }
+
+    def _map_pages(self, func, pages):
+        """
+        pages의 각 항목으로 func를 동시에 호출하고 결과를 pages 순서대로 반환
+
+        하나라도 실패하면 (순서상 가장 앞의) 예외를 그대로 올린다.
+        """
+        if len(pages) <= 1:
+            return [func(*page) for page in pages]
+        with ThreadPoolExecutor(max_workers=min(self.search_concurrency, len(pages))) as executor:
+            return list(executor.map(lambda page: func(*page), pages))
+
+    def _stream_pages(self, func, pages):
+        """
+        pages의 각 항목으로 func를 동시에 호출하며 결과를 pages 순서대로 하나씩 내보냄
+        
+        search_concurrency개까지만 앞서 요청하므로, 받는 쪽이 중간에 멈추면(마지막 페이지 등)
+        그 뒤 페이지는 요청하지 않고 대기 중인 요청은 취소한다.
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.search_concurrency, len(pages))))
+        futures = deque()
+        try:
+            pending = iter(pages)
+            for page in islice(pending, self.search_concurrency):
+                futures.append(executor.submit(func, *page))
+            while futures:
+                result = futures.popleft().result()
+                for page in islice(pending, 1):
+                    futures.append(executor.submit(func, *page))
+                yield result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _first_page(self, predicate, lo, hi, hint=None):
+        """
+        lo <= i < hi에서 predicate(i)가 처음 참이 되는 i (모두 거짓이면 hi) - predicate는 i에 대해 단조
+        
+        hint가 있으면 그 페이지를 먼저 확인하고 바로 옆 페이지를 확인해, 힌트가 맞으면 두 번에 끝낸다.
+        나머지는 이진 탐색.
+        """
+        mid = hint
+        follow_hint = hint is not None
+        while lo < hi:
+            if mid is None or not lo <= mid < hi:
+                mid = (lo + hi) // 2
+            found = predicate(mid)
+            if found:
+                hi = mid
+            else:
+                lo = mid + 1
+            mid = (mid - 1 if found else mid + 1) if follow_hint else None
+            follow_hint = False
+        return lo
+
+    def locate_date_window(self, query, target_date, display, fetch_items, needed_pages):
+        """
+        최신순 검색 결과에서 target_date 기사가 실린 페이지 구간 찾기
+        
+        결과는 발행일 내림차순이므로 start 오프셋(페이지)을 이진 탐색해
+        target_date 이전 기사가 처음 나오는 페이지(구간 시작)와 target_date보다 오래된 기사만 있는
+        첫 페이지(구간 끝)를 찾는다. 구간 끝은 몫을 채우는 데 필요한 needed_pages 안에서만 찾는다.
+        지난번에 찾은 경계가 있으면 그 페이지부터 확인하고, 없으면 첫 페이지부터 확인한다.
+        
+        Args:
+            query: 검색어
+            target_date: 찾을 발행일 (date)
+            display: 페이지 크기
+            fetch_items: fetch_items(start, display) -> 그 페이지의 API items (탐색한 페이지를 다시 쓰도록 캐시)
+            needed_pages: 구간 시작부터 받을 최대 페이지 수
+        
+        Returns:
+            list: 구간에 속한 페이지 [(start, display)]
+        """
+        pages = self._api_pages(API_MAX_START + display - 1, display)
+        cache_key = (query, target_date.strftime("%Y%m%d"))
+        with _date_window_lock:
+            cached = _date_window_cache.get(cache_key)
+        start_hint, end_hint = ((cached[0] - 1) // display, (cached[1] - 1) // display) if cached else (0, None)
+        
+        def page_dates(index):
+            dates = []
+            for item in fetch_items(*pages[index]):
+                try:
+                    dates.append(datetime.strptime(item.get("pubDate", ""), API_DATE_FORMAT).date())
+                except ValueError:
+                    continue
+            return dates
+        
+        def reaches_window(index):
+            dates = page_dates(index)
+            return not dates or min(dates) <= target_date
+        
+        def past_window(index):
+            dates = page_dates(index)
+            return not dates or max(dates) < target_date
+        
+        first = self._first_page(reaches_window, 0, len(pages), start_hint)
+        last = self._first_page(past_window, first, min(len(pages), first + needed_pages), end_hint)
+        
+        with _date_window_lock:
+            _date_window_cache[cache_key] = (first * display + 1, last * display + 1)
+        return pages[first:last]
 
     def search_news(self, keyword, max_results=100):
         """네이버 뉴스 검색 - API 우선, 실패시 크롤링"""
-        if self.api_available:
-            try:
-                return self.search_news_api(keyword, max_results)
-            except Exception as e:
-                st.warning(f"API 검색 실패: {e}. 웹 크롤링으로 전환합니다.")
+        try:
+            if self.api_available:
+                try:
+                    return self.search_news_api(keyword, max_results)
+                except QuotaExhaustedError:
+                    st.info("ℹ️ 오늘 검색 API 호출 한도를 모두 사용해 웹 크롤링으로 검색합니다.")
+                    return self.search_news_fallback(keyword, max_results)
+                except Exception as e:
+                    st.warning(f"API 검색 실패: {e}. 웹 크롤링으로 전환합니다.")
+                    return self.search_news_fallback(keyword, max_results)
+            else:
                 return self.search_news_fallback(keyword, max_results)
-        else:
-            return self.search_news_fallback(keyword, max_results)
+        finally:
+            self.metrics.flush()
 
     def search_news_api(self, keyword, max_results=100):
-        """네이버 뉴스 API를 사용한 검색"""
-        articles = []
+        """
+        네이버 뉴스 API를 사용한 검색 (SEARCH_COLUMNS DataFrame)
+        
+        첫 페이지의 전체 결과 수(total)를 보고 실제로 있는 나머지 페이지만 동시에 요청해 순서대로 이어 붙인다.
+        없는 페이지를 요청해 API 할당량을 쓰지 않도록 한다.
+        """
         display = min(self.max_articles_per_request, 100)
+        pages = self._api_pages(max_results, display)
         
-        total_requests = (max_results + display - 1) // display
+        def fetch_page(start, current_display):
+            items = self._fetch_api_items(keyword, start, current_display)
+            return items, len(items) < current_display
         
-        for i in range(total_requests):
-            start = i * display + 1
-            current_display = min(display, max_results - len(articles))
-            
-            if current_display <= 0:
-                break
-            
-            params = {
-                'query': keyword,
-                'display': current_display,
-                'start': start,
-                'sort': 'date'
-            }
-            
-            headers = {
-                'X-Naver-Client-Id': self.client_id,
-                'X-Naver-Client-Secret': self.client_secret,
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(self.base_url, params=params, headers=headers)
-            
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get('items', [])
-                
-                for item in items:
-                    article = {
-                        'title': self.clean_html_tags(item['title']),
-                        'link': item['link'],
-                        'description': self.clean_html_tags(item['description']),
-                        'pubDate': self.format_date(item['pubDate']),
-                        'source': self.extract_source(item.get('link', ''))
-                    }
-                    articles.append(article)
-                
-                if len(items) < current_display:
-                    break
-                    
-            else:
-                raise Exception(f"API 요청 실패: {response.status_code}")
-            
-            time.sleep(self.request_delay)
+        items = []
+        if pages:
+            first_page = self._fetch_api_page(keyword, *pages[0])
+            items.extend(first_page['items'])
+            if len(first_page['items']) >= pages[0][1]:
+                rest = [(start, current_display) for start, current_display in pages[1:] if start <= first_page['total']]
+                for page_items, last_page in self._map_pages(fetch_page, rest):
+                    items.extend(page_items)
+                    # 그사이 결과 수가 줄어 모자란 페이지가 나오면 뒤 페이지는 버림
+                    if last_page:
+                        break
         
-        return articles[:max_results]
+        # 모든 페이지를 한 번에 정리
+        parse_started = time.monotonic()
+        articles = normalize_search_items(items[:max_results])
+        self.metrics.parse(time.monotonic() - parse_started, len(articles), query=keyword, start=1)
+        return articles
 
     def search_news_fallback(self, keyword, max_results=100):
-        """API 키가 없는 경우 웹 크롤링으로 대체"""
+        """API 키가 없는 경우 웹 크롤링으로 대체 - 검색 페이지를 동시에 요청해 순서대로 이어 붙임 (SEARCH_COLUMNS DataFrame)"""
         articles = []
         
+        def fetch_page(page_num, start):
+            try:
+                content = self._fetch_search_page(keyword, start)
+                
+                parse_started = time.monotonic()
+                page_articles = parse_search_page(content)
+                self.metrics.parse(time.monotonic() - parse_started, len(page_articles), query=keyword, start=start)
+                return page_num, page_articles, None
+            except Exception as e:
+                return page_num, None, e
+        
         try:
             page_size = 10
             total_pages = (max_results + page_size - 1) // page_size
+            pages = [(page_num, (page_num - 1) * page_size + 1) for page_num in range(1, total_pages + 1)]
             
-            for page_num in range(1, total_pages + 1):
-                if len(articles) >= max_results:
+            for page_num, page_articles, error in self._stream_pages(fetch_page, pages):
+                if error is not None:
+                    st.warning(f"페이지 {page_num} 크롤링 중 오류: {error}")
+                    continue
+                # 결과가 없는 페이지에서 끝 - 뒤 페이지 요청은 취소
+                if not page_articles:
                     break
                 
-                start = (page_num - 1) * page_size + 1
-                search_url = f"https://search.naver.com/search.naver?where=news&query={quote(keyword)}&start={start}"
-                
-                try:
-                    response = self.session.get(search_url, timeout=30)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    news_items = soup.find_all('div', class_='news_area')
-                    
-                    if not news_items:
-                        break
-                    
-                    for item in news_items:
-                        if len(articles) >= max_results:
-                            break
-                        
-                        try:
-                            title_element = item.find('a', class_='news_tit')
-                            if not title_element:
-                                continue
-                            
-                            title = title_element.get_text().strip()
-                            link = title_element.get('href')
-                            
-                            desc_element = item.find('div', class_='news_dsc')
-                            description = desc_element.get_text().strip() if desc_element else ''
-                            
-                            info_element = item.find('span', class_='info')
-                            source = ''
-                            pub_date = ''
-                            
-                            if info_element:
-                                info_text = info_element.get_text()
-                                parts = info_text.split('·')
-                                if len(parts) >= 2:
-                                    source = parts[0].strip()
-                                    pub_date = parts[-1].strip()
-                            
-                            articles.append({
-                                'title': title,
-                                'link': link,
-                                'description': description,
-                                'pubDate': pub_date,
-                                'source': source
-                            })
-                            
-                        except Exception as e:
-                            continue
-                    
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    st.warning(f"페이지 {page_num} 크롤링 중 오류: {e}")
-                    continue
+                articles.extend(page_articles)
+                if len(articles) >= max_results:
+                    break
                 
         except Exception as e:
             st.error(f"웹 크롤링 중 오류: {e}")
         
-        return articles[:max_results]
+        articles = pd.DataFrame(articles[:max_results], columns=SEARCH_COLUMNS)
+        pub_dates = parse_pub_dates(articles['pubDate'])
+        return articles.astype({'title': 'string', 'link': 'string', 'description': 'string', 'source': 'string'}).assign(
+            pubDate=pub_dates,
+            pubDateText=pub_date_texts(articles['pubDate'], pub_dates)
+        )
 
     def clean_html_tags(self, text):
         """HTML 태그 제거"""
         if not text:
             return ""
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', text)
+        return TAG_PATTERN.sub('', text)
 
     def format_date(self, date_str):
         """날짜 포맷 변환"""
-        try:
-            from email.utils import parsedate_to_datetime
-            dt = parsedate_to_datetime(date_str)
-            return dt.strftime('%Y.%m.%d %H:%M')
-        except:
-            return date_str
+        values = pd.Series([date_str])
+        return pub_date_texts(values, parse_pub_dates(values)).iloc[0]
 
     def extract_source(self, url):
         """URL에서 출처 추출"""
-        try:
-            if 'news.naver.com' in url:
-                return '네이버뉴스'
-            elif 'chosun.com' in url:
-                return '조선일보'
-            elif 'joongang.co.kr' in url:
-                return '중앙일보'
-            elif 'donga.com' in url:
-                return '동아일보'
-            elif 'hankyung.com' in url:
-                return '한국경제'
-            elif 'mk.co.kr' in url:
-                return '매일경제'
-            elif 'hani.co.kr' in url:
-                return '한겨레'
-            elif 'khan.co.kr' in url:
-                return '경향신문'
-            else:
-                return '기타'
-        except:
-            return '알 수 없음'
+        return publishers(pd.Series([url])).iloc[0]
 
     def search_stock_news(self, keywords, selected_date, max_articles):
-        """특징주 관련 뉴스 검색"""
+        """특징주 관련 뉴스 검색
+        
+        먼저 키워드마다 선택한 날짜의 기사가 실린 결과 페이지 구간을 찾고(locate_date_window),
+        키워드 × 구간 페이지를 한꺼번에 동시에 요청한다(앞 페이지부터). 도착하는 대로
+        키워드별로 페이지 순서를 지켜 제목 중복을 거르며 키워드별 몫을 채운다.
+        모든 키워드가 몫을 채우거나 날짜 구간을 지나면 남은 요청은 취소하고 바로 반환한다.
+        재시도해도 받지 못한 페이지가 있으면 그 키워드의 뒤 페이지만 버리고 나머지 결과는 그대로 반환한다.
+        
+        지난 날짜의 결과는 더 바뀌지 않으므로, 모든 키워드를 끝까지 받았으면 결과 전체를
+        search_cache_history_ttl초 동안 캐시해 같은 검색은 API를 호출하지 않는다.
+        """
+        # 오프셋 페이지와 달리 지난 날짜의 최종 결과는 새 기사가 올라와도 그대로
+        cache_key = None
+        if selected_date < datetime.now(KST).date():
+            cache_key, cached = self._cached('stock', list(keywords), selected_date.strftime("%Y%m%d"), max_articles)
+            if cached is not None:
+                return [dict(result, pubDate=pd.Timestamp(result['pubDate'])) for result in cached]
+        
         try:
-            all_results = []
             display = min(self.max_articles_per_request, 100)  # API 한 번 호출당 최대 100개
             
             # 각 키워드별로 동일한 수의 기사 검색
             articles_per_keyword = max_articles // len(keywords)
+            # 구간 첫 페이지는 일부만 해당 날짜일 수 있으므로 한 페이지 더
+            needed_pages = (articles_per_keyword + display - 1) // display + 1
+            
+            # 구간 탐색에서 받은 페이지는 다시 요청하지 않음 {(키워드, start): items}
+            page_items = {}
             
-            # 각 키워드별로 검색
-            for keyword in keywords:
-                keyword_results = []
-                total_requests = (articles_per_keyword + display - 1) // display
+            def fetch_items(keyword, start, current_display):
+                if (keyword, start) not in page_items:
+                    # API 호출 (최신순 정렬)
+                    page_items[(keyword, start)] = self._fetch_api_items(keyword, start, current_display)
+                return page_items[(keyword, start)]
+            
+            # API 할당량이 바닥나거나 재시도해도 받지 못한 페이지가 있으면
+            # 그 키워드는 앞 페이지까지 받은 결과만 반환
+            quota_exhausted = []
+            failed_keywords = []
+            
+            def locate(keyword):
+                try:
+                    return self.locate_date_window(
+                        keyword, selected_date, display,
+                        lambda start, current_display: fetch_items(keyword, start, current_display),
+                        needed_pages
+                    )
+                except QuotaExhaustedError:
+                    quota_exhausted.append(keyword)
+                    return []
+                except Exception:
+                    failed_keywords.append(keyword)
+                    return []
+            
+            def fetch_page(keyword, start, current_display):
+                items = fetch_items(keyword, start, current_display)
                 
-                for i in range(total_requests):
-                    start = i * display + 1
-                    current_display = min(display, articles_per_keyword - len(keyword_results))
-                    
-                    if current_display <= 0:
-                        break
-                    
-                    # API 호출 파라미터 설정
-                    params = {
-                        "query": keyword,
-                        "display": current_display,
-                        "start": start,
-                        "sort": "date"   # 최신순 정렬
-                    }
-                    
-                    # API 호출
-                    headers = {
-                        'X-Naver-Client-Id': self.client_id,
-                        'X-Naver-Client-Secret': self.client_secret
-                    }
-                    
-                    response = requests.get(self.base_url, headers=headers, params=params)
-                    response.raise_for_status()
-                    
-                    # 응답 파싱
-                    data = response.json()
-                    items = data.get("items", [])
-                    
-                    # 기사 정보 추출
-                    for item in items:
-                        # HTML 태그 제거
-                        title = re.sub(r'<[^>]+>', '', item.get("title", ""))
-                        description = re.sub(r'<[^>]+>', '', item.get("description", ""))
-                        
-                        # 발행일 파싱
-                        pub_date = item.get("pubDate", "")
-                        try:
-                            pub_date = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S +0900")
-                            
-                            # 선택된 날짜와 일치하는 기사만 필터링
-                            if pub_date.date() != selected_date:
-                                continue
-                            
-                        except ValueError:
+                # 응답 파싱 - 페이지 전체를 DataFrame으로 정리한 뒤 선택된 날짜의 기사만
+                parse_started = time.monotonic()
+                page = normalize_search_items(items)
+                days = page['pubDate'].dt.normalize()
+                target_day = pd.Timestamp(selected_date)
+                reached_older = bool((days < target_day).any())
+                page_results = page.loc[days == target_day, ['title', 'description', 'link', 'pubDate']].assign(
+                    keyword=keyword  # 키워드 정보 추가
+                ).to_dict('records')
+                
+                self.metrics.parse(time.monotonic() - parse_started, len(items), query=keyword, start=start)
+                # 결과가 날짜 구간보다 오래된 기사로 넘어가면 그 키워드는 여기서 끝
+                return page_results, len(items) < current_display or reached_older
+            
+            keyword_results = {keyword: [] for keyword in keywords}
+            keyword_futures = {keyword: [] for keyword in keywords}
+            # 앞 페이지를 기다리는 결과 {키워드: {페이지 번호: 결과}}와 다음에 반영할 페이지 번호
+            waiting_pages = {keyword: {} for keyword in keywords}
+            next_page = {keyword: 0 for keyword in keywords}
+            seen_titles = set()
+            
+            executor = ThreadPoolExecutor(max_workers=self.search_concurrency)
+            try:
+                # 키워드별 날짜 구간 탐색 (키워드끼리는 동시에)
+                windows = dict(zip(keywords, executor.map(locate, keywords))) if articles_per_keyword > 0 else {}
+                open_keywords = {keyword for keyword in keywords if windows.get(keyword)}
+                
+                futures = {}
+                for index in range(max((len(pages) for pages in windows.values()), default=0)):
+                    for keyword in keywords:
+                        if index >= len(windows[keyword]):
                             continue
+                        future = executor.submit(fetch_page, keyword, *windows[keyword][index])
+                        futures[future] = (keyword, index)
+                        keyword_futures[keyword].append(future)
+                
+                for future in as_completed(futures):
+                    keyword, index = futures[future]
+                    if keyword not in open_keywords or future.cancelled():
+                        continue
+                    try:
+                        waiting_pages[keyword][index] = future.result()
+                    except QuotaExhaustedError:
+                        # 앞 페이지까지만 반영하고 이 키워드는 여기서 끝
+                        quota_exhausted.append(keyword)
+                        waiting_pages[keyword][index] = ([], True)
+                    except Exception:
+                        failed_keywords.append(keyword)
+                        waiting_pages[keyword][index] = ([], True)
+                    
+                    # 순서가 된 페이지부터 반영 - 중복 제목은 건너뛰고 키워드별 몫까지만
+                    while keyword in open_keywords and next_page[keyword] in waiting_pages[keyword]:
+                        page_results, last_page = waiting_pages[keyword].pop(next_page[keyword])
+                        next_page[keyword] += 1
+                        for result in page_results:
+                            if len(keyword_results[keyword]) >= articles_per_keyword:
+                                break
+                            if result['title'] not in seen_titles:
+                                seen_titles.add(result['title'])
+                                keyword_results[keyword].append(result)
                         
-                        keyword_results.append({
-                            "title": title,
-                            "description": description,
-                            "link": item.get("link", ""),
-                            "pubDate": pub_date,
-                            "keyword": keyword  # 키워드 정보 추가
-                        })
+                        if (last_page or next_page[keyword] == len(windows[keyword])
+                                or len(keyword_results[keyword]) >= articles_per_keyword):
+                            open_keywords.discard(keyword)
+                            for pending in keyword_futures[keyword]:
+                                pending.cancel()
                     
-                    if len(items) < current_display:
+                    if not open_keywords:
                         break
-                    
-                    time.sleep(self.request_delay)  # API 호출 간격 조절
-                
-                # 각 키워드별 결과를 전체 결과에 추가
-                all_results.extend(keyword_results[:articles_per_keyword])
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
             
-            # 중복 제거 (제목 기준)
-            seen_titles = set()
-            unique_results = []
-            for result in all_results:
-                if result['title'] not in seen_titles:
-                    seen_titles.add(result['title'])
-                    unique_results.append(result)
+            if quota_exhausted:
+                st.warning("⚠️ 오늘 검색 API 호출 한도를 모두 사용해 일부 키워드는 찾은 만큼만 표시합니다.")
+            if failed_keywords:
+                st.warning(f"⚠️ 일부 검색 결과 페이지를 받지 못해 다음 키워드는 찾은 만큼만 표시합니다: "
+                           f"{', '.join(dict.fromkeys(failed_keywords))}")
+            
+            unique_results = [result for keyword in keywords for result in keyword_results[keyword]]
             
             # 발행일 기준으로 정렬
             unique_results.sort(key=lambda x: x['pubDate'], reverse=True)
+            unique_results = unique_results[:max_articles]  # 요청한 최대 개수만큼 반환
             
-            return unique_results[:max_articles]  # 요청한 최대 개수만큼 반환
+            if cache_key and not quota_exhausted and not failed_keywords:
+                self.search_cache.put(
+                    cache_key,
+                    [dict(result, pubDate=result['pubDate'].isoformat()) for result in unique_results],
+                    self.search_cache_history_ttl
+                )
+            return unique_results
             
         except Exception as e:
             st.error(f"뉴스 검색 중 오류 발생: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+        finally:
+            self.metrics.flush()
\ No newline at end of file
@@ -1,31 +1,176 @@
 import warnings
 import logging
+import asyncio
 import concurrent.futures
+import multiprocessing
+import os
+import queue
+import random
 import threading
+from collections import namedtuple
 from datetime import datetime
+from urllib.parse import urlparse
+import httpx
 import requests
 from bs4 import BeautifulSoup
 import streamlit as st
 import time
 import re
+from util.rate_limiter import get_host_limiter
+from util.metrics import CrawlMetrics, RequestTimer
+from util.page_cache import PageCache
+from util.paper_health import CircuitOpenError, PaperHealth
+import news_parser
 
 # Streamlit 경고 숨기기
 warnings.filterwarnings("ignore", message=".*missing ScriptRunContext.*")
 logging.getLogger("streamlit").setLevel(logging.ERROR)
 
+# 목록 페이지 파싱용 프로세스 풀 (프로세스 전체에서 공유)
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool(processes):
+    """파싱 프로세스 풀 반환 - Streamlit 서버 스레드에서 fork하지 않도록 spawn 사용"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=processes,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _parse_pool
+
+def reset_parse_pool():
+    """깨진 프로세스 풀 폐기 - 다음 호출 때 새로 생성"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+
+DEFAULT_NEWS_BASE_URL = "https://news.naver.com"
+DEFAULT_ARTICLE_BASE_URL = "https://n.news.naver.com"
+
+# 수집 진행 이벤트
+#   kind='page': 페이지 하나 파싱 완료 (page=페이지 번호, articles=그 페이지의 기사)
+#   kind='paper': (신문사, 날짜) 단위 하나 완료 (articles=단위 전체 기사, error=실패 원인 또는 None)
+CrawlEvent = namedtuple('CrawlEvent', ['kind', 'paper_name', 'oid', 'date', 'page', 'articles', 'error'])
+
+# 잠시 뒤 다시 시도하면 성공할 수 있는 응답
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class CrawlTruncated(Exception):
+    """단위 수집이 중간 페이지에서 끊김 - 함께 넘어오는 기사는 page 이전 페이지까지의 결과"""
+
+    def __init__(self, page, cause):
+        super().__init__(f"{page}페이지에서 중단: {cause}")
+        self.page = page
+        self.cause = cause
+
+class CrawlDeadlineExceeded(TimeoutError):
+    """수집 제한 시간이 지나 단위 수집을 끝내지 못함"""
+
+def unit_status(error):
+    """단위 수집 결과 상태 - 'complete' / 'truncated' / 'skipped' / 'failed'"""
+    if error is None:
+        return 'complete'
+    if isinstance(error, CrawlTruncated):
+        return 'truncated'
+    if isinstance(error, CircuitOpenError):
+        return 'skipped'
+    return 'failed'
+
+def unit_status_label(error):
+    """수집 현황 표에 표시할 상태 문구"""
+    status = unit_status(error)
+    if status == 'complete':
+        return "✅ 완료"
+    if status == 'truncated':
+        return f"⚠️ {error.page}페이지에서 중단"
+    if status == 'skipped':
+        return "⛔ 건너뜀 (연속 실패)"
+    return "❌ 실패"
+
 class NewsCollector:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, base_url=None):
         # 설정값 로드
         try:
+            self.news_base_url = st.secrets["app_settings"].get("news_base_url", DEFAULT_NEWS_BASE_URL)
             self.request_delay_min = st.secrets["app_settings"].get("request_delay_min", 0.5)
             self.request_delay_max = st.secrets["app_settings"].get("request_delay_max", 1.0)
             self.max_pages_per_newspaper = st.secrets["app_settings"].get("max_pages_per_newspaper", 10)
-            self.max_workers = st.secrets["app_settings"].get("max_workers", 3)
+            self.max_concurrency = st.secrets["app_settings"].get("max_concurrency", 16)
+            self.max_connections_per_host = st.secrets["app_settings"].get("max_connections_per_host", 8)
+            self.prefetch_pages = st.secrets["app_settings"].get("prefetch_pages", 4)
+            self.rate_limit_max = st.secrets["app_settings"].get("rate_limit_max", 20)
+            self.page_cache_dir = st.secrets["app_settings"].get("page_cache_dir", ".cache/pages")
+            self.page_cache_ttl = st.secrets["app_settings"].get("page_cache_ttl", 300)
+            self.parse_processes = st.secrets["app_settings"].get("parse_processes", min(4, os.cpu_count() or 1))
+            self.parse_queue_size = st.secrets["app_settings"].get("parse_queue_size", 32)
+            self.crawl_deadline = st.secrets["app_settings"].get("crawl_deadline", 60)
+            self.max_retries = st.secrets["app_settings"].get("max_retries", 2)
+            self.retry_backoff = st.secrets["app_settings"].get("retry_backoff", 0.5)
+            self.hedge_delay = st.secrets["app_settings"].get("hedge_delay", 3.0)
+            self.paper_health_path = st.secrets["app_settings"].get("paper_health_path", ".cache/paper_health.db")
+            self.breaker_failure_threshold = st.secrets["app_settings"].get("breaker_failure_threshold", 3)
+            self.breaker_cooldown = st.secrets["app_settings"].get("breaker_cooldown", 1800)
+            self.metrics_dir = st.secrets["app_settings"].get("metrics_dir", ".cache/metrics")
+            self.article_base_url = st.secrets["app_settings"].get("article_base_url", DEFAULT_ARTICLE_BASE_URL)
+            self.body_rate_limit_max = st.secrets["app_settings"].get("body_rate_limit_max", 40)
         except:
+            self.news_base_url = DEFAULT_NEWS_BASE_URL
             self.request_delay_min = 0.5
             self.request_delay_max = 1.0
             self.max_pages_per_newspaper = 10
-            self.max_workers = 3
+            self.max_concurrency = 16
+            self.max_connections_per_host = 8
+            self.prefetch_pages = 4
+            self.rate_limit_max = 20
+            self.page_cache_dir = ".cache/pages"
+            self.page_cache_ttl = 300
+            self.parse_processes = min(4, os.cpu_count() or 1)
+            self.parse_queue_size = 32
+            self.crawl_deadline = 60
+            self.max_retries = 2
+            self.retry_backoff = 0.5
+            self.hedge_delay = 3.0
+            self.paper_health_path = ".cache/paper_health.db"
+            self.breaker_failure_threshold = 3
+            self.breaker_cooldown = 1800
+            self.metrics_dir = ".cache/metrics"
+            self.article_base_url = DEFAULT_ARTICLE_BASE_URL
+            self.body_rate_limit_max = 40
+
+        self.crawl_stats = {}
+        self.metrics = None
+
+        # 테스트용 서버 등 다른 주소로 수집할 때 사용
+        if base_url:
+            self.news_base_url = base_url
+            self.article_base_url = base_url
+        self.news_base_url = self.news_base_url.rstrip('/')
+        self.article_base_url = self.article_base_url.rstrip('/')
+
+        # 목록 페이지 디스크 캐시 (지난 날짜는 영구, 오늘자는 TTL + 조건부 요청)
+        # 네이버가 아닌 주소의 페이지는 호스트별 하위 디렉터리에 따로 보관
+        if self.page_cache_dir and self.news_base_url != DEFAULT_NEWS_BASE_URL:
+            self.page_cache_dir = os.path.join(self.page_cache_dir, urlparse(self.news_base_url).netloc.replace(':', '_'))
+        self.page_cache = PageCache(self.page_cache_dir, self.page_cache_ttl) if self.page_cache_dir else None
+
+        # 신문사별 수집 상태와 차단기 - 계속 실패하는 신문사는 한동안 건너뜀
+        self.paper_health = None
+        if self.paper_health_path and self.news_base_url == DEFAULT_NEWS_BASE_URL:
+            self.paper_health = PaperHealth(
+                self.paper_health_path, self.breaker_failure_threshold, self.breaker_cooldown
+            )
+
+        # 호스트별 적응형 속도 제한 - request_delay_min/max를 시작/최저 속도로 사용
+        self.rate_limit_settings = {
+            'initial_rate': 1 / max(self.request_delay_min, 0.01),
+            'min_rate': 1 / max(self.request_delay_max, 0.01),
+            'max_rate': self.rate_limit_max
+        }
 
         # 세션 설정 - 더 빠른 설정
         self.session = requests.Session()
@@ -45,157 +190,637 @@ class NewsCollector:
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
+    def build_list_url(self, oid, date, page_num=1):
+        """신문 게재 기사 목록 페이지 URL"""
+        base_url = f"{self.news_base_url}/main/list.naver?mode=LPOD&mid=sec&oid={oid}&listType=paper&date={date}"
+        if page_num > 1:
+            return f"{base_url}&page={page_num}"
+        return base_url
+
+    def build_article_url(self, oid, aid):
+        """기사 본문 페이지 URL - 같은 기사의 여러 URL 형태를 (oid, aid) 하나로 모음"""
+        return f"{self.article_base_url}/mnews/article/{oid:03d}/{aid:010d}"
+
+    def limiter_for(self, url):
+        """URL 호스트의 공유 속도 제한기"""
+        return get_host_limiter(urlparse(url).netloc, **self.rate_limit_settings)
+
+    def cached_list_page(self, oid, date, page_num):
+        """디스크 캐시 조회 - (바로 쓸 수 있는 본문, 캐시 항목)"""
+        if not self.page_cache:
+            return None, None
+        cached = self.page_cache.get(oid, date, page_num)
+        if cached and self.page_cache.is_fresh(cached[1], date):
+            return cached[0], cached
+        return None, cached
+
+    def store_list_page(self, oid, date, page_num, status_code, content, headers, cached):
+        """응답을 캐시에 반영하고 사용할 본문 반환 (304면 캐시된 본문)"""
+        if status_code == 304 and cached:
+            self.page_cache.touch(oid, date, page_num, cached[1])
+            return cached[0]
+        if self.page_cache:
+            self.page_cache.put(oid, date, page_num, content, headers)
+        return content
+
+    def prefetch_until(self, page_num):
+        """page_num을 처리할 때 미리 요청해 둘 마지막 페이지 번호"""
+        return min(page_num + self.prefetch_pages - 1, self.max_pages_per_newspaper)
+
+    def retry_delay(self, attempt):
+        """attempt번째 재시도 전 대기 시간 - 지수 백오프 상한 안에서 무작위 (동시에 실패한 요청들이 흩어지도록)"""
+        return random.uniform(0, self.retry_backoff * (2 ** (attempt - 1)))
+
+    def parse_list_page(self, content):
+        """목록 페이지 HTML에서 기사 추출 - 게재 기사 영역이 없으면 빈 리스트 (lxml 빠른 파서)"""
+        return news_parser.parse_list_page(content)
+
+    def parse_list_page_bs(self, content):
+        """BeautifulSoup 기반 기존 파서 - 빠른 파서의 기준 결과 비교용"""
+        soup = BeautifulSoup(content, 'lxml')
+        main_content = soup.find('div', class_='list_body newsflash_body')
+        if not main_content:
+            return []
+        return self.extract_articles_fast(main_content)
+
+    def _run_sync(self, coro):
+        """코루틴을 동기 방식으로 실행 - 이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
     def crawl_paper_articles(self, oid, date, max_pages=None):
         """기존 app.py와 호환성을 위한 메서드"""
         return self.crawl_single_paper("", oid, date)
 
     def crawl_multiple_papers(self, paper_list, date):
-        """여러 신문사를 병렬로 크롤링"""
+        """여러 신문사를 병렬로 크롤링 (비동기 엔진의 동기 래퍼)"""
         import pandas as pd
         
         all_articles = []
+        st.markdown("**📊 수집 현황**")
+        status_rows = []
+        status_placeholder = st.empty()
+        status_placeholder.dataframe(
+            pd.DataFrame(columns=["신문사", "상태", "수집 기사"]),
+            use_container_width=True,
+            hide_index=True
+        )
         
-        # 결과 테이블을 위한 데이터
-        results_data = []
-        table_placeholder = st.empty()
+        # 신문사가 끝날 때마다 행 목록으로 표만 다시 그림 (수집 중 다른 화면 요소는 그대로)
+        for event in self.iter_papers(paper_list, date):
+            if event.kind != 'paper':
+                continue
+            all_articles.extend(event.articles)
+            status_rows.append({
+                "신문사": event.paper_name,
+                "상태": unit_status_label(event.error),
+                "수집 기사": f"{len(event.articles)}개"
+            })
+            status_placeholder.dataframe(pd.DataFrame(status_rows), use_container_width=True, hide_index=True)
         
-        # 병렬 처리
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_paper = {
-                executor.submit(self.crawl_single_paper_silent, paper_name, oid, date): (paper_name, oid)
-                for paper_name, oid in paper_list
-            }
-            
-            for future in concurrent.futures.as_completed(future_to_paper):
-                paper_name, oid = future_to_paper[future]
+        return all_articles
+
+    def iter_papers(self, paper_list, date, refresh=False):
+        """여러 신문사의 하루치 기사를 수집하며 CrawlEvent를 도착 순서대로 내보내는 제너레이터
+        
+        화면용 수집이므로 crawl_deadline초가 지나면 그때까지의 결과만 내보낸다.
+        refresh면 지난 수집 이후 새로 생기거나 바뀐 기사만 내보낸다 (crawl_units_async 참고).
+        """
+        units = [(paper_name, oid, date) for paper_name, oid in paper_list]
+        return self.iter_units(units, deadline=self.crawl_deadline, refresh=refresh)
+
+    def iter_units(self, units, deadline=None, refresh=False):
+        """aiter_units의 동기 버전
+        
+        수집은 별도 스레드의 이벤트 루프에서 돌고 이벤트는 큐로 넘어온다.
+        호출한 쪽(Streamlit 스크립트 스레드)은 이벤트를 받는 대로 화면에 그릴 수 있고,
+        중간에 반복을 멈추면 남은 수집은 취소된다.
+        """
+        events = queue.Queue()
+        done = object()
+        loop = asyncio.new_event_loop()
+        
+        async def pump():
+            async for event in self.aiter_units(units, deadline, refresh):
+                events.put(event)
+        
+        crawl_task = loop.create_task(pump())
+        
+        def run():
+            try:
+                loop.run_until_complete(crawl_task)
+            except BaseException as e:
+                events.put(e)
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+                events.put(done)
+        
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = events.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            if thread.is_alive():
                 try:
-                    articles = future.result(timeout=30)
-                    for article in articles:
-                        article['newspaper'] = paper_name
-                    all_articles.extend(articles)
-                    
-                    results_data.append({
-                        "신문사": paper_name,
-                        "상태": "✅ 완료",
-                        "수집 기사": f"{len(articles)}개"
-                    })
-                    
-                except Exception as e:
-                    results_data.append({
-                        "신문사": paper_name,
-                        "상태": "❌ 실패",
-                        "수집 기사": "0개"
-                    })
-                
-                # 테이블 업데이트
-                if results_data:
-                    df = pd.DataFrame(results_data)
-                    with table_placeholder:
-                        st.markdown("**📊 수집 현황**")
-                        st.dataframe(df, use_container_width=True, hide_index=True)
+                    loop.call_soon_threadsafe(crawl_task.cancel)
+                except RuntimeError:
+                    # 그 사이 루프가 이미 끝난 경우
+                    pass
+                thread.join()
+
+    async def aiter_units(self, units, deadline=None, refresh=False):
+        """(신문사명, oid, 날짜) 단위 목록을 수집하며 CrawlEvent를 도착 순서대로 내보내는 비동기 이터레이터"""
+        events = asyncio.Queue()
+        
+        def on_page_done(paper_name, oid, date, page_num, articles):
+            events.put_nowait(CrawlEvent('page', paper_name, oid, date, page_num, articles, None))
+        
+        def on_unit_done(paper_name, oid, date, articles, error):
+            events.put_nowait(CrawlEvent('paper', paper_name, oid, date, None, articles, error))
         
+        async def run():
+            try:
+                await self.crawl_units_async(units, on_unit_done, on_page_done, deadline, refresh)
+            finally:
+                events.put_nowait(None)
+        
+        crawl_task = asyncio.create_task(run())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            # 수집 중 예외 전달
+            await crawl_task
+        finally:
+            if not crawl_task.done():
+                crawl_task.cancel()
+                try:
+                    await crawl_task
+                except asyncio.CancelledError:
+                    pass
+
+    async def crawl_multiple_papers_async(self, paper_list, date, on_paper_done=None):
+        """여러 신문사의 하루치 기사를 비동기로 수집
+        
+        on_paper_done(paper_name, oid, articles, error)는 신문사 하나가 끝날 때마다 호출된다.
+        """
+        all_articles = []
+        
+        def on_unit_done(paper_name, oid, unit_date, articles, error):
+            all_articles.extend(articles)
+            if on_paper_done:
+                on_paper_done(paper_name, oid, articles, error)
+        
+        units = [(paper_name, oid, date) for paper_name, oid in paper_list]
+        await self.crawl_units_async(units, on_unit_done, deadline=self.crawl_deadline)
         return all_articles
 
-    def crawl_single_paper(self, paper_name, oid, date):
-        """단일 신문사 크롤링 (병렬 처리용)"""
-        articles = []
+    async def crawl_units_async(self, units, on_unit_done, on_page_done=None, deadline=None, refresh=False):
+        """(신문사명, oid, 날짜) 단위 목록을 전역/호스트별 동시성 제한 아래에서 비동기로 수집
         
-        try:
-            base_url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={oid}&listType=paper&date={date}"
+        요청(I/O)과 파싱(CPU)은 두 단계로 나뉜다. 받은 HTML은 크기가 정해진 큐에 쌓이고
+        파싱 프로세스 풀이 기사 dict로 바꾼다. 큐가 가득 차면 요청 쪽이 기다리고,
+        동시에 진행하는 단위 수도 max_concurrency로 제한하므로 여러 날짜를 한꺼번에
+        수집해도 메모리에 쌓이는 HTML 양이 일정하게 유지된다.
+        
+        on_unit_done(paper_name, oid, date, articles, error)는 단위 하나가 끝날 때마다,
+        on_page_done(paper_name, oid, date, page_num, articles)는 페이지 하나를 파싱할 때마다 호출된다.
+        
+        실패한 요청은 지수 백오프로 max_retries번까지 다시 시도하고, hedge_delay초 안에 응답이 없으면
+        같은 요청을 하나 더 보내 먼저 온 응답을 쓴다. deadline(초)이 주어지면 그 시각에 남은 요청을
+        취소하고 단위마다 그때까지의 결과를 넘긴다. error는 완료면 None, 중간 페이지에서 끊겼으면
+        CrawlTruncated(기사는 그 앞 페이지까지), 첫 페이지부터 실패했으면 원인 예외다.
+        
+        paper_health가 있으면 차단기가 닫힌 신문사부터 수집하고, 차단기가 열린 신문사는
+        요청 없이 CircuitOpenError로 넘긴다.
+        
+        파싱한 페이지마다 기사 지문을 페이지 캐시에 남긴다. refresh면 캐시 유효 시간과 관계없이
+        첫 페이지부터 한 장씩 다시 받아 지난 지문과 비교하고, 지문이 같은 페이지가 나오면 멈춘다.
+        이때 단위의 기사는 지난 수집 때 없던(새로 생기거나 제목/면이 바뀐) 기사뿐이다.
+        지난 지문이 없는 단위는 평소처럼 전부 수집한다.
+        """
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        unit_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits = {}
+        
+        # 실행 통계 (요청한 페이지, 캐시에서 읽은 페이지, 받은 바이트)
+        stats = {'pages_fetched': 0, 'pages_cached': 0, 'bytes': 0, 'retries': 0, 'hedged': 0}
+        self.crawl_stats = stats
+        # 요청 단계별 시간, 파싱 시간, 대기 시간 (실행 후 요약 표시와 Prometheus/JSONL 내보내기용)
+        metrics = CrawlMetrics("crawl", self.metrics_dir)
+        self.metrics = metrics
+        
+        # 신문사 상태 기록용 단위별 페이지 응답 시간
+        health = self.paper_health
+        unit_latencies = {}
+        if health:
+            units = sorted(units, key=lambda unit: health.priority(unit[1]))
+        
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + deadline if deadline else None
+        parse_queue = asyncio.Queue(maxsize=self.parse_queue_size)
+        
+        async def parse_worker():
+            while True:
+                content, future, fields = await parse_queue.get()
+                try:
+                    if future.done():
+                        continue
+                    parse_started = time.perf_counter()
+                    result = None
+                    if self.parse_processes > 0:
+                        try:
+                            parse_pool = get_parse_pool(self.parse_processes)
+                            result = await loop.run_in_executor(parse_pool, news_parser.parse_list_page, content)
+                        except concurrent.futures.process.BrokenProcessPool:
+                            reset_parse_pool()
+                    if result is None:
+                        result = self.parse_list_page(content)
+                    metrics.parse(time.perf_counter() - parse_started, len(result), **fields)
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                finally:
+                    parse_queue.task_done()
+        
+        parse_workers = [
+            asyncio.create_task(parse_worker())
+            for _ in range(max(1, self.parse_processes) * 2)
+        ]
+        
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency
+        )
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            limits=limits,
+            timeout=10,
+            follow_redirects=True
+        ) as client:
+            
+            async def request(url, headers, host_limit, limiter, sent=None):
+                host = urlparse(url).netloc
+                async with global_limit, host_limit:
+                    metrics.sleep(await limiter.acquire_async(), "rate_limit")
+                    if sent is not None:
+                        sent.set()
+                    timer = RequestTimer()
+                    try:
+                        response = await client.get(url, headers=headers, extensions={"trace": timer.trace})
+                    except httpx.HTTPError:
+                        limiter.record_error()
+                        metrics.request(host, 0, 0, timer.timings(), url=url)
+                        raise
+                    timings = timer.timings()
+                    limiter.record(response.status_code, timings["total"], response.headers.get('Retry-After'))
+                    metrics.request(host, response.status_code, len(response.content), timings, url=url)
+                return response
+            
+            async def request_hedged(url, headers, host_limit, limiter):
+                # 응답이 hedge_delay초 넘게 늦으면 같은 요청을 하나 더 보내 먼저 온 쪽을 사용
+                if self.hedge_delay <= 0:
+                    return await request(url, headers, host_limit, limiter)
+                sent = asyncio.Event()
+                sent_wait = asyncio.create_task(sent.wait())
+                tasks = [asyncio.create_task(request(url, headers, host_limit, limiter, sent))]
+                try:
+                    # 동시성/속도 제한 대기열에서 보낸 시간은 빼고 실제 응답 대기 시간만 잼
+                    await asyncio.wait({tasks[0], sent_wait}, return_when=asyncio.FIRST_COMPLETED)
+                    done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+                    if not done:
+                        stats['hedged'] += 1
+                        tasks.append(asyncio.create_task(request(url, headers, host_limit, limiter)))
+                    
+                    pending = set(tasks)
+                    error = None
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            if task.exception() is None:
+                                return task.result()
+                            error = task.exception()
+                    raise error
+                finally:
+                    sent_wait.cancel()
+                    for task in tasks:
+                        if not task.done():
+                            task.cancel()
+                        elif not task.cancelled():
+                            task.exception()
             
-            # 첫 페이지만 빠르게 테스트
-            response = self.session.get(base_url, timeout=10)
-            response.raise_for_status()
+            async def fetch(oid, date, page_num, revalidate=False):
+                # 캐시에 있으면 동시성 제한과 네트워크를 거치지 않음 (revalidate면 조건부 요청으로 다시 확인)
+                content, cached = self.cached_list_page(oid, date, page_num)
+                if content is not None and not revalidate:
+                    stats['pages_cached'] += 1
+                    return content
+                conditional_headers = self.page_cache.conditional_headers(cached[1]) if cached else {}
+                
+                url = self.build_list_url(oid, date, page_num)
+                host = urlparse(url).netloc
+                host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.max_connections_per_host))
+                limiter = self.limiter_for(url)
+                
+                for attempt in range(self.max_retries + 1):
+                    if attempt:
+                        stats['retries'] += 1
+                        backoff = self.retry_delay(attempt)
+                        metrics.sleep(backoff, "backoff")
+                        await asyncio.sleep(backoff)
+                    try:
+                        response = await request_hedged(url, conditional_headers, host_limit, limiter)
+                    except httpx.TransportError:
+                        if attempt == self.max_retries:
+                            raise
+                        continue
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        break
+                
+                stats['pages_fetched'] += 1
+                stats['bytes'] += len(response.content)
+                unit_latencies.setdefault((oid, date), []).append(response.elapsed.total_seconds())
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return self.store_list_page(oid, date, page_num, response.status_code, response.content, response.headers, cached)
             
-            soup = BeautifulSoup(response.content, 'lxml')
+            def record_health(paper_name, oid, date, articles, error):
+                status = unit_status(error)
+                latencies = unit_latencies.pop((oid, date), [])
+                # 건너뛴 단위와 전체 제한 시간에 걸린 단위는 신문사 탓이 아니므로 기록하지 않음
+                if status == 'skipped' or isinstance(error, CrawlDeadlineExceeded):
+                    return
+                health.record_result(
+                    oid, paper_name, status != 'failed', latencies,
+                    len(articles) if status == 'complete' and not refresh else None
+                )
             
-            # 신문 게재 기사 영역 확인
-            main_content = soup.find('div', class_='list_body newsflash_body')
-            if not main_content:
-                return articles
+            async def wait_page(task):
+                # 전체 제한 시각까지만 기다림
+                if deadline_at is None:
+                    return await task
+                try:
+                    return await asyncio.wait_for(task, max(0, deadline_at - loop.time()))
+                except asyncio.TimeoutError:
+                    raise CrawlDeadlineExceeded(f"수집 제한 시간 {deadline}초 초과") from None
+            
+            async def fetch_and_parse(oid, date, page_num, revalidate=False):
+                content = await fetch(oid, date, page_num, revalidate)
+                # 파싱 큐가 가득 차 있으면 여기서 대기 (역압)
+                future = loop.create_future()
+                await parse_queue.put((content, future, {'oid': oid, 'date': date, 'page': page_num}))
+                return await future
             
-            # 최대 10페이지까지 수집
-            for page_num in range(1, self.max_pages_per_newspaper + 1):
+            async def crawl_paper(paper_name, oid, date):
+                async with unit_limit:
+                    if deadline_at is not None and loop.time() >= deadline_at:
+                        return paper_name, oid, date, [], CrawlDeadlineExceeded(f"수집 제한 시간 {deadline}초 초과")
+                    if health and not health.allow(oid):
+                        return paper_name, oid, date, [], CircuitOpenError(f"{paper_name}: 연속 실패로 수집 차단 중")
+                    try:
+                        result = await crawl_paper_pages(paper_name, oid, date)
+                        if health:
+                            record_health(*result)
+                        return result
+                    finally:
+                        # 결과를 기록하지 않고 끝난 시험 수집(제한 시간 초과, 취소)도 차단기가 다시 시험하도록 풀어 줌
+                        if health:
+                            health.release(oid)
+            
+            async def crawl_paper_pages(paper_name, oid, date):
+                articles = []
+                pending = {}
+                next_page = 1
+                error = None
+                
+                # 새로 고침 - 지난 수집 때의 페이지별 지문과 비교해 바뀐 페이지까지만 수집
+                previous = self.page_cache.fingerprints(oid, date) if refresh and self.page_cache else {}
+                known_digests = {digest for entry in previous.values() for digest in entry['digests']}
                 try:
-                    if page_num > 1:
-                        page_url = f"{base_url}&page={page_num}"
-                        response = self.session.get(page_url, timeout=10)
-                        response.raise_for_status()
-                        soup = BeautifulSoup(response.content, 'lxml')
-                        main_content = soup.find('div', class_='list_body newsflash_body')
-                        if not main_content:
+                    for page_num in range(1, self.max_pages_per_newspaper + 1):
+                        # 앞 페이지들을 창 크기만큼 미리 요청 (새로 고침은 한 장씩)
+                        prefetch_until = page_num if previous else self.prefetch_until(page_num)
+                        while next_page <= prefetch_until:
+                            pending[next_page] = asyncio.create_task(fetch_and_parse(oid, date, next_page, bool(previous)))
+                            next_page += 1
+                        
+                        try:
+                            page_articles = await wait_page(pending.pop(page_num))
+                        except Exception as e:
+                            # 첫 페이지 실패는 신문사 실패, 이후 페이지 실패는 그 앞 페이지까지만 수집
+                            if page_num == 1:
+                                raise
+                            error = CrawlTruncated(page_num, e)
                             break
-                    
-                    page_articles = self.extract_articles_fast(main_content)
-                    if not page_articles:
-                        break
-                    
-                    articles.extend(page_articles)
-                    
-                    # 디버깅 정보 (신문사명이 있을 때만)
-                    if paper_name:
-                        st.info(f"{paper_name} 페이지 {page_num}: {len(page_articles)}개 기사 수집")
-                    
-                    # 짧은 지연
-                    if page_num < self.max_pages_per_newspaper:
-                        time.sleep(0.3)
                         
+                        if not page_articles:
+                            break
+                        
+                        digests = [news_parser.article_digest(article) for article in page_articles]
+                        fingerprint = news_parser.page_fingerprint(digests)
+                        if self.page_cache:
+                            self.page_cache.set_fingerprint(oid, date, page_num, fingerprint, digests)
+                        unchanged = bool(previous) and previous.get(page_num, {}).get('fingerprint') == fingerprint
+                        if previous:
+                            page_articles = [
+                                article for article, digest in zip(page_articles, digests)
+                                if digest not in known_digests
+                            ]
+                        
+                        for article in page_articles:
+                            article['newspaper'] = paper_name
+                        articles.extend(page_articles)
+                        if on_page_done and page_articles:
+                            on_page_done(paper_name, oid, date, page_num, page_articles)
+                        if unchanged:
+                            break
                 except Exception as e:
-                    if paper_name:
-                        st.warning(f"{paper_name} 페이지 {page_num} 수집 중 오류: {str(e)}")
-                    break
+                    return paper_name, oid, date, [], e
+                finally:
+                    # 마지막 페이지 이후로 미리 보낸 요청 취소 (이미 끝난 요청의 예외는 회수)
+                    for task in pending.values():
+                        if not task.done():
+                            task.cancel()
+                        elif not task.cancelled():
+                            task.exception()
+                
+                return paper_name, oid, date, articles, error
             
-            # 최종 수집 결과
-            if paper_name:
-                st.success(f"{paper_name}: 총 {len(articles)}개 기사 수집 완료")
+            unit_tasks = [asyncio.create_task(crawl_paper(paper_name, oid, date)) for paper_name, oid, date in units]
+            try:
+                for future in asyncio.as_completed(unit_tasks):
+                    result = await future
+                    paper_name, oid, date, articles, error = result
+                    metrics.unit(unit_status(error), len(articles), paper=paper_name, oid=oid, date=date)
+                    on_unit_done(*result)
+            finally:
+                # 중간에 취소되면 남은 단위도 함께 취소
+                for task in unit_tasks:
+                    task.cancel()
+                for worker in parse_workers:
+                    worker.cancel()
+                await asyncio.gather(*unit_tasks, *parse_workers, return_exceptions=True)
+                if health:
+                    health.save()
+                metrics.flush()
+
+    def fetch_article_bodies(self, articles, store=None):
+        """fetch_article_bodies_async의 동기 래퍼"""
+        return self._run_sync(self.fetch_article_bodies_async(articles, store))
+
+    async def fetch_article_bodies_async(self, articles, store=None):
+        """기사 본문을 받아 각 기사에 'body'로 붙임
+        
+        본문은 (oid, aid)별로 저장소(ArticleStore)에 영구 보관하므로 저장된 기사는 다시 받지 않는다.
+        나머지는 max_concurrency개까지 동시에 요청하고(본문 호스트는 body_rate_limit_max까지 속도를 올림)
+        본문 추출은 파싱 프로세스 풀에서 한다. 끝내 받지 못한 기사는 'body'가 빈 문자열이다.
+        
+        Returns:
+            list: 'body'가 붙은 articles (같은 dict 객체)
+        """
+        urls = {}
+        for article in articles:
+            key = news_parser.key_of(article)
+            if key:
+                urls.setdefault(key, self.build_article_url(*key))
+        
+        bodies = store.load_article_bodies(urls) if store else {}
+        missing = [(key, url) for key, url in urls.items() if key not in bodies]
+        
+        metrics = CrawlMetrics("body", self.metrics_dir)
+        self.metrics = metrics
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # 본문 페이지는 건수가 많으므로 최고 속도의 절반에서 시작
+        limiter_settings = dict(
+            self.rate_limit_settings,
+            initial_rate=max(self.rate_limit_settings['initial_rate'], self.body_rate_limit_max / 2),
+            max_rate=self.body_rate_limit_max
+        )
+        
+        async def extract(content):
+            parse_started = time.perf_counter()
+            body = None
+            if self.parse_processes > 0:
+                try:
+                    parse_pool = get_parse_pool(self.parse_processes)
+                    body = await loop.run_in_executor(parse_pool, news_parser.parse_article_body, content)
+                except concurrent.futures.process.BrokenProcessPool:
+                    reset_parse_pool()
+            if body is None:
+                body = news_parser.parse_article_body(content)
+            metrics.parse(time.perf_counter() - parse_started, 1 if body else 0)
+            return body
+        
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            limits=limits,
+            timeout=10,
+            follow_redirects=True
+        ) as client:
             
-        except Exception as e:
+            async def fetch_body(key, url):
+                host = urlparse(url).netloc
+                limiter = get_host_limiter(host, **limiter_settings)
+                async with semaphore:
+                    for attempt in range(self.max_retries + 1):
+                        if attempt:
+                            backoff = self.retry_delay(attempt)
+                            metrics.sleep(backoff, "backoff")
+                            await asyncio.sleep(backoff)
+                        metrics.sleep(await limiter.acquire_async(), "rate_limit")
+                        timer = RequestTimer()
+                        try:
+                            response = await client.get(url, extensions={"trace": timer.trace})
+                        except httpx.TransportError:
+                            limiter.record_error()
+                            metrics.request(host, 0, 0, timer.timings(), url=url)
+                            if attempt == self.max_retries:
+                                raise
+                            continue
+                        timings = timer.timings()
+                        limiter.record(response.status_code, timings["total"], response.headers.get('Retry-After'))
+                        metrics.request(host, response.status_code, len(response.content), timings, url=url)
+                        if response.status_code not in RETRYABLE_STATUS_CODES:
+                            break
+                    response.raise_for_status()
+                return key, await extract(response.content)
+            
+            fetched = {}
+            tasks = [asyncio.create_task(fetch_body(key, url)) for key, url in missing]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    try:
+                        key, body = await future
+                    except Exception:
+                        continue
+                    # 본문 영역을 못 찾은 기사는 보관하지 않음 (마크업이 바뀌었으면 고친 뒤 다시 받도록)
+                    if body:
+                        fetched[key] = body
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # 중간에 멈춰도 받은 본문은 보관
+                if store and fetched:
+                    store.save_article_bodies(fetched)
+                metrics.flush()
+        
+        bodies.update(fetched)
+        for article in articles:
+            article['body'] = bodies.get(news_parser.key_of(article), '')
+        return articles
+
+    def crawl_single_paper(self, paper_name, oid, date):
+        """단일 신문사 크롤링 (비동기 엔진의 동기 래퍼) - 신문사명이 있으면 진행 상황을 화면에 표시"""
+        articles = []
+        
+        def on_page_done(paper_name, oid, unit_date, page_num, page_articles):
+            # 디버깅 정보 (신문사명이 있을 때만)
             if paper_name:
-                st.warning(f"{paper_name} 수집 중 오류: {str(e)}")
+                st.info(f"{paper_name} 페이지 {page_num}: {len(page_articles)}개 기사 수집")
+        
+        def on_unit_done(paper_name, oid, unit_date, unit_articles, error):
+            articles.extend(unit_articles)
+            if not paper_name:
+                return
+            if error is not None:
+                st.warning(f"{paper_name}: {unit_status_label(error)} ({error})")
+            # 최종 수집 결과
+            st.success(f"{paper_name}: 총 {len(unit_articles)}개 기사 수집 완료")
         
+        self._run_sync(self.crawl_units_async([(paper_name, oid, date)], on_unit_done, on_page_done))
         return articles
 
     def crawl_single_paper_silent(self, paper_name, oid, date):
-        """단일 신문사 크롤링 (Streamlit 호출 없는 버전)"""
+        """단일 신문사 크롤링 (Streamlit 호출 없는 버전, 비동기 엔진의 동기 래퍼)
+        
+        다음 페이지 미리 요청, 재시도, 캐시는 crawl_units_async가 처리한다.
+        실패하면 그 앞 페이지까지 수집한 기사를 반환한다.
+        """
         articles = []
         
-        try:
-            base_url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={oid}&listType=paper&date={date}"
-            
-            response = self.session.get(base_url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'lxml')
-            main_content = soup.find('div', class_='list_body newsflash_body')
-            if not main_content:
-                return articles
-            
-            for page_num in range(1, self.max_pages_per_newspaper + 1):
-                try:
-                    if page_num > 1:
-                        page_url = f"{base_url}&page={page_num}"
-                        response = self.session.get(page_url, timeout=10)
-                        response.raise_for_status()
-                        soup = BeautifulSoup(response.content, 'lxml')
-                        main_content = soup.find('div', class_='list_body newsflash_body')
-                        if not main_content:
-                            break
-                    
-                    page_articles = self.extract_articles_fast(main_content)
-                    if not page_articles:
-                        break
-                    
-                    articles.extend(page_articles)
-                    
-                    if page_num < self.max_pages_per_newspaper:
-                        time.sleep(0.3)
-                        
-                except Exception as e:
-                    break
-            
-        except Exception as e:
-            pass
+        def on_unit_done(paper_name, oid, unit_date, unit_articles, error):
+            articles.extend(unit_articles)
         
+        self._run_sync(self.crawl_units_async([(paper_name, oid, date)], on_unit_done))
         return articles
 
     def extract_articles_fast(self, main_content):
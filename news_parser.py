@@ -0,0 +1,317 @@
+import hashlib
+import re
+from collections.abc import Mapping
+from datetime import datetime
+
+from bs4 import UnicodeDammit
+from lxml import etree, html
+
+# 미리 컴파일한 패턴과 XPath - 페이지마다 다시 만들지 않음
+PAGE_INFO_PATTERN = re.compile(r'([A-Z]?\d+면)')
+MAIN_CONTENT_XPATH = etree.XPath("//div[@class='list_body newsflash_body'][1]")
+ARTICLE_LINK_XPATH = etree.XPath(".//a[contains(@href, 'mnews/article')]")
+NEWSPAPER_INFO_XPATH = etree.XPath(
+    "(.//span[contains(concat(' ', normalize-space(@class), ' '), ' newspaper_info ')])[1]"
+)
+FIRST_DD_XPATH = etree.XPath("(.//dd)[1]")
+
+# 기사 본문 페이지 (n.news.naver.com/mnews/article/{oid}/{aid})
+ARTICLE_KEY_PATTERN = re.compile(r'/article/(\d+)/(\d+)')
+# 신문 게재 기사 목록의 기사 URL - 이 형태면 (oid, aid, sid)만 보관하고 URL은 필요할 때 다시 만듦
+LIST_ARTICLE_URL_PATTERN = re.compile(
+    r'^(https://(?:n\.)?news\.naver\.com)/mnews/article/(\d{3})/(\d{10})(?:\?sid=(\d+))?$'
+)
+# 기사마다 호스트 문자열을 따로 들고 있지 않도록 공유하는 값
+ARTICLE_HOSTS = {host: host for host in ('https://news.naver.com', 'https://n.news.naver.com')}
+# 뉴스 검색 결과 페이지 (search.naver.com/search.naver?where=news) - class 속성에 해당 클래스가 있는 요소
+SEARCH_ITEM_XPATH = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' news_area ')]")
+SEARCH_TITLE_XPATH = etree.XPath("(.//a[contains(concat(' ', normalize-space(@class), ' '), ' news_tit ')])[1]")
+SEARCH_DESCRIPTION_XPATH = etree.XPath("(.//div[contains(concat(' ', normalize-space(@class), ' '), ' news_dsc ')])[1]")
+SEARCH_INFO_XPATH = etree.XPath("(.//span[contains(concat(' ', normalize-space(@class), ' '), ' info ')])[1]")
+ARTICLE_BODY_XPATH = etree.XPath("(//*[@id='dic_area' or @id='newsct_article' or @id='articleBodyContents'])[1]")
+BODY_NOISE_XPATH = etree.XPath(
+    ".//script | .//style | .//em[contains(@class, 'img_desc')] | .//*[contains(@class, 'vod_player_wrap')]"
+)
+
+
+class Article(Mapping):
+    """신문 게재 기사 한 건
+
+    기사 dict 대신 쓰는 작은 레코드. 기사는 URL에서 뽑은 정수 (oid, aid)로 구분하고
+    URL은 보관하지 않고 필요할 때 다시 만든다 (목록 URL 형태가 아니면 원래 URL을 그대로 보관).
+    기존 코드와 맞도록 dict처럼 읽고(article['title'], article.get('body'), pd.DataFrame(articles))
+    'newspaper', 'body' 등은 article['body'] = ... 로 붙인다.
+    키는 title, url, page, collected_at이고 newspaper, body는 값이 있을 때만 있다.
+    """
+
+    __slots__ = ('oid', 'aid', 'sid', '_host', '_url', 'title', 'page', 'collected_at', 'newspaper', 'body')
+    FIELDS = ('title', 'url', 'page', 'collected_at', 'newspaper', 'body')
+    OPTIONAL_FIELDS = ('newspaper', 'body')
+
+    def __init__(self, url, title, page='', collected_at=None, newspaper=None, body=None):
+        match = LIST_ARTICLE_URL_PATTERN.match(url)
+        if match:
+            self._host = ARTICLE_HOSTS[match.group(1)]
+            self.oid = int(match.group(2))
+            self.aid = int(match.group(3))
+            self.sid = int(match.group(4) or 0)
+            self._url = None
+        else:
+            key = article_key(url)
+            self.oid, self.aid = key if key else (0, 0)
+            self.sid = 0
+            self._host = None
+            self._url = url
+        self.title = title
+        self.page = page
+        self.collected_at = collected_at
+        self.newspaper = newspaper
+        self.body = body
+
+    @classmethod
+    def from_dict(cls, data):
+        """기사 dict(저장소 조회 결과 등)를 Article로 변환"""
+        return cls(data['url'], data['title'], data.get('page', ''), data.get('collected_at'),
+                   data.get('newspaper'), data.get('body'))
+
+    @property
+    def url(self):
+        if self._url is not None:
+            return self._url
+        url = f"{self._host}/mnews/article/{self.oid:03d}/{self.aid:010d}"
+        return f"{url}?sid={self.sid}" if self.sid else url
+
+    @property
+    def key(self):
+        """중복 확인용 키 - 기사 URL이면 (oid, aid) 정수 튜플, 아니면 URL"""
+        if self.aid:
+            return self.oid, self.aid
+        return self._url
+
+    def __getitem__(self, name):
+        if name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None or name not in self.OPTIONAL_FIELDS:
+                return value
+        raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        if name not in self.FIELDS or name == 'url':
+            raise KeyError(name)
+        setattr(self, name, value)
+
+    def __iter__(self):
+        for name in self.FIELDS:
+            if name not in self.OPTIONAL_FIELDS or getattr(self, name) is not None:
+                yield name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"Article({self.url!r}, {self.title!r}, page={self.page!r})"
+
+    def to_dict(self):
+        return dict(self)
+
+
+def to_document(content):
+    """HTML(bytes/str)을 lxml 문서로 변환 - 인코딩 판별은 BeautifulSoup과 동일하게"""
+    if isinstance(content, bytes):
+        content = UnicodeDammit(content, is_html=True).unicode_markup
+    try:
+        return html.document_fromstring(content)
+    except ValueError:
+        # 인코딩 선언이 들어 있는 XML 형식 문서는 bytes로만 파싱 가능
+        return html.document_fromstring(content.encode('utf-8'))
+
+
+def parse_list_page(content):
+    """
+    목록 페이지 HTML에서 신문 게재 기사 추출
+
+    NewsCollector.extract_articles_fast와 같은 결과를 내되,
+    문서를 한 번만 순회하고 면 정보는 컨테이너 단위로 한 번만 찾는다.
+
+    Returns:
+        list: Article 리스트 (게재 기사 영역이 없으면 빈 리스트)
+    """
+    main_content = MAIN_CONTENT_XPATH(to_document(content))
+    if not main_content:
+        return []
+    return extract_articles(main_content[0])
+
+
+def extract_articles(main_content):
+    """게재 기사 영역(lxml 요소)에서 기사 추출"""
+    articles = []
+    seen_keys = set()
+    page_info_memo = {}
+    collected_at = datetime.now().isoformat()
+
+    for link in ARTICLE_LINK_XPATH(main_content):
+        href = link.get('href')
+        title = link.text_content().strip()
+
+        if not href or not title or len(title) < 3:
+            continue
+
+        # 절대 URL로 변환
+        if href.startswith('/'):
+            href = f"https://news.naver.com{href}"
+
+        article = Article(href, title, extract_page_info(link, page_info_memo), collected_at)
+        if article.key in seen_keys:
+            continue
+        seen_keys.add(article.key)
+        articles.append(article)
+
+    return articles
+
+
+def extract_page_info(link, memo):
+    """
+    링크 주변에서 면 정보 추출 (NewsCollector.extract_page_info_comprehensive와 같은 탐색 순서)
+
+    Args:
+        link: 기사 링크 요소
+        memo: 컨테이너별 면 정보 캐시 - 같은 dt/dl/부모를 공유하는 링크끼리 재사용
+    """
+    parent = link.getparent()
+
+    # 1. 같은 dt 안에서 찾기 (일반 기사) / 2. dl > dd 구조에서 찾기 (톱기사)
+    dt_parent = dl_parent = None
+    for ancestor in link.iterancestors():
+        if ancestor.tag == 'dt' and dt_parent is None:
+            dt_parent = ancestor
+        elif ancestor.tag == 'dl' and dl_parent is None:
+            dl_parent = ancestor
+        if dt_parent is not None and dl_parent is not None:
+            break
+
+    if dt_parent is not None:
+        page_info = _page_info_in(dt_parent, memo)
+        if page_info:
+            return page_info
+
+    if dl_parent is not None:
+        dd = FIRST_DD_XPATH(dl_parent)
+        if dd:
+            page_info = _page_info_in(dd[0], memo)
+            if page_info:
+                return page_info
+
+    # 3. 상위 요소들에서 찾기 (최대 3단계 부모까지)
+    current = parent
+    for _ in range(3):
+        if current is None:
+            break
+        page_info = _page_info_in(current, memo)
+        if page_info:
+            return page_info
+        current = current.getparent()
+
+    return ""
+
+
+def _page_info_in(element, memo):
+    """element 안 첫 번째 newspaper_info의 면 정보 (없으면 None)"""
+    if element in memo:
+        return memo[element]
+
+    page_info = None
+    newspaper_info = NEWSPAPER_INFO_XPATH(element)
+    if newspaper_info:
+        page_match = PAGE_INFO_PATTERN.search(newspaper_info[0].text_content())
+        if page_match:
+            page_info = page_match.group(1)
+
+    memo[element] = page_info
+    return page_info
+
+
+def parse_search_page(content):
+    """
+    뉴스 검색 결과 페이지 HTML에서 기사 추출
+
+    Returns:
+        list: 기사 dict (title, link, description, pubDate, source) 리스트 - 검색 결과가 없으면 빈 리스트
+    """
+    articles = []
+    for item in SEARCH_ITEM_XPATH(to_document(content)):
+        title_element = SEARCH_TITLE_XPATH(item)
+        if not title_element:
+            continue
+        title_element = title_element[0]
+
+        description_element = SEARCH_DESCRIPTION_XPATH(item)
+        description = description_element[0].text_content().strip() if description_element else ''
+
+        # "언론사 · 발행일" 형태
+        source = ''
+        pub_date = ''
+        info_element = SEARCH_INFO_XPATH(item)
+        if info_element:
+            parts = info_element[0].text_content().split('·')
+            if len(parts) >= 2:
+                source = parts[0].strip()
+                pub_date = parts[-1].strip()
+
+        articles.append({
+            'title': title_element.text_content().strip(),
+            'link': title_element.get('href'),
+            'description': description,
+            'pubDate': pub_date,
+            'source': source
+        })
+
+    return articles
+
+
+def article_key(url):
+    """기사 URL의 (oid, aid) 정수 튜플 - 기사 URL이 아니면 None"""
+    match = ARTICLE_KEY_PATTERN.search(url or '')
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def key_of(article):
+    """기사(Article 또는 dict)의 (oid, aid) - 기사 URL이 아니면 None"""
+    if isinstance(article, Article):
+        return (article.oid, article.aid) if article.aid else None
+    return article_key(article.get('url'))
+
+
+def parse_article_body(content):
+    """
+    기사 페이지 HTML에서 본문 텍스트 추출
+
+    사진 설명, 스크립트, 동영상 영역은 빼고 줄바꿈(<br>)은 살린다.
+
+    Returns:
+        str: 본문 텍스트 (본문 영역이 없으면 빈 문자열)
+    """
+    body = ARTICLE_BODY_XPATH(to_document(content))
+    if not body:
+        return ''
+    body = body[0]
+
+    for element in BODY_NOISE_XPATH(body):
+        element.drop_tree()
+    for br in body.iter('br'):
+        br.tail = '\n' + (br.tail or '')
+
+    lines = (line.strip() for line in body.text_content().splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+def article_digest(article):
+    """기사 변경 확인용 짧은 지문 (URL, 제목, 면)"""
+    text = f"{article['url']}\t{article['title']}\t{article.get('page', '')}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def page_fingerprint(digests):
+    """페이지 지문 - 기사 지문 집합이 같으면 순서와 관계없이 같은 값"""
+    return hashlib.sha1(''.join(sorted(digests)).encode('ascii')).hexdigest()
@@ -0,0 +1,238 @@
+"""신문 게재 기사 예약 수집
+
+정해진 시각(KST)마다 오늘자 신문을 미리 수집해 기사 저장소에 넣는다.
+조간(경제신문/종합일간지)은 새벽에, 석간신문은 발행 이후에 수집하고
+아직 발행 전이거나 실패한 신문사는 retry_interval초 뒤에 retry_limit번까지 다시 시도한다.
+수집 탭은 저장소에 있는 (신문사, 날짜)를 바로 보여주고 빠진 신문사만 직접 수집한다.
+
+앱 설정에서 scheduler_enabled = true면 앱 프로세스의 백그라운드 스레드로 돌고,
+아래처럼 별도 프로세스로 띄울 수도 있다.
+
+사용 예:
+    python scheduler.py                    # 설정된 시각마다 수집 (계속 실행)
+    python scheduler.py --run-now          # 모든 작업을 지금 한 번 수집하고 종료
+    python scheduler.py --run-now --job 석간
+"""
+import argparse
+import logging
+import sys
+import threading
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+import streamlit as st
+
+from news_collector import NewsCollector, unit_status
+from util.article_store import ArticleStore
+
+KST = timezone(timedelta(hours=9))
+
+logger = logging.getLogger(__name__)
+
+# 예약 수집 작업 - time은 "HH:MM"(KST), categories는 get_newspaper_categories()의 카테고리명
+ScheduledJob = namedtuple("ScheduledJob", ["name", "time", "categories"])
+
+
+def load_schedule_settings():
+    """앱 설정의 예약 수집 값 - PaperScheduler 인자로 그대로 넘김"""
+    try:
+        settings = st.secrets["app_settings"]
+        morning_time = settings.get("schedule_morning", "05:30")
+        evening_time = settings.get("schedule_evening", "15:30")
+        retry_interval = settings.get("schedule_retry_interval", 900)
+        retry_limit = settings.get("schedule_retry_limit", 4)
+        db_path = settings.get("article_db_path", ".cache/articles.db")
+    except:
+        morning_time = "05:30"
+        evening_time = "15:30"
+        retry_interval = 900
+        retry_limit = 4
+        db_path = ".cache/articles.db"
+
+    return {
+        "jobs": [
+            ScheduledJob("조간", morning_time, ("경제신문", "종합일간지")),
+            ScheduledJob("석간", evening_time, ("석간신문",))
+        ],
+        "retry_interval": retry_interval,
+        "retry_limit": retry_limit,
+        "db_path": db_path
+    }
+
+
+class PaperScheduler:
+    """정해진 시각마다 오늘자 신문을 수집해 저장소에 넣는 백그라운드 작업
+
+    이미 수집 완료로 기록된 (신문사, 날짜)는 건너뛰므로 앱 사용자가 먼저 수집한 신문사는 다시 받지 않는다.
+    수집 전에 (신문사, 날짜)를 저장소에 수집 중으로 기록(claim_papers)하므로 예약 수집 프로세스 여러 개가
+    동시에 돌아도 같은 신문사는 한 곳에서만 받는다. 진행 상황은 logging으로 남긴다.
+    """
+
+    def __init__(self, jobs, retry_interval=900, retry_limit=4, db_path=".cache/articles.db"):
+        """
+        Args:
+            jobs: ScheduledJob 목록
+            retry_interval: 빠진 신문사를 다시 시도할 간격(초)
+            retry_limit: 예약 시각 한 번당 다시 시도할 최대 횟수
+            db_path: 기사 저장소(SQLite) 경로
+        """
+        self.jobs = list(jobs)
+        self.retry_interval = retry_interval
+        self.retry_limit = retry_limit
+        self.store = ArticleStore(db_path)
+        # 작업별 최근 실행 결과 {작업 이름: {"finished_at", "date", "collected", "missing"}}
+        self.last_runs = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """백그라운드 스레드에서 예약 수집 시작"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name="paper-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """예약 수집 중지 - 진행 중인 수집은 끝난 뒤에 멈춤"""
+        self._stop.set()
+
+    @staticmethod
+    def scheduled_at(job, day):
+        """day(KST 날짜)의 작업 예약 시각"""
+        hour, minute = (int(value) for value in job.time.split(":"))
+        return datetime(day.year, day.month, day.day, hour, minute, tzinfo=KST)
+
+    def run_forever(self):
+        """예약 시각마다 작업 실행 (stop()까지)
+
+        시작했을 때 오늘 예약 시각이 이미 지났으면 바로 한 번 실행해 빠진 신문사를 채운다.
+        """
+        today = datetime.now(KST).date()
+        # {작업 이름: (실행 시각, 수집 날짜, 재시도 횟수)}
+        pending = {job.name: (self.scheduled_at(job, today), today.strftime("%Y%m%d"), 0) for job in self.jobs}
+        jobs = {job.name: job for job in self.jobs}
+
+        while not self._stop.is_set():
+            name, (run_at, date, attempt) = min(pending.items(), key=lambda item: item[1][0])
+            wait = (run_at - datetime.now(KST)).total_seconds()
+            if wait > 0:
+                # 시계가 바뀌어도 크게 어긋나지 않도록 최대 1분씩 기다리며 다시 확인
+                self._stop.wait(min(wait, 60))
+                continue
+
+            job = jobs[name]
+            try:
+                missing = self.run_job(job, date)
+            except Exception:
+                logger.exception("예약 수집 %s %s 실패", job.name, date)
+                missing = None
+
+            now = datetime.now(KST)
+            if missing != [] and attempt < self.retry_limit:
+                pending[name] = (now + timedelta(seconds=self.retry_interval), date, attempt + 1)
+            else:
+                next_day = now.date() + timedelta(days=1)
+                pending[name] = (self.scheduled_at(job, next_day), next_day.strftime("%Y%m%d"), 0)
+
+    def run_job(self, job, date=None):
+        """
+        작업 하나 실행 - 작업 카테고리 신문사 중 아직 수집 완료되지 않았고 다른 프로세스가 수집 중이지 않은 것만 수집해 저장
+
+        Args:
+            job: ScheduledJob
+            date: 수집 날짜 (YYYYMMDD, 기본: 오늘 KST)
+
+        Returns:
+            list: 끝까지 수집하지 못한 신문사명 (발행 전이라 기사가 없거나 실패/중단)
+        """
+        date = date or datetime.now(KST).strftime("%Y%m%d")
+        collector = NewsCollector()
+        categories = collector.get_newspaper_categories()
+        papers = [
+            (paper_name, oid)
+            for category in job.categories
+            for paper_name, oid in categories.get(category, {}).items()
+        ]
+
+        owner = uuid.uuid4().hex
+        claimed_oids = self.store.claim_papers(date, [oid for _, oid in papers], owner)
+        units = [(paper_name, oid, date) for paper_name, oid in papers if oid in claimed_oids]
+        missing = []
+        collected = []
+
+        def on_unit_done(paper_name, oid, unit_date, articles, error):
+            unique_articles = list({article.key: article for article in articles}.values())
+            complete = unit_status(error) == "complete"
+            # 중간에 끊긴 신문사는 받은 기사만 저장하고 다음 시도에서 나머지를 수집
+            if unique_articles:
+                self.store.save_newspaper_articles(unit_date, paper_name, oid, unique_articles, complete=complete)
+            if unique_articles and complete:
+                collected.append(paper_name)
+            else:
+                missing.append(paper_name)
+
+        try:
+            if units:
+                collector._run_sync(collector.crawl_units_async(units, on_unit_done))
+        finally:
+            self.store.release_papers(date, claimed_oids, owner)
+            collector.close()
+
+        self.last_runs[job.name] = {
+            "finished_at": datetime.now(KST),
+            "date": date,
+            "collected": len(papers) - len(missing),
+            "missing": missing
+        }
+        logger.info("예약 수집 %s %s: 새로 수집 %d개, 저장됐거나 다른 곳에서 수집 중인 신문사 %d개, 빠진 신문사 %d개",
+                    job.name, date, len(collected), len(papers) - len(units), len(missing))
+        return missing
+
+    def describe(self):
+        """수집 탭에 표시할 예약/최근 실행 요약"""
+        parts = []
+        for job in self.jobs:
+            text = f"{job.name} {job.time}"
+            last_run = self.last_runs.get(job.name)
+            if last_run:
+                text += (f" (최근 {last_run['finished_at'].strftime('%m/%d %H:%M')}, "
+                         f"{last_run['collected']}개 신문사 저장")
+                text += f", 빠짐 {len(last_run['missing'])}개)" if last_run["missing"] else ")"
+            parts.append(text)
+        return "⏰ 예약 수집: " + " · ".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="신문 게재 기사 예약 수집")
+    parser.add_argument("--run-now", action="store_true", help="예약 시각을 기다리지 않고 지금 한 번 수집한 뒤 종료")
+    parser.add_argument("--job", help="--run-now로 실행할 작업 이름 (조간/석간, 기본: 전체)")
+    parser.add_argument("--date", help="--run-now로 수집할 날짜 (YYYYMMDD, 기본: 오늘)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # 요청마다 남는 httpx 로그는 숨김
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    scheduler = PaperScheduler(**load_schedule_settings())
+
+    if args.run_now:
+        jobs = [job for job in scheduler.jobs if not args.job or job.name == args.job]
+        if not jobs:
+            print(f"작업이 없습니다: {args.job}", file=sys.stderr)
+            return 1
+        missing = []
+        for job in jobs:
+            missing.extend(scheduler.run_job(job, args.date))
+        return 2 if missing else 0
+
+    logger.info(scheduler.describe())
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "benchmarks"))
+
+import pytest  # noqa: E402
+
+from fake_naver import FakeNaverConfig, start_server  # noqa: E402
+
+
+@pytest.fixture
+def fake_naver():
+    """네이버 대역 서버 - (설정, 기본 주소)"""
+    config = FakeNaverConfig(seed=1)
+    server, base_url = start_server(config)
+    try:
+        yield config, base_url
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,116 @@
+"""특징주 검색의 날짜 구간 탐색 (NaverNewsSearcher.locate_date_window, _first_page)"""
+import itertools
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import naver_search
+from naver_search import API_DATE_FORMAT, NaverNewsSearcher
+
+DISPLAY = 10
+NEWEST = date(2026, 10, 16)
+
+
+@pytest.fixture
+def searcher(tmp_path, monkeypatch):
+    # 할당량 기록, 지표 파일이 작업 디렉터리의 .cache에 생기므로 임시 디렉터리에서 생성
+    monkeypatch.chdir(tmp_path)
+    naver_search._date_window_cache.clear()
+    yield NaverNewsSearcher()
+    naver_search._date_window_cache.clear()
+
+
+class FakeResults:
+    """최신순 검색 결과 - day_counts[i]는 NEWEST로부터 i일 전 기사 수"""
+
+    def __init__(self, day_counts):
+        self.dates = [NEWEST - timedelta(days=offset)
+                      for offset, count in enumerate(day_counts) for _ in range(count)]
+        self.requests = []
+
+    def publish(self, count):
+        """가장 최근 날짜에 기사 count개 추가 - 기존 기사의 오프셋이 뒤로 밀림"""
+        self.dates[:0] = [NEWEST] * count
+
+    def fetch_items(self, start, display):
+        self.requests.append(start)
+        return [
+            {"title": f"기사 {index}",
+             "pubDate": datetime.combine(day, datetime.min.time()).strftime(API_DATE_FORMAT)}
+            for index, day in enumerate(self.dates[start - 1:start - 1 + display], start)
+        ]
+
+    def expected_pages(self, target):
+        """target 날짜 기사가 실린 페이지 [(start, display)]"""
+        offsets = [index for index, day in enumerate(self.dates) if day == target]
+        if not offsets:
+            return []
+        first, last = offsets[0] // DISPLAY, offsets[-1] // DISPLAY
+        return [(page * DISPLAY + 1, DISPLAY) for page in range(first, last + 1)]
+
+
+def locate(searcher, results, target, needed_pages=100):
+    return searcher.locate_date_window("특징주", target, DISPLAY, results.fetch_items, needed_pages)
+
+
+def test_first_page_matches_linear_scan_for_any_hint(searcher):
+    for size in range(0, 7):
+        for first_true in range(size + 1):
+            values = [index >= first_true for index in range(size)]
+            for lo, hi in itertools.combinations_with_replacement(range(size + 1), 2):
+                for hint in [None, *range(-1, size + 1)]:
+                    expected = next((index for index in range(lo, hi) if values[index]), hi)
+                    assert searcher._first_page(values.__getitem__, lo, hi, hint) == expected
+
+
+def test_first_page_checks_two_pages_when_hint_is_right(searcher):
+    checked = []
+
+    def predicate(index):
+        checked.append(index)
+        return index >= 37
+
+    assert searcher._first_page(predicate, 0, 100, 37) == 37
+    assert checked == [37, 36]
+
+
+@pytest.mark.parametrize("day_counts, target_offset", [
+    ([30, 30, 40], 1),     # 구간이 페이지 경계에서 시작하고 끝남
+    ([25, 30, 40], 1),     # 구간 시작과 끝이 페이지 중간
+    ([5, 1, 50], 1),       # 한 페이지 안에 있는 하루치
+    ([0, 40, 40], 0),      # 첫 페이지부터 시작
+    ([40, 40, 0], 1),      # 결과 끝까지 이어짐
+    ([20, 0, 30], 1),      # 기사가 없는 날
+])
+def test_window_is_exact_at_page_boundaries(searcher, day_counts, target_offset):
+    results = FakeResults(day_counts)
+    target = NEWEST - timedelta(days=target_offset)
+    assert locate(searcher, results, target) == results.expected_pages(target)
+
+
+def test_window_end_is_limited_to_needed_pages(searcher):
+    results = FakeResults([15, 200, 10])
+    target = NEWEST - timedelta(days=1)
+    assert locate(searcher, results, target, needed_pages=3) == results.expected_pages(target)[:3]
+
+
+def test_cache_hit_reuses_boundaries(searcher):
+    results = FakeResults([30, 45, 500])
+    target = NEWEST - timedelta(days=1)
+    assert locate(searcher, results, target) == results.expected_pages(target)
+    cold_requests = len(results.requests)
+
+    results.requests.clear()
+    assert locate(searcher, results, target) == results.expected_pages(target)
+    # 경계마다 힌트 페이지와 그 옆 페이지만 확인
+    assert len(results.requests) == 4 < cold_requests
+
+
+def test_cache_hit_is_corrected_after_new_articles_shift_offsets(searcher):
+    results = FakeResults([30, 45, 500])
+    target = NEWEST - timedelta(days=1)
+    locate(searcher, results, target)
+
+    results.publish(17)
+    assert locate(searcher, results, target) == results.expected_pages(target)
+    assert naver_search._date_window_cache[("특징주", target.strftime("%Y%m%d"))] == (41, 101)
@@ -0,0 +1,93 @@
+"""호스트별 적응형 속도 제한기 (util/rate_limiter.py)"""
+import time
+
+from util.rate_limiter import AdaptiveRateLimiter, get_host_limiter
+
+
+def make_limiter(**settings):
+    settings = dict({"initial_rate": 10.0, "min_rate": 1.0, "max_rate": 20.0}, **settings)
+    return AdaptiveRateLimiter(**settings)
+
+
+def test_429_halves_rate_once_per_second():
+    limiter = make_limiter()
+    limiter.record(429, 0.1)
+    assert limiter.rate == 5.0
+
+    # 동시에 돌아온 실패 응답들로 여러 번 깎이지 않음
+    limiter.record(429, 0.1)
+    limiter.record(503, 0.1)
+    assert limiter.rate == 5.0
+
+
+def test_server_error_slow_response_and_connection_error_back_off():
+    for signal in (lambda limiter: limiter.record(500, 0.1),
+                   lambda limiter: limiter.record(200, 5.0),
+                   lambda limiter: limiter.record_error()):
+        limiter = make_limiter()
+        signal(limiter)
+        assert limiter.rate == 5.0
+
+
+def test_rate_never_drops_below_min_rate():
+    limiter = make_limiter(initial_rate=1.5)
+    limiter.record(429, 0.1)
+    assert limiter.rate == 1.0
+
+
+def test_retry_after_blocks_next_request():
+    limiter = make_limiter(initial_rate=20.0, max_rate=20.0)
+    limiter.acquire()
+    limiter.record(429, 0.1, "0.4")
+
+    waited = limiter.acquire()
+    assert 0.3 <= waited < 1.0
+
+
+def test_invalid_retry_after_is_ignored():
+    limiter = make_limiter()
+    limiter.record(429, 0.1, "Wed, 21 Oct 2015 07:28:00 GMT")
+    assert limiter.blocked_until == 0.0
+    assert limiter.rate == 5.0
+
+
+def test_healthy_responses_recover_rate_up_to_max():
+    limiter = make_limiter(initial_rate=4.0, max_rate=6.0)
+    limiter.record(429, 0.1)
+    assert limiter.rate == 2.0
+
+    for _ in range(10):
+        limiter.record(200, 0.1)
+    # 응답마다 increase_step / rate 만큼 증가
+    assert 4.5 < limiter.rate <= 6.0
+
+    for _ in range(100):
+        limiter.record(200, 0.1)
+    assert limiter.rate == 6.0
+
+
+def test_requests_are_spaced_at_current_rate():
+    limiter = make_limiter(initial_rate=20.0, max_rate=20.0)
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    # 첫 요청은 버스트 토큰으로 바로, 나머지 5건은 1/20초 간격
+    assert 0.2 <= time.monotonic() - started < 0.6
+
+
+def test_queued_requests_follow_rate_change():
+    limiter = make_limiter(initial_rate=2.0, max_rate=50.0)
+    limiter.acquire()
+    # 2건/초로 줄 선 번호표가 대기 중에 바뀐 속도(40건/초)로 다시 계산됨
+    ticket = limiter._reserve()
+    assert limiter._wait_time(ticket) > 0.3
+    limiter.rate = 40.0
+    assert limiter._wait_time(ticket) < 0.05
+
+
+def test_host_limiter_is_shared_per_host():
+    first = get_host_limiter("limiter-test.example", initial_rate=3.0)
+    second = get_host_limiter("limiter-test.example", initial_rate=9.0)
+    assert first is second
+    assert first.rate == 3.0
+    assert get_host_limiter("other-limiter-test.example") is not first
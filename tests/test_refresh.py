@@ -0,0 +1,73 @@
+"""오늘자 신문 새로 고침 - 페이지 지문 비교 (NewsCollector.crawl_units_async(refresh=True))"""
+import pytest
+
+from fake_naver import ARTICLE_ID_PATTERN
+from news_collector import NewsCollector
+
+DATE = "20261016"
+OID = "009"
+
+
+@pytest.fixture
+def collector(fake_naver, tmp_path, monkeypatch):
+    # 페이지 캐시와 지표 파일이 작업 디렉터리의 .cache에 생기므로 임시 디렉터리에서 생성
+    monkeypatch.chdir(tmp_path)
+    collector = NewsCollector(base_url=fake_naver[1])
+    collector.parse_processes = 0
+    # 대역 서버는 속도 제한이 필요 없으므로 처음부터 최고 속도로
+    collector.rate_limit_settings["initial_rate"] = collector.rate_limit_max
+    yield collector
+    collector.close()
+
+
+def crawl(collector, refresh=False):
+    """단위 하나 수집 - (기사, error)"""
+    results = []
+    collector._run_sync(collector.crawl_units_async(
+        [("매일경제", OID, DATE)], lambda *result: results.append(result[3:]), refresh=refresh
+    ))
+    return results[0]
+
+
+def server_requests(config):
+    return config.counts["requests"]
+
+
+def test_unchanged_first_page_stops_after_one_request(collector, fake_naver):
+    config, _ = fake_naver
+    articles, error = crawl(collector)
+    assert error is None and articles
+
+    before = server_requests(config)
+    articles, error = crawl(collector, refresh=True)
+    assert error is None
+    assert articles == []
+    assert server_requests(config) - before == 1
+
+
+def test_changed_first_page_returns_only_new_articles(collector, fake_naver):
+    config, _ = fake_naver
+    crawl(collector)
+
+    # 1페이지 첫 기사를 다른 기사로 바꿈 (대역 서버는 기사 ID 뒤 7자리를 유지)
+    aid = ARTICLE_ID_PATTERN.search(config.list_pages[0]).group(1)
+    new_aid = aid[:-1] + str((int(aid[-1:]) + 1) % 10).encode()
+    config.list_pages[0] = config.list_pages[0].replace(aid, new_aid)
+
+    before = server_requests(config)
+    articles, error = crawl(collector, refresh=True)
+    assert error is None
+    assert len(articles) == 1
+    assert articles[0]["url"].split("?")[0].endswith(new_aid[3:].decode())
+    # 바뀐 1페이지와 그대로인 2페이지까지만 요청
+    assert server_requests(config) - before == 2
+
+
+def test_refresh_without_previous_fingerprints_collects_everything(collector, fake_naver):
+    config, _ = fake_naver
+    articles, error = crawl(collector, refresh=True)
+    assert error is None
+
+    collector.page_cache = None
+    full_articles, _ = crawl(collector)
+    assert len(articles) == len(full_articles) > 0
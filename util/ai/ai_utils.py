@@ -4,6 +4,9 @@ from typing import List, Dict
 from datetime import datetime
 import json
 
+# 보고서 프롬프트에 넣을 기사 본문 최대 글자 수
+BODY_PROMPT_CHARS = 600
+
 class AIManager:
     """AI 관련 기능을 관리하는 클래스"""
     
@@ -31,7 +34,11 @@ class AIManager:
             # 기사 데이터 준비
             articles_text = []
             for article in articles:
-                articles_text.append(f"제목: {article['title']}\n신문사: {article['newspaper']}\n링크: {article['url']}\n")
+                article_text = f"제목: {article['title']}\n신문사: {article['newspaper']}\n링크: {article['url']}\n"
+                # 본문을 받아 둔 기사는 앞부분을 함께 넘김 (프롬프트 길이 제한)
+                if article.get('body'):
+                    article_text += f"본문: {article['body'][:BODY_PROMPT_CHARS]}\n"
+                articles_text.append(article_text)
             
             # 프롬프트 생성
             prompt = AIManager._create_report_prompt(articles_text)
@@ -0,0 +1,280 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# load_article_bodies 한 번의 조회에 넣을 (oid, aid) 수 - 변수 2개씩, SQLite 기본 한도 999개 이내
+BODY_QUERY_CHUNK = 400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS newspaper_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    newspaper TEXT NOT NULL,
+    oid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    page TEXT,
+    collected_at TEXT,
+    UNIQUE (date, url)
+);
+CREATE INDEX IF NOT EXISTS idx_newspaper_articles_date_newspaper ON newspaper_articles (date, newspaper);
+CREATE INDEX IF NOT EXISTS idx_newspaper_articles_url ON newspaper_articles (url);
+CREATE INDEX IF NOT EXISTS idx_newspaper_articles_page ON newspaper_articles (page);
+
+CREATE TABLE IF NOT EXISTS collected_papers (
+    oid TEXT NOT NULL,
+    date TEXT NOT NULL,
+    newspaper TEXT NOT NULL,
+    article_count INTEGER NOT NULL,
+    collected_at TEXT NOT NULL,
+    PRIMARY KEY (oid, date)
+);
+
+CREATE TABLE IF NOT EXISTS paper_claims (
+    oid TEXT NOT NULL,
+    date TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    claimed_at REAL NOT NULL,
+    PRIMARY KEY (oid, date)
+);
+
+CREATE TABLE IF NOT EXISTS search_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    query TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    description TEXT,
+    pub_date TEXT,
+    source TEXT,
+    searched_at TEXT NOT NULL,
+    UNIQUE (query, link)
+);
+CREATE INDEX IF NOT EXISTS idx_search_articles_query ON search_articles (query);
+CREATE INDEX IF NOT EXISTS idx_search_articles_link ON search_articles (link);
+CREATE INDEX IF NOT EXISTS idx_search_articles_pub_date ON search_articles (pub_date);
+
+CREATE TABLE IF NOT EXISTS article_bodies (
+    oid INTEGER NOT NULL,
+    aid INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (oid, aid)
+);
+"""
+
+
+class ArticleStore:
+    """수집한 기사를 보관하는 SQLite 저장소
+
+    신문 게재 기사는 (신문사, 날짜) 단위로 수집 완료 여부를 기록해
+    이미 수집한 조합은 다시 크롤링하지 않도록 한다.
+    """
+
+    def __init__(self, db_path: str = ".cache/articles.db"):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Streamlit 세션마다 스레드가 다르므로 호출마다 연결을 연다
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """커밋(예외 시 롤백)한 뒤 닫히는 연결 - sqlite3 연결의 with 문은 닫지 않는다"""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def collected_oids(self, date: str) -> Set[str]:
+        """
+        해당 날짜에 수집을 마친 신문사 ID 목록
+
+        Args:
+            date: 발행일 (YYYYMMDD)
+
+        Returns:
+            Set[str]: 신문사 ID 집합
+        """
+        with self._connection() as conn:
+            rows = conn.execute("SELECT oid FROM collected_papers WHERE date = ?", (date,)).fetchall()
+        return {row["oid"] for row in rows}
+
+    def claim_papers(self, date: str, oids: Iterable[str], owner: str, ttl: float = 3600) -> Set[str]:
+        """
+        아직 수집하지 않았고 다른 곳에서 수집 중이지 않은 신문사를 골라 수집 중으로 기록
+
+        확인과 기록을 쓰기 트랜잭션 하나로 하므로 여러 프로세스가 동시에 불러도 한 곳만 가져간다.
+        ttl초가 지난 기록은 (수집하던 프로세스가 죽은 것으로 보고) 무시한다.
+
+        Args:
+            date: 발행일 (YYYYMMDD)
+            oids: 수집하려는 신문사 ID 목록
+            owner: 수집하는 쪽 식별자 (release_papers에 같은 값을 넘김)
+            ttl: 수집 중 기록의 유효 시간(초)
+
+        Returns:
+            Set[str]: 이번에 가져간 신문사 ID 집합
+        """
+        oids = list(dict.fromkeys(oids))
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM paper_claims WHERE claimed_at < ?", (now - ttl,))
+            taken = {
+                row["oid"] for row in conn.execute(
+                    "SELECT oid FROM collected_papers WHERE date = ? "
+                    "UNION SELECT oid FROM paper_claims WHERE date = ?", (date, date)
+                )
+            }
+            claimed = [oid for oid in oids if oid not in taken]
+            conn.executemany(
+                "INSERT INTO paper_claims (oid, date, owner, claimed_at) VALUES (?, ?, ?, ?)",
+                [(oid, date, owner, now) for oid in claimed]
+            )
+            conn.commit()
+            return set(claimed)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def release_papers(self, date: str, oids: Iterable[str], owner: str):
+        """claim_papers로 가져간 신문사의 수집 중 기록 삭제 (수집을 끝냈거나 실패했을 때)"""
+        with self._connection() as conn:
+            conn.executemany(
+                "DELETE FROM paper_claims WHERE oid = ? AND date = ? AND owner = ?",
+                [(oid, date, owner) for oid in oids]
+            )
+
+    def save_newspaper_articles(self, date: str, newspaper: str, oid: str, articles: List[Dict],
+                                complete: bool = True):
+        """
+        신문사 하나의 수집 결과 저장 후 수집 완료로 기록 - 이미 저장된 기사(같은 날짜, URL)는 제목과 면을 갱신
+
+        Args:
+            date: 발행일 (YYYYMMDD)
+            newspaper: 신문사명
+            oid: 신문사 ID
+            articles: 기사 데이터 리스트
+            complete: False면 기사만 저장하고 수집 완료로 기록하지 않음 (중간에 끊긴 수집 - 다음에 다시 수집)
+        """
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO newspaper_articles "
+                "(date, newspaper, oid, title, url, page, collected_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (date, url) DO UPDATE SET title = excluded.title, page = excluded.page",
+                [
+                    (date, newspaper, oid, article['title'], article['url'],
+                     article.get('page', ''), article.get('collected_at'))
+                    for article in articles
+                ]
+            )
+            if not complete:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO collected_papers (oid, date, newspaper, article_count, collected_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (oid, date, newspaper, len(articles), datetime.now().isoformat())
+            )
+
+    def load_newspaper_articles(self, date: str, newspapers: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        저장된 신문 게재 기사 조회
+
+        Args:
+            date: 발행일 (YYYYMMDD)
+            newspapers: 신문사명 목록 (None이면 전체)
+
+        Returns:
+            List[Dict]: 수집 순서대로 정렬된 기사 데이터 리스트
+        """
+        query = "SELECT title, url, page, collected_at, newspaper FROM newspaper_articles WHERE date = ?"
+        params = [date]
+        if newspapers is not None:
+            newspapers = list(newspapers)
+            query += f" AND newspaper IN ({', '.join('?' * len(newspapers))})"
+            params.extend(newspapers)
+        query += " ORDER BY id"
+
+        with self._connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def save_search_articles(self, query: str, articles: List[Dict]):
+        """
+        검색 결과 저장
+
+        Args:
+            query: 검색어
+            articles: 검색 결과 기사 데이터 리스트
+        """
+        searched_at = datetime.now().isoformat()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO search_articles "
+                "(query, title, link, description, pub_date, source, searched_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (query, article['title'], article['link'], article.get('description', ''),
+                     str(article.get('pubDate', '')), article.get('source', ''), searched_at)
+                    for article in articles
+                ]
+            )
+
+    def load_article_bodies(self, keys: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], str]:
+        """
+        저장된 기사 본문 조회
+
+        Args:
+            keys: (oid, aid) 목록
+
+        Returns:
+            Dict[Tuple[int, int], str]: 저장된 것만 {(oid, aid): 본문}
+        """
+        keys = list(dict.fromkeys(keys))
+        bodies = {}
+        with self._connection() as conn:
+            # 키마다 조회하지 않고 BODY_QUERY_CHUNK개씩 한 번에 조회 (SQLite 변수 개수 제한 안에서)
+            for index in range(0, len(keys), BODY_QUERY_CHUNK):
+                chunk = keys[index:index + BODY_QUERY_CHUNK]
+                rows = conn.execute(
+                    "SELECT oid, aid, body FROM article_bodies "
+                    f"WHERE (oid, aid) IN (VALUES {', '.join(['(?, ?)'] * len(chunk))})",
+                    [value for key in chunk for value in key]
+                )
+                for row in rows:
+                    bodies[(row["oid"], row["aid"])] = row["body"]
+        return bodies
+
+    def save_article_bodies(self, bodies: Dict[Tuple[int, int], str]):
+        """
+        기사 본문 저장 - 기사 본문은 바뀌지 않으므로 (oid, aid)별로 한 번만 받으면 된다
+
+        Args:
+            bodies: {(oid, aid): 본문}
+        """
+        fetched_at = datetime.now().isoformat()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO article_bodies (oid, aid, body, fetched_at) VALUES (?, ?, ?, ?)",
+                [(oid, aid, body, fetched_at) for (oid, aid), body in bodies.items()]
+            )
@@ -0,0 +1,32 @@
+import os
+import threading
+from typing import Union
+
+
+def atomic_write(path: str, data: Union[bytes, str]):
+    """
+    파일을 통째로 교체해 저장
+
+    임시 파일에 다 쓴 뒤 os.replace로 바꾸므로 여러 스레드나 프로세스가 같은 파일을 동시에 쓰거나 읽어도
+    반쯤 쓰인 파일이 보이지 않는다. 없는 디렉터리는 만든다.
+
+    Args:
+        path: 저장할 파일 경로
+        data: 내용 (str이면 UTF-8로 저장)
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
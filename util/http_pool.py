@@ -0,0 +1,33 @@
+import threading
+from typing import Optional
+
+import httpx
+
+# HTTP/2는 h2 패키지(httpx[http2])가 있을 때만 사용
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    프로세스 전체에서 공유하는 연결 풀 HTTP 클라이언트 반환
+
+    keep-alive 연결(가능하면 HTTP/2)을 재사용하므로 검색마다, 페이지마다 TLS 연결을 새로 맺지 않는다.
+    여러 스레드에서 함께 사용할 수 있다. 요청 헤더는 요청마다 넘긴다.
+    """
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60),
+                timeout=30,
+                follow_redirects=True
+            )
+        return _client
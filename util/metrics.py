@@ -0,0 +1,250 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from util.atomic_file import atomic_write
+
+KST = timezone(timedelta(hours=9))
+
+# 날짜(KST)별 추적 파일 이름
+TRACE_FILE_PATTERN = re.compile(r"^traces-\d{8}\.jsonl$")
+
+# 요청 단계 - connect에는 DNS 조회가 포함됨 (httpcore가 둘을 나눠 알려주지 않음)
+REQUEST_PHASES = ("connect", "tls", "ttfb", "download", "total")
+
+# 프로세스 전체 누적 지표 {(지표 이름, ((라벨, 값), ...)): 값} - Prometheus 내보내기용
+_totals: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+_totals_lock = threading.Lock()
+
+_METRIC_HELP = {
+    "newshunter_requests_total": ("counter", "HTTP 요청 수"),
+    "newshunter_response_bytes_total": ("counter", "받은 응답 본문 바이트"),
+    "newshunter_request_phase_seconds_total": ("counter", "요청 단계별 소요 시간 합계"),
+    "newshunter_parse_seconds_total": ("counter", "파싱 소요 시간 합계"),
+    "newshunter_pages_parsed_total": ("counter", "파싱한 페이지 수"),
+    "newshunter_articles_total": ("counter", "추출한 기사 수"),
+    "newshunter_sleep_seconds_total": ("counter", "속도 제한/재시도 대기 시간 합계"),
+    "newshunter_units_total": ("counter", "끝난 수집 단위 수"),
+}
+
+
+def _add_total(name: str, value: float, **labels):
+    key = (name, tuple(sorted((label, str(label_value)) for label, label_value in labels.items())))
+    with _totals_lock:
+        _totals[key] = _totals.get(key, 0.0) + value
+
+
+def prometheus_text() -> str:
+    """누적 지표를 Prometheus 텍스트 형식으로 변환"""
+    with _totals_lock:
+        items = sorted(_totals.items())
+
+    lines = []
+    current = None
+    for (name, labels), value in items:
+        if name != current:
+            metric_type, help_text = _METRIC_HELP.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            current = name
+        label_text = ",".join(f'{label}="{label_value}"' for label, label_value in labels)
+        lines.append(f"{name}{{{label_text}}} {value:.6g}" if label_text else f"{name} {value:.6g}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str):
+    """누적 지표를 node_exporter textfile 수집기용 파일로 저장"""
+    atomic_write(path, prometheus_text())
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    /metrics 주소로 누적 지표를 내보내는 HTTP 서버를 백그라운드 스레드에서 시작
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown()으로 종료)
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class RequestTimer:
+    """httpx 요청의 단계별 시간 측정
+
+    client.get(url, extensions={"trace": timer.trace})로 넘기면
+    httpcore가 알려주는 연결/TLS/헤더/본문 이벤트 시각을 기록한다.
+    동기 클라이언트(httpx.Client)에는 timer.trace_sync를 넘긴다.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+
+    def trace_sync(self, event_name: str, info: Dict):
+        # http11/http2 접두사를 떼고 "receive_response_headers.complete" 형태로 기록
+        self.marks[event_name.split(".", 1)[1]] = time.perf_counter()
+
+    async def trace(self, event_name: str, info: Dict):
+        self.trace_sync(event_name, info)
+
+    def _span(self, start: str, end: str) -> float:
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return 0.0
+
+    def timings(self) -> Dict[str, float]:
+        """단계별 소요 시간(초) - 연결을 재사용했으면 connect/tls는 0"""
+        return {
+            "connect": self._span("connect_tcp.started", "connect_tcp.complete"),
+            "tls": self._span("start_tls.started", "start_tls.complete"),
+            "ttfb": self._span("send_request_headers.started", "receive_response_headers.complete"),
+            "download": self._span("receive_response_body.started", "receive_response_body.complete"),
+            "total": time.perf_counter() - self.started
+        }
+
+
+class CrawlMetrics:
+    """수집/검색 한 번의 지표 기록
+
+    요청 단계별 시간, 응답 크기, 파싱 시간, 기사 수, 대기 시간을 모은다.
+    값은 실행 요약(summary)과 프로세스 누적 지표에 함께 더해지고,
+    이벤트는 날짜(KST)별 JSONL 추적 파일(traces-YYYYMMDD.jsonl)에 한 줄씩 남는다.
+    추적 파일은 최근 trace_retention_days개만 남기고 지운다.
+    """
+
+    def __init__(self, source: str, metrics_dir: Optional[str] = None, trace_retention_days: int = 7):
+        """
+        Args:
+            source: 지표 출처 라벨 (예: "crawl", "search")
+            metrics_dir: 추적 파일(traces-YYYYMMDD.jsonl)과 Prometheus 파일(newshunter.prom)을 둘 디렉터리 (None이면 내보내지 않음)
+            trace_retention_days: 남겨 둘 날짜별 추적 파일 수
+        """
+        self.source = source
+        self.metrics_dir = metrics_dir
+        self.trace_retention_days = trace_retention_days
+        self.started = time.monotonic()
+        self.totals = {
+            "requests": 0,
+            "errors": 0,
+            "bytes": 0,
+            "parse_seconds": 0.0,
+            "pages_parsed": 0,
+            "articles": 0,
+            "sleep_seconds": 0.0,
+            **{f"{phase}_seconds": 0.0 for phase in REQUEST_PHASES}
+        }
+        self._traces: List[str] = []
+        self._lock = threading.Lock()
+
+    def _trace(self, event: str, **fields):
+        if self.metrics_dir:
+            line = json.dumps({"ts": round(time.time(), 3), "source": self.source, "event": event, **fields},
+                              ensure_ascii=False)
+            with self._lock:
+                self._traces.append(line)
+
+    def request(self, host: str, status: int, size: int, timings: Dict[str, float], **fields):
+        """
+        요청 한 건 기록
+
+        Args:
+            host: 요청 호스트
+            status: 응답 코드 (연결 오류면 0)
+            size: 응답 본문 바이트
+            timings: 단계별 소요 시간(초) - REQUEST_PHASES 중 측정한 것만
+            fields: 추적 파일에 함께 남길 값 (oid, date, page 등)
+        """
+        with self._lock:
+            self.totals["requests"] += 1
+            self.totals["errors"] += 1 if status == 0 or status >= 400 else 0
+            self.totals["bytes"] += size
+            for phase, seconds in timings.items():
+                self.totals[f"{phase}_seconds"] += seconds
+
+        _add_total("newshunter_requests_total", 1, source=self.source, status=status)
+        _add_total("newshunter_response_bytes_total", size, source=self.source)
+        for phase, seconds in timings.items():
+            _add_total("newshunter_request_phase_seconds_total", seconds, source=self.source, phase=phase)
+        self._trace("request", host=host, status=status, bytes=size,
+                    **{phase: round(seconds, 4) for phase, seconds in timings.items()}, **fields)
+
+    def parse(self, seconds: float, articles: int, **fields):
+        """페이지 하나의 파싱 시간과 추출한 기사 수 기록"""
+        with self._lock:
+            self.totals["parse_seconds"] += seconds
+            self.totals["pages_parsed"] += 1
+            self.totals["articles"] += articles
+
+        _add_total("newshunter_parse_seconds_total", seconds, source=self.source)
+        _add_total("newshunter_pages_parsed_total", 1, source=self.source)
+        _add_total("newshunter_articles_total", articles, source=self.source)
+        self._trace("parse", seconds=round(seconds, 4), articles=articles, **fields)
+
+    def sleep(self, seconds: float, reason: str):
+        """속도 제한(rate_limit)이나 재시도(backoff)로 기다린 시간 기록"""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.totals["sleep_seconds"] += seconds
+        _add_total("newshunter_sleep_seconds_total", seconds, source=self.source, reason=reason)
+
+    def unit(self, status: str, articles: int, **fields):
+        """수집 단위(신문사, 날짜) 하나의 결과 기록"""
+        _add_total("newshunter_units_total", 1, source=self.source, status=status)
+        self._trace("unit", status=status, articles=articles, **fields)
+
+    def summary(self) -> Dict:
+        """실행 요약 - totals에 경과 시간(elapsed_seconds)을 더한 값"""
+        with self._lock:
+            return dict(self.totals, elapsed_seconds=time.monotonic() - self.started)
+
+    def flush(self):
+        """쌓인 추적 이벤트를 오늘(KST) 추적 파일에 덧붙이고 누적 지표 파일 갱신"""
+        if not self.metrics_dir:
+            return
+        with self._lock:
+            lines, self._traces = self._traces, []
+
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        if lines:
+            trace_name = f"traces-{datetime.now(KST).strftime('%Y%m%d')}.jsonl"
+            with open(os.path.join(self.metrics_dir, trace_name), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self._prune_traces()
+        write_prometheus(os.path.join(self.metrics_dir, "newshunter.prom"))
+
+    def _prune_traces(self):
+        """최근 trace_retention_days개를 넘는 날짜별 추적 파일 삭제"""
+        try:
+            names = sorted(name for name in os.listdir(self.metrics_dir) if TRACE_FILE_PATTERN.match(name))
+        except OSError:
+            return
+        for name in names[:max(len(names) - self.trace_retention_days, 0)]:
+            try:
+                os.remove(os.path.join(self.metrics_dir, name))
+            except OSError:
+                pass
@@ -0,0 +1,141 @@
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from util.atomic_file import atomic_write
+
+KST = timezone(timedelta(hours=9))
+
+
+class PageCache:
+    """신문 게재 기사 목록 페이지의 디스크 캐시
+
+    (oid, 날짜, 페이지) 단위로 응답 본문과 검증용 헤더(ETag, Last-Modified)를 저장한다.
+    발행일이 지난 뒤에 받은 페이지는 바뀌지 않으므로 네트워크 없이 그대로 사용하고,
+    그 전에 받은 페이지(오늘자)는 TTL이 지나면 조건부 요청으로 다시 확인한다.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/pages", ttl: float = 300):
+        """
+        Args:
+            cache_dir: 캐시 저장 디렉터리
+            ttl: 오늘자 페이지를 재확인 없이 사용할 시간(초)
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, oid: str, date: str, page: int) -> str:
+        return os.path.join(self.cache_dir, str(oid), str(date), str(page))
+
+    def get(self, oid: str, date: str, page: int) -> Optional[Tuple[bytes, Dict]]:
+        """
+        캐시된 페이지 조회
+
+        Returns:
+            Optional[Tuple[bytes, Dict]]: (본문, 메타데이터), 없으면 None
+        """
+        path = self._path(oid, date, page)
+        try:
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(path + ".html", "rb") as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        return content, meta
+
+    def is_fresh(self, meta: Dict, date: str) -> bool:
+        """네트워크 확인 없이 사용해도 되는 항목인지 여부"""
+        fetched_at = meta.get("fetched_at", 0)
+
+        # 발행일(KST)이 끝난 뒤에 받은 페이지는 더 이상 바뀌지 않음
+        try:
+            day_end = datetime.strptime(str(date), "%Y%m%d").replace(tzinfo=KST) + timedelta(days=1)
+            if fetched_at >= day_end.timestamp():
+                return True
+        except ValueError:
+            pass
+
+        return time.time() - fetched_at < self.ttl
+
+    def conditional_headers(self, meta: Dict) -> Dict[str, str]:
+        """재확인 요청에 붙일 조건부 헤더"""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def put(self, oid: str, date: str, page: int, content: bytes, headers=None):
+        """
+        페이지 저장
+
+        Args:
+            oid: 신문사 ID
+            date: 발행일 (YYYYMMDD)
+            page: 페이지 번호
+            content: 응답 본문
+            headers: 응답 헤더 (ETag, Last-Modified 보관용)
+        """
+        headers = headers or {}
+        meta = {
+            "fetched_at": time.time(),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified")
+        }
+        path = self._path(oid, date, page)
+        atomic_write(path + ".html", content)
+        atomic_write(path + ".json", json.dumps(meta))
+
+    def touch(self, oid: str, date: str, page: int, meta: Dict):
+        """304 응답을 받은 항목의 확인 시각 갱신"""
+        meta = dict(meta, fetched_at=time.time())
+        atomic_write(self._path(oid, date, page) + ".json", json.dumps(meta))
+
+    def set_fingerprint(self, oid: str, date: str, page: int, fingerprint: str, digests: List[str]):
+        """
+        파싱한 기사 목록의 지문을 메타데이터에 기록 (오늘자 재수집 때 바뀐 페이지 확인용)
+
+        Args:
+            fingerprint: 페이지 전체 지문
+            digests: 기사별 지문 목록
+        """
+        path = self._path(oid, date, page) + ".json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return
+        meta.update(fingerprint=fingerprint, digests=digests)
+        atomic_write(path, json.dumps(meta))
+
+    def fingerprints(self, oid: str, date: str) -> Dict[int, Dict]:
+        """
+        (oid, 날짜)의 페이지별 지문
+
+        Returns:
+            Dict[int, Dict]: {페이지: {"fingerprint": 페이지 지문, "digests": 기사별 지문 목록}}
+        """
+        directory = os.path.join(self.cache_dir, str(oid), str(date))
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return {}
+
+        result = {}
+        for name in names:
+            page, extension = os.path.splitext(name)
+            if extension != ".json" or not page.isdigit():
+                continue
+            try:
+                with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if meta.get("fingerprint"):
+                result[int(page)] = {"fingerprint": meta["fingerprint"], "digests": meta.get("digests", [])}
+        return result
+
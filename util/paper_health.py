@@ -0,0 +1,244 @@
+import json
+import os
+import sqlite3
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 차단기 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS paper_health (
+    oid TEXT PRIMARY KEY,
+    record TEXT NOT NULL
+);
+"""
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 수집을 건너뛴 신문사"""
+
+
+class PaperHealth:
+    """신문사(oid)별 수집 상태 기록과 차단기
+
+    단위 수집 결과(성공 여부, 페이지 응답 시간, 기사 수)를 최근 window개까지 SQLite에 보관한다.
+    연속 실패가 failure_threshold번 쌓이면 차단기를 열어 cooldown초 동안 그 신문사를 건너뛰고,
+    cooldown이 지나면 시험 수집 한 번(half-open)을 허용해 성공하면 닫고 실패하면 다시 연다.
+    이번 실행에서 기록한 결과만 save() 때 최신 기록 위에 다시 적용하므로 여러 세션, 예약 수집,
+    backfill이 동시에 수집해도 서로의 기록을 덮어쓰지 않는다.
+    """
+
+    def __init__(self, path: str = ".cache/paper_health.db", failure_threshold: int = 3,
+                 cooldown: float = 1800, window: int = 20):
+        """
+        Args:
+            path: 상태 기록 파일(SQLite) 경로
+            failure_threshold: 차단기를 여는 연속 실패 횟수
+            cooldown: 차단기를 연 뒤 시험 수집까지 기다릴 시간(초)
+            window: 신문사별로 보관할 최근 결과 수
+        """
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.window = window
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self.records = self._load()
+        # 아직 저장하지 않은 이번 실행의 결과 [(oid, name, success, latencies, article_count, probing)]
+        self._pending = []
+        # 시험 수집 중인 oid - 프로세스가 죽어도 영영 막히지 않도록 저장하지 않음
+        self._probing = set()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """쓰고 나면 닫히는 연결 (자동 커밋 모드)"""
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _load(self, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Dict]:
+        if conn is None:
+            with self._connection() as conn:
+                return self._load(conn)
+        return {oid: json.loads(record) for oid, record in conn.execute("SELECT oid, record FROM paper_health")}
+
+    def save(self):
+        """
+        이번 실행에서 기록한 결과를 저장
+
+        다른 프로세스가 그사이 저장한 기록을 다시 읽어 그 위에 이번 결과만 적용한 뒤(쓰기 트랜잭션 하나),
+        최신 기록으로 메모리 상태를 갱신한다.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            records = self._load(conn)
+            for oid, *result in pending:
+                self._apply(records.setdefault(oid, self._new_record()), *result)
+            conn.executemany(
+                "INSERT INTO paper_health (oid, record) VALUES (?, ?) "
+                "ON CONFLICT (oid) DO UPDATE SET record = excluded.record",
+                [(oid, json.dumps(records[oid], ensure_ascii=False)) for oid in {item[0] for item in pending}]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            with self._lock:
+                self._pending = pending + self._pending
+            raise
+        finally:
+            conn.close()
+
+        with self._lock:
+            # 저장 중에 새로 기록된 결과는 다음 save()에서 반영
+            for oid, *result in self._pending:
+                self._apply(records.setdefault(oid, self._new_record()), *result)
+            self.records = records
+
+    @staticmethod
+    def _new_record() -> Dict:
+        return {
+            "name": "",
+            "outcomes": [],
+            "latencies": [],
+            "article_counts": [],
+            "consecutive_failures": 0,
+            "state": CLOSED,
+            "opened_at": 0
+        }
+
+    def _record(self, oid: str) -> Dict:
+        return self.records.setdefault(oid, self._new_record())
+
+    def state(self, oid: str) -> str:
+        """차단기 상태 - 열린 지 cooldown초가 지났으면 half-open"""
+        record = self.records.get(oid)
+        if record is None or record["state"] == CLOSED:
+            return CLOSED
+        if record["state"] == OPEN and time.time() - record["opened_at"] < self.cooldown:
+            return OPEN
+        return HALF_OPEN
+
+    def allow(self, oid: str) -> bool:
+        """
+        지금 이 신문사를 수집해도 되는지 여부
+
+        half-open 상태에서는 결과가 기록될 때까지 시험 수집 하나만 허용한다.
+        """
+        with self._lock:
+            state = self.state(oid)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and oid not in self._probing:
+                self._probing.add(oid)
+                return True
+            return False
+
+    def release(self, oid: str):
+        """
+        시험 수집을 결과 기록 없이 끝냄 (제한 시간 초과, 취소 등)
+
+        다음 allow()가 다시 시험 수집을 허용한다. record_result로 결과를 기록했으면 이미 풀려 있으므로
+        아무 일도 하지 않는다.
+        """
+        with self._lock:
+            self._probing.discard(oid)
+
+    def record_result(self, oid: str, name: str, success: bool, latencies: Iterable[float] = (),
+                      article_count: Optional[int] = None):
+        """
+        단위 수집 결과 기록
+
+        Args:
+            oid: 신문사 ID
+            name: 신문사명 (표시용)
+            success: 첫 페이지부터 수집에 성공했는지 여부
+            latencies: 이 단위에서 받은 페이지들의 응답 시간(초)
+            article_count: 끝까지 수집한 경우의 기사 수 (중간에 끊겼으면 None)
+        """
+        latencies = [round(value, 3) for value in latencies]
+        with self._lock:
+            probing = oid in self._probing
+            self._probing.discard(oid)
+            result = (name, success, latencies, article_count, probing, time.time())
+            self._apply(self._record(oid), *result)
+            self._pending.append((oid, *result))
+
+    def _apply(self, record: Dict, name: str, success: bool, latencies: List[float],
+               article_count: Optional[int], probing: bool, recorded_at: float):
+        """결과 하나를 기록에 반영"""
+        record["name"] = name or record["name"]
+        record["outcomes"] = (record["outcomes"] + [success])[-self.window:]
+        record["latencies"] = (record["latencies"] + latencies)[-self.window * 5:]
+        if article_count is not None:
+            record["article_counts"] = (record["article_counts"] + [article_count])[-self.window:]
+
+        if success:
+            record["consecutive_failures"] = 0
+            record["state"] = CLOSED
+        else:
+            record["consecutive_failures"] += 1
+            if probing or record["consecutive_failures"] >= self.failure_threshold:
+                record["state"] = OPEN
+                record["opened_at"] = recorded_at
+
+    def priority(self, oid: str) -> Tuple[int, float]:
+        """수집 순서 정렬 키 - 차단기가 닫힌 신문사, 성공률이 높은 신문사 먼저"""
+        state_rank = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}[self.state(oid)]
+        return state_rank, -self.summary(oid)["success_rate"]
+
+    def summary(self, oid: str) -> Dict:
+        """
+        신문사 하나의 상태 요약
+
+        Returns:
+            Dict: name, state, success_rate, median_latency, last_count, norm_count, low_yield
+        """
+        record = self.records.get(oid) or {}
+        outcomes = record.get("outcomes", [])
+        latencies = record.get("latencies", [])
+        counts = record.get("article_counts", [])
+
+        # 최근 기사 수를 이전 기록의 중앙값과 비교 (마크업 변경 등으로 기사가 줄었는지 확인)
+        last_count = counts[-1] if counts else None
+        norm_count = statistics.median(counts[:-1]) if len(counts) > 1 else None
+        low_yield = (
+            last_count is not None and norm_count is not None
+            and len(counts) > 3 and last_count < norm_count * 0.5
+        )
+
+        return {
+            "name": record.get("name", ""),
+            "state": self.state(oid),
+            "success_rate": sum(outcomes) / len(outcomes) if outcomes else 1.0,
+            "median_latency": statistics.median(latencies) if latencies else None,
+            "last_count": last_count,
+            "norm_count": norm_count,
+            "low_yield": low_yield
+        }
+
+    def summaries(self) -> List[Dict]:
+        """전체 신문사 상태 요약 (oid 포함)"""
+        return [dict(self.summary(oid), oid=oid) for oid in sorted(self.records)]
@@ -0,0 +1,156 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, Optional
+
+KST = timezone(timedelta(hours=9))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_usage (
+    day TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    calls INTEGER NOT NULL DEFAULT 0,
+    exhausted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, client_id)
+);
+"""
+
+
+class QuotaExhaustedError(Exception):
+    """오늘 쓸 수 있는 API 호출 할당량이 남지 않음"""
+
+
+class QuotaLedger:
+    """네이버 검색 API 일일 호출 기록 (SQLite)
+
+    (날짜, client_id)별 호출 수를 파일에 기록하므로 여러 세션과 프로세스가 같은 할당량을 나눠 쓴다.
+    호출마다 가장 적게 쓴 키를 골라 한 건을 미리 차감하고(쓰기 트랜잭션 하나),
+    백그라운드 작업은 키마다 interactive_reserve 비율을 남겨 두고 멈춰 화면 검색이 먼저 쓰도록 한다.
+    날짜는 할당량이 초기화되는 KST 자정 기준이다.
+    """
+
+    def __init__(self, db_path: str = ".cache/api_quota.db", daily_limit: int = 25000,
+                 interactive_reserve: float = 0.2):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            daily_limit: 키 하나의 하루 호출 한도
+            interactive_reserve: 백그라운드 작업이 쓰지 않고 화면 검색용으로 남겨 둘 비율 (0~1)
+        """
+        self.db_path = db_path
+        self.daily_limit = daily_limit
+        self.interactive_reserve = interactive_reserve
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 검색 페이지를 여러 스레드에서 동시에 요청하므로 호출마다 연결을 연다
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """쓰고 나면 닫히는 연결 (자동 커밋 모드)"""
+        conn = self._connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(KST).strftime("%Y%m%d")
+
+    def _budget(self, interactive: bool) -> int:
+        if interactive:
+            return self.daily_limit
+        return int(self.daily_limit * (1 - self.interactive_reserve))
+
+    def acquire(self, client_ids: Iterable[str], interactive: bool = True) -> Optional[str]:
+        """
+        오늘 가장 적게 쓴 키를 골라 호출 한 건 차감
+
+        Args:
+            client_ids: 사용할 수 있는 키 목록
+            interactive: 화면 검색이면 True (남겨 둔 몫까지 사용)
+
+        Returns:
+            Optional[str]: 차감한 client_id, 남은 키가 없으면 None
+        """
+        client_ids = list(client_ids)
+        if not client_ids:
+            return None
+        day = self.today()
+        budget = self._budget(interactive)
+
+        conn = self._connect()
+        try:
+            # 여러 프로세스가 같은 키를 동시에 고르지 않도록 읽기부터 쓰기 잠금
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"SELECT client_id, calls, exhausted FROM api_usage WHERE day = ? "
+                f"AND client_id IN ({', '.join('?' * len(client_ids))})",
+                [day, *client_ids]
+            ).fetchall()
+            usage = {client_id: 0 for client_id in client_ids}
+            for row in rows:
+                usage[row["client_id"]] = budget if row["exhausted"] else row["calls"]
+
+            client_id = min(client_ids, key=lambda candidate: usage[candidate])
+            if usage[client_id] >= budget:
+                conn.execute("ROLLBACK")
+                return None
+
+            conn.execute(
+                "INSERT INTO api_usage (day, client_id, calls) VALUES (?, ?, 1) "
+                "ON CONFLICT (day, client_id) DO UPDATE SET calls = calls + 1",
+                (day, client_id)
+            )
+            conn.execute("COMMIT")
+            return client_id
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def mark_exhausted(self, client_id: str):
+        """API가 한도 초과로 거절한 키를 오늘은 더 쓰지 않도록 기록"""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO api_usage (day, client_id, calls, exhausted) VALUES (?, ?, 0, 1) "
+                "ON CONFLICT (day, client_id) DO UPDATE SET exhausted = 1",
+                (self.today(), client_id)
+            )
+
+    def remaining(self, client_ids: Iterable[str], interactive: bool = True) -> int:
+        """오늘 남은 호출 수 합계"""
+        usage = self.usage()
+        budget = self._budget(interactive)
+        remaining = 0
+        for client_id in client_ids:
+            record = usage.get(client_id, {"calls": 0, "exhausted": False})
+            if not record["exhausted"]:
+                remaining += max(budget - record["calls"], 0)
+        return remaining
+
+    def usage(self, day: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        키별 호출 기록
+
+        Returns:
+            Dict[str, Dict]: {client_id: {"calls": 호출 수, "exhausted": 한도 초과 응답을 받았는지}}
+        """
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT client_id, calls, exhausted FROM api_usage WHERE day = ?", (day or self.today(),)
+            ).fetchall()
+        return {row["client_id"]: {"calls": row["calls"], "exhausted": bool(row["exhausted"])} for row in rows}
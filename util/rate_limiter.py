@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class AdaptiveRateLimiter:
+    """호스트별 적응형(AIMD) 토큰 버킷
+
+    응답이 건강하면 초당 요청 수를 조금씩 올리고(가산 증가),
+    429/5xx 응답이나 느린 응답이 오면 크게 줄인다(곱셈 감소).
+    기다리는 요청은 자기 차례(번호표)만 받아 두고 현재 속도로 남은 시간을 다시 계산하므로
+    여러 요청이 한꺼번에 줄을 서도 기다리는 동안 바뀐 속도를 따른다.
+    스레드와 asyncio 코드에서 함께 사용할 수 있다.
+    """
+
+    def __init__(self,
+                 initial_rate: float = 2.0,
+                 min_rate: float = 0.5,
+                 max_rate: float = 20.0,
+                 increase_step: float = 1.0,
+                 decrease_factor: float = 0.5,
+                 slow_threshold: float = 2.0,
+                 burst: float = 1.0):
+        """
+        Args:
+            initial_rate: 시작 속도 (초당 요청 수)
+            min_rate: 최저 속도
+            max_rate: 최고 속도
+            increase_step: 건강한 응답이 이어질 때 1초에 올리는 속도
+            decrease_factor: 과부하 신호를 받았을 때 속도에 곱하는 값
+            slow_threshold: 이 시간(초)보다 오래 걸린 응답은 과부하 신호로 취급
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(initial_rate, self.min_rate), self.max_rate)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_threshold = slow_threshold
+        self.burst = burst
+
+        self.tokens = burst
+        # 지금까지 채워진 토큰 누계 - 번호표가 이 값에 닿으면 요청을 보냄
+        self.refilled = 0.0
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    # 기다리는 요청이 속도 변화를 다시 확인하는 최대 간격(초)
+    RECHECK_INTERVAL = 0.25
+
+    def _refill(self, now: float):
+        """마지막 갱신 이후 현재 속도로 채워진 토큰 반영 (잠금 안에서 호출)"""
+        added = (now - self.updated_at) * self.rate
+        self.refilled += added
+        self.tokens = min(self.burst, self.tokens + added)
+        self.updated_at = now
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 번호표(이 값까지 토큰이 채워지면 차례)를 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            return self.refilled + max(-self.tokens, 0.0)
+
+    def _wait_time(self, ticket: float) -> float:
+        """번호표 차례까지 남은 시간(초) - 현재 속도 기준"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return max((ticket - self.refilled) / self.rate, self.blocked_until - now, 0.0)
+
+    def acquire(self) -> float:
+        """요청 한 건을 보낼 수 있을 때까지 대기 (대기한 시간 반환)"""
+        ticket = self._reserve()
+        started = time.monotonic()
+        wait = self._wait_time(ticket)
+        while wait > 0:
+            time.sleep(min(wait, self.RECHECK_INTERVAL))
+            wait = self._wait_time(ticket)
+        return time.monotonic() - started
+
+    async def acquire_async(self) -> float:
+        """acquire의 asyncio 버전"""
+        ticket = self._reserve()
+        started = time.monotonic()
+        wait = self._wait_time(ticket)
+        while wait > 0:
+            await asyncio.sleep(min(wait, self.RECHECK_INTERVAL))
+            wait = self._wait_time(ticket)
+        return time.monotonic() - started
+
+    def record(self, status_code: int, latency: float, retry_after: Optional[str] = None):
+        """
+        응답 결과를 반영해 속도 조절
+
+        Args:
+            status_code: HTTP 상태 코드
+            latency: 응답까지 걸린 시간(초)
+            retry_after: Retry-After 헤더 값 (있을 때만)
+        """
+        if status_code == 429 or status_code >= 500 or latency > self.slow_threshold:
+            self._decrease(retry_after)
+        else:
+            self._increase()
+
+    def record_error(self):
+        """연결 오류/타임아웃 반영"""
+        self._decrease()
+
+    def _increase(self):
+        with self._lock:
+            # 지금까지는 이전 속도로 채우고 이후부터 새 속도 적용
+            self._refill(time.monotonic())
+            # 응답마다 step/rate 만큼 올려 1초에 약 step 만큼 증가
+            self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+
+    def _decrease(self, retry_after: Optional[str] = None):
+        with self._lock:
+            now = time.monotonic()
+
+            # 동시에 돌아온 실패 응답들로 여러 번 깎이지 않도록 1초에 한 번만 감소
+            if now - self.last_decrease >= 1.0:
+                self._refill(now)
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self.last_decrease = now
+
+            if retry_after:
+                try:
+                    self.blocked_until = max(self.blocked_until, now + float(retry_after))
+                except ValueError:
+                    pass
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str, **settings) -> AdaptiveRateLimiter:
+    """
+    프로세스 전체에서 공유하는 호스트별 속도 제한기 반환
+
+    Args:
+        host: 호스트 이름 (예: news.naver.com)
+        **settings: 처음 만들 때 AdaptiveRateLimiter에 넘길 설정
+
+    Returns:
+        AdaptiveRateLimiter: 해당 호스트의 속도 제한기
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(**settings)
+            _limiters[host] = limiter
+        return limiter
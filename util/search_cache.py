@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from util.atomic_file import atomic_write
+
+
+class SearchCache:
+    """네이버 검색 응답의 2단계 캐시 (메모리 LRU + 디스크)
+
+    (출처, 주소, 검색어, start, display, sort) 단위로 응답(API items 또는 검색 페이지 HTML)을 보관한다.
+    항목마다 저장할 때 정한 TTL이 지나면 버린다.
+    메모리에 없으면 디스크에서 찾아 메모리로 올린다. 여러 스레드에서 함께 사용할 수 있다.
+
+    디스크 파일의 수정 시각은 만료 시각으로 맞춰 둔다. 읽을 때 만료된 파일은 지우고,
+    SWEEP_INTERVAL초마다 저장하면서 디렉터리를 훑어 만료된 파일과 disk_size개를 넘는 파일
+    (만료가 가까운 것부터)을 지운다.
+    """
+
+    # 디스크 캐시 정리 간격(초)
+    SWEEP_INTERVAL = 600
+
+    def __init__(self, cache_dir: Optional[str] = ".cache/search", memory_size: int = 512,
+                 disk_size: int = 5000):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉터리 (None이면 메모리만 사용)
+            memory_size: 메모리에 보관할 최대 항목 수
+            disk_size: 디스크에 보관할 최대 항목 수
+        """
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._swept_at = 0.0
+        self.counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """캐시 키 - 예: make_key("api", 주소, 검색어, start, display, sort)"""
+        text = json.dumps(parts, ensure_ascii=False)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 응답 조회
+
+        Returns:
+            Optional[Any]: 저장한 값, 없거나 만료됐으면 None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.counts["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    record = json.load(f)
+                if record["expires_at"] > now:
+                    self._remember(key, record["expires_at"], record["value"])
+                    with self._lock:
+                        self.counts["disk_hits"] += 1
+                    return record["value"]
+                self._remove(self._path(key))
+            except (OSError, ValueError, KeyError):
+                pass
+
+        with self._lock:
+            self.counts["misses"] += 1
+        return None
+
+    def put(self, key: str, value: Any, ttl: float):
+        """
+        응답 저장
+
+        Args:
+            key: make_key로 만든 키
+            value: JSON으로 저장할 수 있는 값
+            ttl: 보관 시간(초)
+        """
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        self._remember(key, expires_at, value)
+
+        if self.cache_dir:
+            path = self._path(key)
+            atomic_write(path, json.dumps({"expires_at": expires_at, "value": value}, ensure_ascii=False))
+            # 정리할 때 파일을 열지 않고 만료 시각을 알 수 있도록 수정 시각에 기록
+            try:
+                os.utime(path, (expires_at, expires_at))
+            except OSError:
+                pass
+            self._sweep_if_due()
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _sweep_if_due(self):
+        now = time.time()
+        with self._lock:
+            if now - self._swept_at < self.SWEEP_INTERVAL:
+                return
+            self._swept_at = now
+        self.sweep()
+
+    def sweep(self) -> int:
+        """
+        디스크 캐시 정리 - 만료된 파일과 disk_size개를 넘는 파일(만료가 가까운 것부터) 삭제
+
+        Returns:
+            int: 지운 파일 수
+        """
+        if not self.cache_dir:
+            return 0
+        now = time.time()
+        entries = []
+        try:
+            shards = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return 0
+        for shard in shards:
+            try:
+                for entry in os.scandir(shard):
+                    if entry.name.endswith(".json"):
+                        entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+
+        entries.sort()
+        expired = sum(1 for expires_at, _ in entries if expires_at <= now)
+        removed = entries[:max(expired, len(entries) - self.disk_size)]
+        for _, path in removed:
+            self._remove(path)
+        return len(removed)
+
+    def _remember(self, key: str, expires_at: float, value: Any):
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """적중/실패 횟수와 메모리 항목 수"""
+        with self._lock:
+            return dict(self.counts, memory_entries=len(self._memory))
+
+
+_caches: Dict[Tuple[Optional[str], int, int], SearchCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_search_cache(cache_dir: Optional[str] = ".cache/search", memory_size: int = 512,
+                     disk_size: int = 5000) -> SearchCache:
+    """프로세스 전체에서 공유하는 검색 캐시 반환 (같은 디렉터리면 같은 객체)"""
+    with _caches_lock:
+        key = (cache_dir, memory_size, disk_size)
+        if key not in _caches:
+            _caches[key] = SearchCache(cache_dir, memory_size, disk_size)
+        return _caches[key]